@@ -6,7 +6,7 @@
 #######################################################
 import tkinter as tk
 from PIL import ImageTk, Image, ImageOps 
-from queue import PriorityQueue
+import heapq
 
 
 ######################################################
@@ -103,14 +103,22 @@ class MazeGame:
     #### A* Algorithm
     ############################################################
     def find_path(self):
-        open_set = PriorityQueue()
+        #### Binary heap open set (no locking) plus a closed set of expanded cells
+        open_set = []
+        closed_set = set()
         
         #### Add the start state to the queue
-        open_set.put((0, self.agent_pos))
+        heapq.heappush(open_set, (0, self.agent_pos))
 
         #### Continue exploring until the queue is exhausted
-        while not open_set.empty():
-            current_cost, current_pos = open_set.get()
+        while open_set:
+            current_cost, current_pos = heapq.heappop(open_set)
+
+            #### Skip stale copies of cells that were already expanded
+            if current_pos in closed_set:
+                continue
+            closed_set.add(current_pos)
+
             current_cell = self.cells[current_pos[0]][current_pos[1]]
 
             #### Stop if goal is reached
@@ -123,7 +131,7 @@ class MazeGame:
             for dx, dy in [(0, 1), (0, -1), (1, 0), (-1, 0)]:
                 new_pos = (current_pos[0] + dx, current_pos[1] + dy)
 
-                if 0 <= new_pos[0] < self.rows and 0 <= new_pos[1] < self.cols and not self.cells[new_pos[0]][new_pos[1]].is_wall:
+                if 0 <= new_pos[0] < self.rows and 0 <= new_pos[1] < self.cols and not self.cells[new_pos[0]][new_pos[1]].is_wall and new_pos not in closed_set:
                 
                     #### The cost of moving to a new position is 1 unit
                     new_g = current_cell.g + 1
@@ -141,7 +149,7 @@ class MazeGame:
                         self.cells[new_pos[0]][new_pos[1]].parent = current_cell
                         
                         #### Add the new cell to the priority queue
-                        open_set.put((self.cells[new_pos[0]][new_pos[1]].f, new_pos))
+                        heapq.heappush(open_set, (self.cells[new_pos[0]][new_pos[1]].f, new_pos))
                         
                         
 
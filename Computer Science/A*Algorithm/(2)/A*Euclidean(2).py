@@ -6,7 +6,7 @@
 #######################################################
 import tkinter as tk
 from PIL import ImageTk, Image, ImageOps 
-from queue import PriorityQueue
+import heapq
 
 
 ######################################################
@@ -96,14 +96,24 @@ class MazeGame:
     #### A* Algorithm
     ############################################################
     def find_path(self):
-        open_set = PriorityQueue()
+        #### Binary heap open set (no locking) plus a closed set of expanded cells.
+        #### The rounded Euclidean h() with unit-cost diagonals can overestimate,
+        #### so a closed cell is reopened when a cheaper path to it is found.
+        open_set = []
+        closed_set = set()
         
         #### Add the start state to the queue
-        open_set.put((0, self.agent_pos))
+        heapq.heappush(open_set, (0, self.agent_pos))
 
         #### Continue exploring until the queue is exhausted
-        while not open_set.empty():
-            current_cost, current_pos = open_set.get()
+        while open_set:
+            current_cost, current_pos = heapq.heappop(open_set)
+
+            #### Skip stale copies of cells that were already expanded
+            if current_pos in closed_set:
+                continue
+            closed_set.add(current_pos)
+
             current_cell = self.cells[current_pos[0]][current_pos[1]]
 
             #### Stop if goal is reached
@@ -133,8 +143,11 @@ class MazeGame:
                         self.cells[new_pos[0]][new_pos[1]].f = new_g + self.cells[new_pos[0]][new_pos[1]].h
                         self.cells[new_pos[0]][new_pos[1]].parent = current_cell
                         
+                        #### Reopen the cell if it was already expanded
+                        closed_set.discard(new_pos)
+
                         #### Add the new cell to the priority queue
-                        open_set.put((self.cells[new_pos[0]][new_pos[1]].f, new_pos))
+                        heapq.heappush(open_set, (self.cells[new_pos[0]][new_pos[1]].f, new_pos))
                         
                         
 
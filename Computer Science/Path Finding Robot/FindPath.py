@@ -1,555 +1,385 @@
-#######################################################
-#### Adam Syed and Teagan Clark
-#### 11/24/25
-#### Purpose: Create a path finding robot to navigate through multiple
-#### hospital wards, using A* and Dijkstra to find the optimum path.
-#######################################################
-import tkinter as tk
-from queue import PriorityQueue
-
-
-######################################################
-#### A cell stores f(), g() and h() values
-#### A cell is either open or part of a wall
-######################################################
-
-class Cell:
-    #### Initially, all maze cells have g() = inf and h() = 0
-    def __init__(self, x, y, is_wall=False):
-        self.x = x
-        self.y = y
-        self.is_wall = is_wall
-        self.g = float("inf")
-        self.h = 0
-        self.f = float("inf")
-        self.parent = None
-
-    #### Compare two cells based on their evaluation functions
-    def __lt__(self, other):
-        return self.f < other.f
-
-
-######################################################
-# A maze is a grid of size rows X cols
-######################################################
-class MazeGame:
-    def __init__(self, root, maze, input_filename):
-        self.input_filename = input_filename
-        self.root = root
-        self.maze = maze
-        
-        self.rows = len(maze)
-        self.cols = len(maze[0])
-
-        self.path_colors = ['green', 'skyblue', 'orange', 'purple', 'yellow', 'pink']
-        self.animation_delay = 100
-
-        self.total_goals = 0
-        self.completed_goals = 0
-
-        # Priority by ward code (2–13)
-        self.ward_priority = {
-            2: 1,   # admissions
-            3: 2,   # general
-            4: 5,   # emergency
-            5: 4,   # maternity
-            6: 4,   # surgical
-            7: 5,   # oncology
-            8: 5,   # ICU
-            9: 1,   # isolation
-            10: 3,  # pediatric
-            11: 5,  # burn ward
-            12: 3,  # hematology
-            13: 2   # medical ward
-        }
-
-        # Map ward *names* to the numeric codes used in the maze
-        self.ward_codes = {
-            "ADMISSIONS": 2,
-            "GENERAL": 3,
-            "GENERAL WARD": 3,
-            "EMERGENCY": 4,
-            "ER": 4,
-            "MATERNITY": 5,
-            "MATERNITY WARD": 5,
-            "SURGICAL": 6,
-            "SURGICAL WARD": 6,
-            "ONCOLOGY": 7,
-            "ICU": 8,
-            "ISOLATION": 9,
-            "ISOLATION WARD": 9,
-            "PEDIATRIC": 10,
-            "PEDIATRIC WARD": 10,
-            "BURN": 11,
-            "BURN WARD": 11,
-            "HEMATOLOGY": 12,
-            "MEDICAL": 13,
-            "MEDICAL WARD": 13
-        }
-
-        # Explicit ward → list of (row, col) locations
-        self.ward_locations = {
-            2:  [(6, 27), (7, 28), (10, 28), (13, 28), (20, 10), (20, 11)],           # admissions (Multiple drop-offs)
-            3:  [(6, 6), (6, 7), (7, 5), (7, 18), (12, 7), (13, 7), (16, 14)],       # general
-            4:  [(7, 22), (8, 21), (11, 21), (12, 15), (13, 19), (14, 15), (14, 19)],# emergency
-            5:  [(5, 6), (5, 7), (6, 4)],                                            # maternity
-            6:  [(20, 19), (21, 18), (24, 18), (25, 21)],                            # surgical
-            7:  [(14, 7), (17, 6), (17, 17), (20, 6), (21, 21), (22, 5), (24, 4)],   # oncology
-            8:  [(15, 21), (18, 22)],                                                # ICU
-            9:  [(8, 4), (10, 5), (11, 19), (17, 15), (24, 2)],                      # isolation
-            10: [(22, 16), (23, 9), (25, 9)],                                        # pediatric
-            11: [(13, 10), (18, 10)],                                                 # burn ward
-            12: [(21, 13)],                                                          # hematology
-            13: [(25, 20), (25, 22)]                                                 # medical ward
-        }
-
-        # Default start state (will be overwritten if input file provides Start:)
-        self.agent_pos = (8, 3)
-
-        self.path_index = 0
-
-        # --- Read algorithm + start ward + goal ward names from input file ---
-        with open(self.input_filename, "r") as f:
-            # First line is the algorithm name (we read it, but currently only use A*)
-            self.algorithm = f.readline().strip()
-            
-            if self.algorithm.lower() == "dijkstra":
-                print("\n" + "#" * 50)
-                print("#### NOW RUNNING: Dijkstra")
-                print("#" * 50 + "\n")
-            elif self.algorithm.lower() == "a*":
-                print("\n" + "#" * 50)
-                print("#### NOW RUNNING: A*")
-                print("#" * 50 + "\n")
-            else:
-                print("Invalid algorithm, defaulting to A*")
-
-            goal_positions = []
-            for line in f:
-                line = line.strip()
-                if not line:
-                    continue
-                        
-                # Handle start line: "Start: Admissions"
-                if line.lower().startswith("start:"):
-                    start_name = line.split(":", 1)[1].strip().upper()
-                    if start_name not in self.ward_codes:
-                        print(f"WARNING: Unknown start ward name in input file: '{line}' – using default start {self.agent_pos}")
-                        continue
-
-                    start_code = self.ward_codes[start_name]
-                    locs = self.ward_locations.get(start_code, [])
-                    if not locs:
-                        print(f"WARNING: No locations mapped for start ward '{start_name}' – using default start {self.agent_pos}")
-                        continue
-
-                    # Use the first defined location for that start ward
-                    self.agent_pos = locs[0]
-                    print(f"Start location set to ward '{start_name}' at {self.agent_pos}")
-                    continue
-
-                # Otherwise, treat it as a delivery ward name
-                ward_name = line.upper()
-                if ward_name not in self.ward_codes:
-                    print(f"WARNING: Unknown ward name in input file: '{line}' – skipping.")
-                    continue
-
-                ward_code = self.ward_codes[ward_name]
-                priority = self.ward_priority.get(ward_code, 1)
-                locs = self.ward_locations.get(ward_code, [])
-
-                if not locs:
-                    print(f"WARNING: No locations mapped for ward '{ward_name}' – skipping.")
-                    continue
-
-                # If ward has multiple drop-offs, pick the nearest one to the current agent position
-                best_loc = min(
-                    locs,
-                    key=lambda pos: abs(pos[0] - self.agent_pos[0]) + abs(pos[1] - self.agent_pos[1])
-                )
-
-                goal_positions.append((best_loc[0], best_loc[1], priority, ward_name))              
-
-        # Sort by priority (high first)
-        self.goal_positions = sorted(goal_positions, key=lambda x: x[2], reverse=True)
-
-        self.goal_pos = (self.rows - 1, self.cols - 1)
-        
-        self.cells = [[Cell(x, y, maze[x][y] == 1) for y in range(self.cols)]
-                      for x in range(self.rows)]
-        
-        #### Start state's initial values for f(n) = g(n) + h(n) 
-        self.cells[self.agent_pos[0]][self.agent_pos[1]].g = 0
-        self.cells[self.agent_pos[0]][self.agent_pos[1]].h = self.heuristic(self.agent_pos)
-        self.cells[self.agent_pos[0]][self.agent_pos[1]].f = self.heuristic(self.agent_pos)
-
-        #### The maze cell size in pixels
-        self.cell_size = 25
-        self.canvas = tk.Canvas(
-            root,
-            width=self.cols * self.cell_size,
-            height=self.rows * self.cell_size,
-            bg='white'
-        )
-        self.canvas.pack()
-
-        self.total_goals = len(self.goal_positions)
-
-        self.draw_maze()
-        
-        #### Display the optimum path in the maze (multi-goal)
-        self.find_path()
-
-        self.terminate_program()
-
-    ############################################################
-    #### This is for the GUI part. No need to modify this unless
-    #### GUI changes are needed.
-    ############################################################
-    def draw_maze(self):
-        for x in range(self.rows):
-            for y in range(self.cols):
-
-                v = self.maze[x][y]
-                if v == 1:  # walls
-                    color = 'black'
-                elif v == 0:  # floor
-                    color = 'white'
-                elif v == 2:  # admissions
-                    color = 'grey'
-                elif v == 3:  # general
-                    color = 'red'
-                elif v == 4:  # emergency
-                    color = 'yellow'
-                elif v == 5:  # maternity ward
-                    color = 'blue'
-                elif v == 6:  # surgical ward
-                    color = 'maroon'
-                elif v == 7:  # oncology
-                    color = 'green'
-                elif v == 8:  # ICU
-                    color = 'orange'
-                elif v == 9:  # isolation ward
-                    color = 'lightskyblue1'
-                elif v == 10:  # pediatric
-                    color = 'olivedrab1'
-                elif v == 11:  # burn ward
-                    color = 'purple'
-                elif v == 12:  # hematology
-                    color = 'orangered2'
-                elif v == 13:  # medical ward
-                    color = 'lawngreen'
-                else:
-                    color = 'white'
-
-                self.canvas.create_rectangle(
-                    y * self.cell_size, x * self.cell_size,
-                    (y + 1) * self.cell_size, (x + 1) * self.cell_size,
-                    fill=color, tags=f"cell_{x}_{y}"
-                )
-                if not self.cells[x][y].is_wall:
-                    text = f'g={self.cells[x][y].g}\nh={self.cells[x][y].h}'
-                    self.canvas.create_text(
-                        (y + 0.5) * self.cell_size,
-                        (x + 0.5) * self.cell_size,
-                        font=("Purisa", 8),
-                        tags=f"text_{x}_{y}"
-                    )
-
-        # Mark the initial start cell (where the agent currently is)
-        start_x, start_y = self.agent_pos
-        self.canvas.create_rectangle(
-            start_y * self.cell_size, start_x * self.cell_size,
-            (start_y + 1) * self.cell_size, (start_x + 1) * self.cell_size,
-            fill='lime green', tags=f"cell_{start_x}_{start_y}"
-        )
-        self.canvas.create_text(
-            (start_y + 0.5) * self.cell_size,
-            (start_x + 0.5) * self.cell_size,
-            text='START',
-            font=("Purisa", 8, "bold"),
-            tags=f"text_{start_x}_{start_y}"
-        )
-        
-        # Mark all goal positions (as targets will change)
-        for r, c, _, _ in self.goal_positions:
-            self.canvas.create_rectangle(
-                c * self.cell_size, r * self.cell_size,
-                (c + 1) * self.cell_size, (r + 1) * self.cell_size,
-                fill='firebrick', tags=f"goal_cell_{r}_{c}"
-            )
-            self.canvas.create_text(
-                (c + 0.5) * self.cell_size,
-                (r + 0.5) * self.cell_size,
-                text='GOAL',
-                font=("Purisa", 8, "bold"),
-                fill='white',
-                tags=f"goal_text_{r}_{c}"
-            )
-        
-        self.canvas.create_rectangle(
-            self.agent_pos[1] * self.cell_size, self.agent_pos[0] * self.cell_size, 
-            (self.agent_pos[1] + 1) * self.cell_size, (self.agent_pos[0] + 1) * self.cell_size, 
-            fill='navy', tags="agent"
-        )            
-
-    ############################################################
-    #### Manhattan distance
-    ############################################################
-    def heuristic(self, pos):
-        return abs(pos[0] - self.goal_pos[0]) + abs(pos[1] - self.goal_pos[1])
-
-    ############################################################
-    #### Reset costs function
-    ############################################################
-    def reset_costs(self):
-        for row in self.cells:
-            for cell in row:
-                cell.g = float("inf")
-                cell.h = 0
-                cell.f = float("inf")
-                cell.parent = None
-        start_cell = self.cells[self.agent_pos[0]][self.agent_pos[1]]
-        start_cell.g = 0
-        start_cell.h = self.heuristic(self.agent_pos)
-        start_cell.f = start_cell.g + start_cell.h
-
-    ############################################################
-    #### A* Algorithm (multi-goal, sequential by priority)
-    ############################################################
-    def find_path(self):
-        for goal_index, (xn, yn, priority, ward_name) in enumerate(self.goal_positions):
-            print(f"Routing to {ward_name} at ({xn}, {yn}) with priority {priority} (Goal {goal_index+1})")
-            self.goal_pos = (xn, yn)  # sets current goal trying to reach
-            self.reset_costs()        # resets path costs (g, h, and f)
-            open_set = PriorityQueue()
-            
-            #### Add the start state to the queue
-            open_set.put((0, self.agent_pos))
-
-            #### Continue exploring until the queue is exhausted
-            while not open_set.empty():
-                current_cost, current_pos = open_set.get()
-                current_cell = self.cells[current_pos[0]][current_pos[1]]
-
-                #### Stop if goal is reached
-                if current_pos == self.goal_pos:
-                    self.reconstruct_path()
-                    self.agent_pos = self.goal_pos
-
-                    self.canvas.delete("agent")
-                    self.canvas.create_rectangle(
-                        self.agent_pos[1] * self.cell_size, self.agent_pos[0] * self.cell_size, 
-                        (self.agent_pos[1] + 1) * self.cell_size, (self.agent_pos[0] + 1) * self.cell_size, 
-                        fill='navy', tags="agent"
-                    )
-
-                    self.completed_goals += 1 #increment completed goals
-
-                    self.root.update()
-                    self.root.after(500)  # small delay for visualization
-                    break
-
-                #### Agent goes E, W, N, and S, whenever possible
-                for dx, dy in [(0, 1), (0, -1), (1, 0), (-1, 0)]:
-                    new_pos = (current_pos[0] + dx, current_pos[1] + dy)
-
-                    if 0 <= new_pos[0] < self.rows and 0 <= new_pos[1] < self.cols and not self.cells[new_pos[0]][new_pos[1]].is_wall:
-                        #### The cost of moving to a new position is 1 unit
-
-                        if self.algorithm.lower() == "a*":
-                            new_g = current_cell.g + 1
-                        else:
-                            new_g = current_cell.g
-                        
-                        if new_g < self.cells[new_pos[0]][new_pos[1]].g:
-                            ### Update the path cost g()
-                            self.cells[new_pos[0]][new_pos[1]].g = new_g
-                            
-                            ### Update the heuristic h()
-                            self.cells[new_pos[0]][new_pos[1]].h = self.heuristic(new_pos)
-                            
-                            ### Update the evaluation function f(n) = g(n) + h(n)
-                            self.cells[new_pos[0]][new_pos[1]].f = new_g + self.cells[new_pos[0]][new_pos[1]].h
-                            self.cells[new_pos[0]][new_pos[1]].parent = current_cell
-                            
-                            #### Add the new cell to the priority queue
-                            open_set.put((self.cells[new_pos[0]][new_pos[1]].f, new_pos))
-            else:
-                print(f"ERROR: Unable to reach {ward_name} (Goal {goal_index+1}) at ({xn}, {yn}) with priority {priority}. Goal skipped.") 
-                continue
-
-    ############################################################
-    #### Reconstruct path for the current goal (Animated)
-    ############################################################
-    def reconstruct_path(self):
-        # Get path color for this trip
-        path_color = self.path_colors[self.path_index % len(self.path_colors)]
-        self.path_index += 1
-        
-        # Traverse from goal back to start to get the path
-        path = []
-        current_cell = self.cells[self.goal_pos[0]][self.goal_pos[1]]
-        while current_cell.parent:
-            path.append(current_cell)
-            current_cell = current_cell.parent
-        
-        path.reverse() 
-        
-        # Animate the path one step at a time
-        for cell in path:
-            x, y = cell.x, cell.y
-            
-            # Update the cell's background color
-            self.canvas.create_rectangle(
-                y * self.cell_size, x * self.cell_size,
-                (y + 1) * self.cell_size, (x + 1) * self.cell_size,
-                fill=path_color, tags=f"cell_{x}_{y}"
-            )
-            
-            # Update the g/h cost text on the cell
-            text = f'g={cell.g}\nh={cell.h}'
-            self.canvas.delete(f"text_{x}_{y}")
-            self.canvas.create_text(
-                (y + 0.5) * self.cell_size,
-                (x + 0.5) * self.cell_size,
-                text=text,
-                font=("Purisa", 8),
-                tags=f"text_{x}_{y}"
-            )
-            
-            # Animate the agent moving to this cell
-            self.canvas.delete("agent")
-            self.canvas.create_rectangle(
-                y * self.cell_size, x * self.cell_size, 
-                (y + 1) * self.cell_size, (x + 1) * self.cell_size, 
-                fill='navy', tags="agent"
-            )
-            
-            # Wait for the animation delay
-            self.root.update()
-            self.root.after(self.animation_delay)
-
-    ############################################################
-    #### Program Termination Conditions Checker
-    ############################################################
-    def terminate_program(self):
-        
-        # All requests completed (SUCCESS)
-        if self.completed_goals == self.total_goals and self.total_goals > 0:
-            print("\n" + "#" * 50)
-            print("#### PROGRAM TERMINATION: SUCCESS (All Tasks Completed)")
-            print(f"#### All {self.completed_goals} delivery requests were successfully completed.")
-            print("#" * 50)
-        
-        # Some requests completed (SUCCESS with caveats)
-        elif 0 < self.completed_goals < self.total_goals:
-            print("\n" + "#" * 50)
-            print("#### PROGRAM TERMINATION: SUCCESS (Partial Completion)")
-            print(f"#### {self.completed_goals} out of {self.total_goals} requests were successfully completed.")
-            print("#### The map shows the completed optimum paths.")
-            print("#" * 50)
-            
-        # No tasks completed (FAILURE)
-        elif self.completed_goals == 0 and self.total_goals > 0:
-            print("\n" + "#" * 50)
-            print("#### PROGRAM TERMINATION: FAILURE (Blocked Paths)")
-            print("#### WARNING: The robot was not able to complete any of its tasks.")
-            print(f"#### All {self.total_goals} delivery paths were blocked. Please check the maze input.")
-            print("#" * 50)
-        
-        # No goals were loaded from the input file
-        else:
-            print("\n" + "#" * 50)
-            print("#### PROGRAM TERMINATION: No Goals Defined")
-            print("#### No delivery requests were found in the input file.")
-            print("#" * 50)        
-
-    ############################################################
-    #### Move agent manually with arrow keys (optional)
-    ############################################################
-    def move_agent(self, event):
-        r, c = self.agent_pos
-
-        #### Move right, if possible
-        if event.keysym == 'Right' and c + 1 < self.cols and not self.cells[r][c + 1].is_wall:
-            self.agent_pos = (r, c + 1)
-
-        #### Move Left, if possible            
-        elif event.keysym == 'Left' and c - 1 >= 0 and not self.cells[r][c - 1].is_wall:
-            self.agent_pos = (r, c - 1)
-        
-        #### Move Down, if possible
-        elif event.keysym == 'Down' and r + 1 < self.rows and not self.cells[r + 1][c].is_wall:
-            self.agent_pos = (r + 1, c)
-   
-        #### Move Up, if possible   
-        elif event.keysym == 'Up' and r - 1 >= 0 and not self.cells[r - 1][c].is_wall:
-            self.agent_pos = (r - 1, c)
-
-        #### Erase agent from the previous cell at time t
-        self.canvas.delete("agent")
-
-        ### Redraw the agent in color navy in the new cell position at time t+1
-        self.canvas.create_rectangle(
-            self.agent_pos[1] * self.cell_size, self.agent_pos[0] * self.cell_size, 
-            (self.agent_pos[1] + 1) * self.cell_size, (self.agent_pos[0] + 1) * self.cell_size, 
-            fill='navy', tags="agent"
-        )
-
-
-############################################################
-#### Maze definition
-############################################################
-maze = [
-    [0, 0, 1, 1, 1, 1, 1, 1, 1, 1, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0],
-    [0, 0, 1, 5, 5, 5, 5, 5, 5, 1, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0],
-    [0, 0, 1, 5, 5, 5, 5, 5, 5, 1, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0],
-    [0, 0, 1, 5, 5, 5, 5, 5, 5, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0],
-    [0, 0, 1, 5, 5, 5, 5, 5, 5, 1, 3, 3, 3, 3, 3, 3, 3, 3, 3, 1, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0],
-    [0, 0, 1, 5, 5, 5, 5, 5, 5, 1, 3, 3, 3, 3, 3, 3, 3, 3, 3, 1, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0],
-    [1, 1, 1, 1, 5, 1, 3, 3, 1, 1, 3, 3, 3, 3, 3, 3, 3, 3, 3, 1, 1, 1, 0, 1, 1, 1, 1, 0, 1, 0],
-    [1, 0, 0, 0, 0, 3, 3, 3, 3, 3, 3, 3, 3, 3, 3, 3, 3, 3, 3, 0, 0, 1, 4, 4, 4, 1, 2, 2, 2, 0],
-    [1, 0, 0, 0, 9, 1, 3, 3, 3, 3, 3, 3, 3, 3, 3, 3, 3, 1, 1, 1, 0, 4, 4, 4, 4, 1, 2, 2, 1, 0],
-    [1, 0, 0, 0, 1, 9, 1, 3, 3, 3, 3, 3, 3, 3, 3, 3, 3, 1, 9, 1, 0, 1, 4, 4, 4, 1, 2, 2, 1, 0],
-    [1, 0, 0, 0, 1, 9, 3, 3, 3, 3, 3, 3, 3, 3, 3, 3, 3, 1, 9, 1, 0, 1, 4, 4, 4, 1, 2, 2, 2, 0],
-    [1, 0, 0, 0, 1, 1, 1, 3, 3, 3, 3, 3, 3, 3, 3, 1, 1, 1, 9, 9, 0, 4, 4, 4, 4, 1, 2, 2, 1, 0],
-    [1, 0, 0, 0, 0, 0, 0, 3, 3, 3, 3, 3, 3, 3, 3, 4, 4, 1, 1, 1, 0, 1, 1, 1, 1, 1, 1, 1, 1, 0],
-    [1, 0, 0, 0, 0, 0, 0, 3, 3, 3, 3, 3, 3, 3, 3, 4, 4, 1, 4, 4, 0, 1, 8, 1, 2, 2, 2, 2, 2, 0],
-    [1, 0, 0, 0, 1, 1, 1, 7, 1, 1, 11, 1, 3, 3, 3, 4, 4, 1, 1, 4, 0, 1, 8, 1, 1, 1, 1, 1, 1, 0],
-    [1, 0, 0, 0, 1, 7, 7, 7, 1, 1, 11, 1, 3, 3, 3, 1, 1, 7, 7, 1, 0, 8, 8, 8, 8, 8, 8, 8, 1, 0],
-    [1, 0, 0, 0, 1, 7, 7, 1, 11, 11, 11, 1, 3, 3, 3, 1, 1, 7, 7, 1, 0, 1, 8, 8, 8, 8, 8, 8, 1, 0],
-    [1, 0, 0, 0, 1, 1, 7, 1, 1, 1, 11, 1, 1, 1, 0, 5, 1, 7, 1, 1, 0, 1, 1, 8, 8, 8, 8, 8, 1, 0],
-    [1, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 8, 8, 8, 8, 8, 8, 1, 0],
-    [1, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 1, 8, 8, 8, 8, 8, 1, 0],
-    [1, 1, 1, 0, 0, 1, 7, 7, 1, 1, 2, 2, 1, 1, 1, 1, 1, 0, 1, 6, 1, 0, 1, 1, 1, 1, 1, 1, 1, 1],
-    [1, 1, 1, 0, 0, 1, 7, 7, 7, 7, 1, 1, 12, 12, 12, 12, 1, 0, 6, 6, 1, 7, 7, 7, 7, 7, 7, 1, 1, 1],
-    [1, 1, 1, 0, 0, 7, 7, 7, 1, 1, 10, 10, 1, 1, 1, 1, 10, 0, 6, 6, 1, 7, 7, 7, 7, 7, 7, 1, 1, 1],
-    [1, 1, 0, 0, 0, 1, 1, 1, 10, 10, 10, 10, 10, 10, 10, 1, 10, 0, 6, 6, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1],
-    [1, 1, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 6, 6, 6, 6, 6, 6, 6, 6, 6, 6, 1, 1],
-    [1, 1, 9, 0, 7, 1, 10, 10, 10, 10, 10, 10, 10, 10, 10, 10, 10, 1, 6, 1, 13, 6, 13, 1, 6, 6, 6, 6, 1, 1],
-    [1, 1, 0, 0, 7, 1, 10, 10, 10, 10, 10, 10, 10, 10, 10, 10, 10, 1, 6, 1, 13, 13, 13, 1, 6, 6, 6, 6, 1, 1],
-    [1, 1, 0, 0, 0, 1, 10, 10, 10, 10, 10, 10, 10, 10, 10, 10, 10, 1, 6, 1, 13, 13, 13, 1, 6, 6, 6, 6, 1, 1],
-    [1, 1, 9, 9, 9, 1, 10, 10, 10, 10, 10, 10, 10, 10, 10, 10, 10, 1, 6, 1, 13, 13, 13, 1, 6, 6, 6, 6, 1, 1],
-    [1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1]
-]
-
-############################################################
-#### The mainloop activates the GUI.
-############################################################
-if __name__ == "__main__":
-    base_name = input("Enter input file number or name: ").strip()
-
-    # Build full filename automatically
-    if base_name.isdigit():
-        filename = f"inputfile{base_name}.txt"
-    else:
-        filename = f"inputfile_{base_name.upper()}.txt"
-
-    root = tk.Tk()
-    root.title("A* Maze - Hospital Delivery")
-
-    game = MazeGame(root, maze, filename)
-    root.bind("<KeyPress>", game.move_agent)
-
+#######################################################
+#### Adam Syed and Teagan Clark
+#### 11/24/25
+#### Purpose: Create a path finding robot to navigate through multiple
+#### hospital wards, using A* and Dijkstra to find the optimum path.
+#######################################################
+import argparse
+import os
+import time
+import tkinter as tk
+
+from animation import Animation
+from distances import TABLE_CELL_LIMIT, DistanceTable
+from hospital import CELL_COLORS, PATH_COLORS, default_start, drop_off_points, maze, read_input_file
+from mapfile import MapFile, load_map
+from pipeline import LegPlanner
+from profiling import profiler
+from routecache import default_cache
+from routing import ALGORITHM_NAMES, Grid, Route, goal_targets, plan
+from stats import tracer
+from tour import order_goals
+from viewport import Viewport
+
+#### Map file loaded instead of the built-in hospital maze when present
+MAP_FILE = "hospital.hmap"
+
+#### How often (ms) the GUI checks for legs finished by the planner thread
+PLANNER_POLL_MS = 10
+
+#### Largest window the viewer opens; bigger maps are zoomed out to fit
+MAX_VIEW_WIDTH = 1200
+MAX_VIEW_HEIGHT = 800
+
+
+######################################################
+# A maze is a grid of size rows X cols
+#### MazeGame only draws routes; they are computed by routing.plan()
+######################################################
+class MazeGame:
+    def __init__(self, root, maze, input_filename, wards=None, pipelined=True):
+        self.input_filename = input_filename
+        self.pipelined = pipelined
+        self.root = root
+        self.maze = maze
+
+        #### Distances between all ward drop-off points, computed once.
+        #### A MapFile is used as it is: its cells stay memory-mapped and the
+        #### grid is built from them without nested lists.
+        with profiler.phase("setup"):
+            if isinstance(maze, MapFile):
+                self.grid, self.cells = maze.grid(), maze.cells
+            else:
+                self.grid = Grid(maze)
+                self.cells = bytes(v for row in maze for v in row)
+            self.rows, self.cols = self.grid.rows, self.grid.cols
+
+            #### On large floor plans the legs are searched instead
+            self.table = None
+            if self.rows * self.cols <= TABLE_CELL_LIMIT:
+                self.table = DistanceTable(self.grid, drop_off_points(wards))
+
+        self.path_colors = PATH_COLORS
+        self.animation_delay = 100
+
+        self.total_goals = 0
+        self.completed_goals = 0
+
+        self.path_index = 0
+
+        # --- Read algorithm + start ward + goal ward names from input file ---
+        parse_started = time.perf_counter()
+        with profiler.phase("parse"):
+            start = wards.get("default_start", default_start) if wards else default_start
+            self.algorithm, self.agent_pos, self.goal_positions = read_input_file(self.input_filename, start, wards)
+
+            #### Shortest visiting order inside each priority tier
+            self.goal_positions = order_goals(self.grid, self.agent_pos, self.goal_positions, self.algorithm, self.table)
+        self.parse_time = time.perf_counter() - parse_started
+
+        if self.algorithm.strip().lower() in ALGORITHM_NAMES:
+            print("\n" + "#" * 50)
+            print(f"#### NOW RUNNING: {ALGORITHM_NAMES[self.algorithm.strip().lower()]}")
+            print("#" * 50 + "\n")
+        else:
+            print("Invalid algorithm, defaulting to A*")
+
+        self.goal_pos = (self.rows - 1, self.cols - 1)
+
+        #### The maze cell size in pixels; maps bigger than the window
+        #### start zoomed out to fit it
+        self.cell_size = 25
+        self.view_width = min(self.cols * self.cell_size, MAX_VIEW_WIDTH)
+        self.view_height = min(self.rows * self.cell_size, MAX_VIEW_HEIGHT)
+        self.canvas = tk.Canvas(
+            root,
+            width=self.view_width,
+            height=self.view_height,
+            bg='white'
+        )
+        self.canvas.pack(fill=tk.BOTH, expand=True)
+
+        #### One line under the map for problems found while running
+        self.status = tk.Label(root, text="", anchor="w", fg="firebrick")
+        self.status.pack(fill=tk.X)
+
+        self.viewport = None
+        self.rendering_leg = None
+
+        self.total_goals = len(self.goal_positions)
+
+        with profiler.phase("draw"):
+            self.draw_maze()
+        
+        #### Display the optimum path in the maze (multi-goal).
+        #### The animation runs from the Tk event loop; finish() runs at its end.
+        self.find_path()
+
+    ############################################################
+    #### This is for the GUI part. No need to modify this unless
+    #### GUI changes are needed.
+    #### The Viewport only creates canvas items for the cells in view;
+    #### the start, goals and routes are recorded per cell and drawn
+    #### whenever their cells are visible.
+    ############################################################
+    def draw_maze(self):
+        self.viewport = Viewport(self.canvas, self.rows, self.cols, self.cells, CELL_COLORS,
+                                 cell_size=self.cell_size, width=self.view_width, height=self.view_height)
+
+        # Mark the initial start cell (where the agent currently is)
+        self.viewport.set_cell(self.agent_pos, fill='lime green', text='START', font=("Purisa", 8, "bold"))
+        
+        # Mark all goal positions (as targets will change): every drop-off of every requested ward
+        goal_cells = [loc for goal in self.goal_positions for loc in goal_targets(goal)]
+        for cell in goal_cells:
+            self.viewport.set_cell(cell, fill='firebrick', text='GOAL', font=("Purisa", 8, "bold"), text_fill='white')
+        
+        self.viewport.move_agent(self.agent_pos, 'navy')
+        self.viewport.redraw()
+        self.viewport.bind()
+
+    ############################################################
+    #### Per-frame batching: the frame's changes are recorded in the
+    #### viewport and drawn together, followed by a single redraw.
+    #### The render time goes into route.stats, which holds copies of the
+    #### legs' stats, so cached legs are not changed.
+    ############################################################
+    def flush_frame(self):
+        started = time.perf_counter()
+        with profiler.phase("render"):
+            self.viewport.flush()
+        if self.route.stats and self.rendering_leg is not None:
+            phases = self.route.stats[self.rendering_leg].phases
+            phases["render"] = phases.get("render", 0.0) + time.perf_counter() - started
+
+    ############################################################
+    #### Route all goals (multi-goal, sequential by priority) and
+    #### animate the completed legs without blocking the event loop.
+    #### Pipelined (the default), a LegPlanner thread searches the next
+    #### legs while the current one is animated and receive_legs() picks
+    #### them up; otherwise the whole trip is planned before it is shown.
+    ############################################################
+    def find_path(self):
+        if not self.pipelined:
+            with profiler.phase("search"):
+                self.route = plan(self.grid, self.agent_pos, self.goal_positions, self.algorithm, self.table, default_cache)
+                if self.route.stats is not None:
+                    self.route.stats = [stats.copy() for stats in self.route.stats]
+
+            with profiler.phase("reconstruct"):
+                frames = []
+                for goal_index, (goal, leg) in enumerate(zip(self.goal_positions, self.route.legs)):
+                    frames.extend(self.leg_frames(goal_index, goal, leg))
+            self.animation = Animation(self.root, frames, self.flush_frame, on_done=self.finish)
+            self.animation.start()
+            return
+
+        self.route = Route(tuple(self.agent_pos), list(self.goal_positions), [])
+        if tracer.enabled:
+            self.route.stats = []
+        self.planner = LegPlanner(self.grid, self.agent_pos, self.goal_positions, self.algorithm, self.table, default_cache)
+        self.planner.start()
+        self.animation = Animation(self.root, [], self.flush_frame, on_done=self.finish, streaming=True)
+        self.animation.start()
+        self.receive_legs()
+
+    #### Hand the legs the planner has finished to the animation.
+    #### If the planner failed, the legs planned before the error are
+    #### still shown and the error is reported in the status line.
+    def receive_legs(self):
+        try:
+            legs = self.planner.ready()
+        except Exception as error:
+            print(f"ERROR: Route planning failed: {error}")
+            self.status.config(text=f"Route planning failed: {error}")
+            self.animation.close()
+            return
+
+        for goal_index, goal, leg, stats in legs:
+            self.route.legs.append(leg)
+            if self.route.stats is not None:
+                self.route.stats.append(stats.copy())
+            with profiler.phase("reconstruct"):
+                self.animation.append(self.leg_frames(goal_index, goal, leg))
+
+        if self.planner.finished:
+            self.animation.close()
+        else:
+            self.root.after(PLANNER_POLL_MS, self.receive_legs)
+
+    #### The frames of one leg: announce it, walk it, land on the goal, pause
+    def leg_frames(self, goal_index, goal, leg):
+        frames = [(0, lambda: self.start_leg(goal_index, goal, leg))]
+        if leg is not None:
+            frames.extend(self.reconstruct_path(leg))
+            frames.append((0, lambda: self.finish_leg(leg)))
+
+            # small delay for visualization
+            frames.append((500, lambda: None))
+        return frames
+
+    #### First frame of a leg: say where the robot is going
+    def start_leg(self, goal_index, goal, leg):
+        xn, yn, priority, ward_name = goal[:4]
+        self.rendering_leg = goal_index
+
+        if leg is None:
+            print(f"Routing to {ward_name} with priority {priority} (Goal {goal_index+1})")
+            print(f"ERROR: Unable to reach {ward_name} (Goal {goal_index+1}) at ({xn}, {yn}) with priority {priority}. Goal skipped.")
+            return
+
+        self.goal_pos = leg.goal  # nearest drop-off of the ward from the robot's current position
+        print(f"Routing to {ward_name} at {self.goal_pos} with priority {priority} (Goal {goal_index+1})")
+
+    #### Last frame of a leg: the robot is on the drop-off
+    def finish_leg(self, leg):
+        self.agent_pos = leg.goal
+        self.viewport.move_agent(self.agent_pos)
+        self.completed_goals += 1 #increment completed goals
+
+    ############################################################
+    #### Reconstruct path for the current goal (Animated).
+    #### Returns one (delay, frame) pair per step for the Animation.
+    ############################################################
+    def reconstruct_path(self, leg):
+        # Get path color for this trip
+        path_color = self.path_colors[self.path_index % len(self.path_colors)]
+        self.path_index += 1
+        
+        # Animate the path one step at a time: one frame per step
+        frames = []
+        for step, ((x, y), (g, h)) in enumerate(zip(leg.path, leg.labels)):
+            # Wait for the animation delay between steps
+            delay = self.animation_delay if step else 0
+            frames.append((delay, lambda x=x, y=y, g=g, h=h: self.show_step(x, y, g, h, path_color)))
+        return frames
+
+    def show_step(self, x, y, g, h, path_color):
+        # Update the cell's background color and its g/h cost text
+        self.viewport.set_cell((x, y), fill=path_color, text=f'g={g}\nh={h}', font=("Purisa", 8), text_fill='black')
+        
+        # Animate the agent moving to this cell
+        self.viewport.move_agent((x, y))
+
+    ############################################################
+    #### End of the animation: summary, stats record and profile report
+    ############################################################
+    def finish(self):
+        self.terminate_program()
+
+        #### One summary record per run, with the parse time and every leg's stats
+        if tracer.enabled:
+            tracer.write({
+                "event": "run",
+                "input": self.input_filename,
+                "phases_ms": {"parse": round(self.parse_time * 1000, 4)},
+                "legs": [stats.as_dict() for stats in self.route.stats],
+            })
+
+        if profiler.enabled:
+            profiler.dump()
+
+    ############################################################
+    #### Program Termination Conditions Checker
+    ############################################################
+    def terminate_program(self):
+        
+        # All requests completed (SUCCESS)
+        if self.completed_goals == self.total_goals and self.total_goals > 0:
+            print("\n" + "#" * 50)
+            print("#### PROGRAM TERMINATION: SUCCESS (All Tasks Completed)")
+            print(f"#### All {self.completed_goals} delivery requests were successfully completed.")
+            print("#" * 50)
+        
+        # Some requests completed (SUCCESS with caveats)
+        elif 0 < self.completed_goals < self.total_goals:
+            print("\n" + "#" * 50)
+            print("#### PROGRAM TERMINATION: SUCCESS (Partial Completion)")
+            print(f"#### {self.completed_goals} out of {self.total_goals} requests were successfully completed.")
+            print("#### The map shows the completed optimum paths.")
+            print("#" * 50)
+            
+        # No tasks completed (FAILURE)
+        elif self.completed_goals == 0 and self.total_goals > 0:
+            print("\n" + "#" * 50)
+            print("#### PROGRAM TERMINATION: FAILURE (Blocked Paths)")
+            print("#### WARNING: The robot was not able to complete any of its tasks.")
+            print(f"#### All {self.total_goals} delivery paths were blocked. Please check the maze input.")
+            print("#" * 50)
+        
+        # No goals were loaded from the input file
+        else:
+            print("\n" + "#" * 50)
+            print("#### PROGRAM TERMINATION: No Goals Defined")
+            print("#### No delivery requests were found in the input file.")
+            print("#" * 50)        
+
+    ############################################################
+    #### Move agent manually with arrow keys (optional)
+    ############################################################
+    def move_agent(self, event):
+        r, c = self.agent_pos
+
+        #### Move right, if possible
+        if event.keysym == 'Right' and self.grid.is_open((r, c + 1)):
+            self.agent_pos = (r, c + 1)
+
+        #### Move Left, if possible            
+        elif event.keysym == 'Left' and self.grid.is_open((r, c - 1)):
+            self.agent_pos = (r, c - 1)
+        
+        #### Move Down, if possible
+        elif event.keysym == 'Down' and self.grid.is_open((r + 1, c)):
+            self.agent_pos = (r + 1, c)
+   
+        #### Move Up, if possible   
+        elif event.keysym == 'Up' and self.grid.is_open((r - 1, c)):
+            self.agent_pos = (r - 1, c)
+
+        #### Move the agent's square to the new cell position at time t+1
+        self.viewport.move_agent(self.agent_pos)
+        self.viewport.flush()
+
+
+############################################################
+#### The mainloop activates the GUI.
+############################################################
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Hospital delivery robot.")
+    parser.add_argument("--profile", action="store_true", help="time each phase and print a report")
+    parser.add_argument("--profile-memory", action="store_true", help="also record the tracemalloc peak per phase")
+    parser.add_argument("--cprofile", metavar="PHASE", help="run cProfile on one phase: setup, parse, draw, search or reconstruct")
+    parser.add_argument("--sequential", action="store_true", help="plan the whole trip before animating it")
+    parser.add_argument("--map", default=MAP_FILE, help="map file to open (see mapfile.py)")
+    args = parser.parse_args()
+    if args.profile or args.profile_memory or args.cprofile:
+        profiler.enable(memory=args.profile_memory, cprofile_phase=args.cprofile)
+
+    base_name = input("Enter input file number or name: ").strip()
+
+    # Build full filename automatically
+    if base_name.isdigit():
+        filename = f"inputfile{base_name}.txt"
+    else:
+        filename = f"inputfile_{base_name.upper()}.txt"
+
+    root = tk.Tk()
+    root.title("A* Maze - Hospital Delivery")
+
+    #### Ward tables come with the map when it is loaded from a map file.
+    #### The map stays open (memory-mapped) while the viewer runs.
+    wards = None
+    if os.path.exists(args.map):
+        maze = load_map(args.map)
+        wards = maze.metadata
+
+    game = MazeGame(root, maze, filename, wards, pipelined=not args.sequential)
+    root.bind("<KeyPress>", game.move_agent)
+
+    #### Animation controls: End skips to the end, + / - double or halve the speed
+    root.bind("<End>", game.animation.jump_to_end)
+    root.bind("<plus>", game.animation.faster)
+    root.bind("<equal>", game.animation.faster)
+    root.bind("<minus>", game.animation.slower)
+
     root.mainloop()
\ No newline at end of file
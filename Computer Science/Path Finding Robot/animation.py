@@ -0,0 +1,161 @@
+#######################################################
+#### Adam Syed and Teagan Clark
+#### 11/24/25
+#### Purpose: Event-driven animation for the viewer. Frames are played
+#### from root.after() callbacks instead of a loop of update()/after(ms)
+#### calls, so the window stays responsive. Playback speed can change
+#### at any time, the rest of the animation can be skipped, and when
+#### drawing falls behind, the late frames are merged into one redraw
+#### instead of slowing everything down. Frames can also be appended
+#### while the animation is running, e.g. as legs arrive from a planner.
+#######################################################
+import time
+
+#### Playback speed limits (1.0 = the delays as given)
+MIN_SPEED = 0.125
+MAX_SPEED = 64.0
+
+
+######################################################
+#### frames is a list of (delay in ms before the frame, apply function).
+#### apply() only queues canvas changes; flush() draws everything queued
+#### once per tick. on_done() is called after the last frame.
+#### Time is kept on an animation clock that runs `speed` times as fast
+#### as the wall clock. Each tick applies every frame that is due by
+#### then, so frames that are late are dropped (merged), never queued up.
+#### With streaming=True more frames may follow through append(); the
+#### animation waits when it runs out of them and only ends after close().
+######################################################
+class Animation:
+    def __init__(self, root, frames, flush, on_done=None, speed=1.0, streaming=False):
+        self.root = root
+        self.flush = flush
+        self.on_done = on_done
+        self.speed = speed
+        self.streaming = streaming
+
+        #### Animation-clock time (ms) at which each frame is due
+        self.due = []
+        self.steps = []
+
+        self.next = 0           # index of the next frame to apply
+        self.clock = 0.0        # animation time reached so far (ms)
+        self.last_tick = None
+        self.pending = None     # id of the scheduled after() callback
+        self.done = False
+        self.skipping = False   # jump_to_end() was asked for before the last frame arrived
+        self.shown = 0          # frames that got their own redraw
+        self.dropped = 0        # frames merged into a later redraw
+
+        self.append(frames)
+
+    def start(self):
+        self.last_tick = time.perf_counter()
+        self.schedule(0)
+
+    ############################################################
+    #### Add frames after the last one. If the animation had already
+    #### run out of frames, the new ones are timed from now, not from
+    #### when the last frame was shown.
+    ############################################################
+    def append(self, frames):
+        if self.done:
+            return
+        clock = self.due[-1] if self.due else 0.0
+        if self.last_tick is not None and self.next >= len(self.steps):
+            self.advance()
+            clock = max(clock, self.clock)
+        for delay, apply in frames:
+            clock += delay
+            self.due.append(clock)
+            self.steps.append(apply)
+
+        if self.skipping:
+            self.jump_to_end()
+        elif self.last_tick is not None and self.pending is None and self.next < len(self.steps):
+            self.schedule(0)
+
+    #### No more frames will be appended
+    def close(self):
+        self.streaming = False
+        if self.last_tick is not None and self.pending is None and self.next >= len(self.steps) and not self.done:
+            self.finish()
+
+    def schedule(self, delay_ms):
+        self.pending = self.root.after(max(0, int(delay_ms)), self.tick)
+
+    ############################################################
+    #### Apply every frame due by now, draw once, and sleep until the
+    #### next frame is due
+    ############################################################
+    def tick(self):
+        self.pending = None
+        if self.done:
+            return
+        self.advance()
+
+        applied = 0
+        while self.next < len(self.steps) and self.due[self.next] <= self.clock:
+            self.steps[self.next]()
+            self.next += 1
+            applied += 1
+        if applied:
+            self.flush()
+            self.shown += 1
+            self.dropped += applied - 1
+
+        if self.next < len(self.steps):
+            self.schedule((self.due[self.next] - self.clock) / self.speed)
+        elif not self.streaming:
+            self.finish()
+
+    #### Move the animation clock up to now
+    def advance(self):
+        now = time.perf_counter()
+        self.clock += (now - self.last_tick) * 1000 * self.speed
+        self.last_tick = now
+
+    ############################################################
+    #### Change the playback speed. The time played so far counts at the
+    #### old speed, and the tick already waiting is moved so the next
+    #### frame comes when it is due at the new speed.
+    ############################################################
+    def set_speed(self, speed):
+        if self.last_tick is not None:
+            self.advance()
+        self.speed = min(MAX_SPEED, max(MIN_SPEED, speed))
+        if self.pending is not None:
+            self.root.after_cancel(self.pending)
+            self.schedule((self.due[self.next] - self.clock) / self.speed)
+
+    def faster(self, event=None):
+        self.set_speed(self.speed * 2)
+
+    def slower(self, event=None):
+        self.set_speed(self.speed / 2)
+
+    #### Apply all remaining frames at once and draw the end state. While
+    #### streaming, frames appended later are drawn as soon as they arrive.
+    def jump_to_end(self, event=None):
+        if self.done:
+            return
+        if self.pending is not None:
+            self.root.after_cancel(self.pending)
+            self.pending = None
+        remaining = len(self.steps) - self.next
+        while self.next < len(self.steps):
+            self.steps[self.next]()
+            self.next += 1
+        if remaining:
+            self.flush()
+            self.shown += 1
+            self.dropped += remaining - 1
+        if self.streaming:
+            self.skipping = True
+        else:
+            self.finish()
+
+    def finish(self):
+        self.done = True
+        if self.on_done is not None:
+            self.on_done()
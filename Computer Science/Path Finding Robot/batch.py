@@ -0,0 +1,93 @@
+#######################################################
+#### Adam Syed and Teagan Clark
+#### 11/24/25
+#### Purpose: Route many carts at once. route_many() takes a list of
+#### (start, goals) jobs on one map and spreads them over a process
+#### (or thread) pool. The map's walkable flags are put in shared memory
+#### once, so workers attach to them instead of each unpickling a copy.
+#### Results stream back in completion order.
+#######################################################
+import os
+import threading
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, ThreadPoolExecutor, wait
+from multiprocessing import shared_memory
+
+from routing import Grid, as_grid, plan
+
+
+#### Jobs handed to a worker per task; bigger chunks mean less IPC overhead
+DEFAULT_CHUNK_SIZE = 16
+
+#### Per-process worker state, filled in by attach_worker()
+worker = {}
+
+
+############################################################
+#### Process pool initializer: attach to the shared map once per worker
+############################################################
+def attach_worker(name, rows, cols, algorithm):
+    memory = shared_memory.SharedMemory(name=name)
+    worker["memory"] = memory
+    worker["grid"] = Grid(None, rows, cols, memory.buf)
+    worker["algorithm"] = algorithm
+
+
+############################################################
+#### Worker task: plan a chunk of (index, start, goals) jobs
+############################################################
+def route_chunk(chunk):
+    grid, algorithm = worker["grid"], worker["algorithm"]
+    return [(index, plan(grid, start, goals, algorithm)) for index, start, goals in chunk]
+
+
+############################################################
+#### Thread pool variant: the flags are shared directly, but every
+#### thread needs its own Grid so it gets its own search state
+############################################################
+def thread_chunk_runner(grid, algorithm):
+    local = threading.local()
+
+    def run(chunk):
+        if not hasattr(local, "grid"):
+            local.grid = Grid(None, grid.rows, grid.cols, grid.open)
+        return [(index, plan(local.grid, start, goals, algorithm)) for index, start, goals in chunk]
+
+    return run
+
+
+############################################################
+#### Route every (start, goals) job on one map.
+#### Yields (job index, Route) pairs as soon as each chunk finishes, so
+#### the caller sees results in completion order, not submission order.
+#### use_processes=False runs a thread pool instead (no start-up cost,
+#### but searches are pure Python so threads share one core).
+############################################################
+def route_many(maze, jobs, algorithm="A*", workers=None, use_processes=True, chunk_size=DEFAULT_CHUNK_SIZE):
+    grid = as_grid(maze)
+    workers = workers or os.cpu_count() or 1
+    numbered = [(i, tuple(start), list(goals)) for i, (start, goals) in enumerate(jobs)]
+    chunks = [numbered[i:i + chunk_size] for i in range(0, len(numbered), chunk_size)]
+
+    memory = None
+    try:
+        if use_processes:
+            memory = shared_memory.SharedMemory(create=True, size=max(1, len(grid.open)))
+            memory.buf[:len(grid.open)] = grid.open
+            pool = ProcessPoolExecutor(max_workers=workers, initializer=attach_worker,
+                                       initargs=(memory.name, grid.rows, grid.cols, algorithm))
+            task = route_chunk
+        else:
+            pool = ThreadPoolExecutor(max_workers=workers)
+            task = thread_chunk_runner(grid, algorithm)
+
+        with pool:
+            pending = {pool.submit(task, chunk) for chunk in chunks}
+            while pending:
+                done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    for result in future.result():
+                        yield result
+    finally:
+        if memory is not None:
+            memory.close()
+            memory.unlink()
@@ -0,0 +1,265 @@
+#######################################################
+#### Adam Syed and Teagan Clark
+#### 11/24/25
+#### Purpose: Scaling benchmark for every search mode on generated,
+#### seeded mazes (random obstacles, rooms and corridors like the
+#### hospital, open fields) from 32x32 up to 4096x4096. Prints one row
+#### per (maze, size, mode) as CSV or JSON lines, so two versions of the
+#### code can be compared with a plain diff.
+####
+#### Usage: python benchmark.py [--sizes 32,128,512] [--kinds random,rooms,open]
+####                           [--modes "a*,jps"] [--queries 5] [--seed 1]
+####                           [--format csv|json] [--no-memory] [--output file]
+#######################################################
+import argparse
+import csv
+import json
+import random
+import sys
+import time
+import tracemalloc
+
+from hpa import hierarchy_for
+from routing import Grid, search
+from stats import tracer
+
+DEFAULT_SIZES = [32, 128, 512, 1024]
+KINDS = ["random", "rooms", "open"]
+
+#### Every search mode; "jps 8-way" is the 8-connected variant (diagonal steps cost 1)
+MODES = ["a*", "dijkstra", "greedy", "jps", "bidirectional a*", "bidirectional dijkstra", "hpa*", "jps 8-way"]
+
+#### Exact 8-connected reference costs (a plain BFS) are only computed up to this size
+REFERENCE_8WAY_LIMIT = 1024
+
+COLUMNS = ["maze", "size", "seed", "mode", "queries", "solved", "time_ms_mean", "time_ms_total",
+           "expanded", "pushes", "peak_kib", "cost_ratio", "setup_s"]
+
+
+############################################################
+#### Maze generators. All return a Grid built straight from a bytearray
+#### of walkable flags (no nested lists, so 4096x4096 stays cheap) and
+#### depend only on the seed string.
+############################################################
+def threshold_flags(rng, size, wall_fraction):
+    cut = int(wall_fraction * 256)
+    table = bytes(0 if value < cut else 1 for value in range(256))
+    return bytearray(rng.randbytes(size * size).translate(table))
+
+
+#### Random obstacles: each cell is a wall with probability 0.3
+def random_maze(size, rng):
+    return threshold_flags(rng, size, 0.3)
+
+
+#### Open field: a few scattered single obstacles (3%)
+def open_field(size, rng):
+    return threshold_flags(rng, size, 0.03)
+
+
+############################################################
+#### Rooms and corridors: square rooms with one-cell walls and a door
+#### in most walls, crossed by two-cell-wide corridors every few rooms
+############################################################
+def rooms_maze(size, rng, room=10, corridor_every=4):
+    flags = bytearray(b"\x01") * (size * size)
+    period = room + 1
+    walls = list(range(room, size, period))
+
+    for w in walls:
+        flags[w * size:(w + 1) * size] = bytes(size)    # horizontal wall
+        flags[w::size] = bytes(size)    # vertical wall
+
+    #### Doors: one per wall segment between two crossings, 85% of the time
+    bounds = [-1] + walls + [size]
+    for w in walls:
+        for a, b in zip(bounds, bounds[1:]):
+            if b - a > 1 and rng.random() < 0.85:
+                d = rng.randrange(a + 1, b)
+                flags[w * size + d] = 1
+                flags[d * size + w] = 1
+
+    #### Corridors
+    for k, w in enumerate(walls):
+        if k % corridor_every == corridor_every - 1:
+            for line in (w, min(w + 1, size - 1)):
+                flags[line * size:(line + 1) * size] = b"\x01" * size
+                flags[line::size] = b"\x01" * size
+    return flags
+
+
+GENERATORS = {"random": random_maze, "rooms": rooms_maze, "open": open_field}
+
+
+def make_maze(kind, size, seed):
+    rng = random.Random(f"{seed}-{kind}-{size}")
+    return Grid(None, size, size, GENERATORS[kind](size, rng))
+
+
+############################################################
+#### Start/goal pairs on open cells that A* can connect. The A* cost
+#### is the optimal 4-connected cost used for cost ratios.
+############################################################
+def make_queries(grid, count, seed):
+    rng = random.Random(f"{seed}-queries-{grid.rows}")
+    cells = grid.rows * grid.cols
+    queries = []
+    attempts = 0
+    while len(queries) < count and attempts < count * 20:
+        attempts += 1
+        start, goal = grid.pos(rng.randrange(cells)), grid.pos(rng.randrange(cells))
+        if not grid.is_open(start) or not grid.is_open(goal) or start == goal:
+            continue
+        leg = search(grid, start, goal, "A*")
+        if leg is not None:
+            queries.append((start, goal, leg.cost))
+    return queries
+
+
+#### Exact 8-connected move count (unit diagonals), by breadth-first search
+def bfs_8way(grid, start, goal):
+    rows, cols, walkable = grid.rows, grid.cols, grid.open
+    source, target = grid.index(start), grid.index(goal)
+    seen = bytearray(rows * cols)
+    seen[source] = 1
+    frontier = [source]
+    steps = 0
+    while frontier:
+        if target in frontier:
+            return steps
+        steps += 1
+        next_frontier = []
+        for current in frontier:
+            r, c = divmod(current, cols)
+            for dr in (-1, 0, 1):
+                for dc in (-1, 0, 1):
+                    nr, nc = r + dr, c + dc
+                    if 0 <= nr < rows and 0 <= nc < cols:
+                        n = nr * cols + nc
+                        if walkable[n] and not seen[n]:
+                            seen[n] = 1
+                            next_frontier.append(n)
+        frontier = next_frontier
+    return None
+
+
+############################################################
+#### (expanded, pushes) of one query, counted by running it once more
+#### with stats on, so the timed run pays nothing for the counters.
+#### HPA* keeps no per-cell open set, so (None, None)
+############################################################
+def search_counts(grid, start, goal, mode):
+    if mode == "hpa*":
+        return None, None
+    enabled = tracer.enabled
+    tracer.enabled = True
+    try:
+        search(grid, start, goal, mode)
+    finally:
+        tracer.enabled = enabled
+    return tracer.last.expanded, tracer.last.pushed
+
+
+############################################################
+#### Benchmark one mode on one maze. Every query is timed without
+#### tracemalloc; with measure_memory each query is then run once more
+#### under tracemalloc for its peak allocation.
+############################################################
+def bench_mode(kind, size, seed, grid, mode, queries, measure_memory=True):
+    setup = 0.0
+    if mode == "hpa*":
+        started = time.perf_counter()
+        hierarchy_for(grid)
+        setup = time.perf_counter() - started
+
+    times, expanded, pushes, ratios = [], 0, 0, []
+    peak = 0
+    solved = 0
+    for start, goal, optimal in queries:
+        started = time.perf_counter()
+        leg = search(grid, start, goal, mode)
+        times.append(time.perf_counter() - started)
+        n_expanded, n_pushes = search_counts(grid, start, goal, mode)
+
+        if n_expanded is not None:
+            expanded += n_expanded
+            pushes += n_pushes
+        if leg is None:
+            continue
+        solved += 1
+
+        if mode == "jps 8-way":
+            optimal = bfs_8way(grid, start, goal) if size <= REFERENCE_8WAY_LIMIT else None
+        if optimal:
+            ratios.append(leg.cost / optimal)
+
+        if measure_memory:
+            tracemalloc.start()
+            search(grid, start, goal, mode)
+            peak = max(peak, tracemalloc.get_traced_memory()[1])
+            tracemalloc.stop()
+
+    counted = mode != "hpa*"
+    return {
+        "maze": kind,
+        "size": size,
+        "seed": seed,
+        "mode": mode,
+        "queries": len(queries),
+        "solved": solved,
+        "time_ms_mean": round(1000 * sum(times) / len(times), 3) if times else None,
+        "time_ms_total": round(1000 * sum(times), 3),
+        "expanded": expanded if counted else None,
+        "pushes": pushes if counted else None,
+        "peak_kib": round(peak / 1024, 1) if measure_memory else None,
+        "cost_ratio": round(sum(ratios) / len(ratios), 4) if ratios else None,
+        "setup_s": round(setup, 3),
+    }
+
+
+def run(sizes=DEFAULT_SIZES, kinds=KINDS, modes=MODES, queries=5, seed=1, measure_memory=True):
+    for size in sizes:
+        for kind in kinds:
+            grid = make_maze(kind, size, seed)
+            pairs = make_queries(grid, queries, seed)
+
+            #### Allocate the search arrays up front so they are not counted as search memory
+            grid.search_state(0)
+            grid.search_state(1)
+
+            for mode in modes:
+                yield bench_mode(kind, size, seed, grid, mode, pairs, measure_memory)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Benchmark every search mode on generated mazes.")
+    parser.add_argument("--sizes", default=",".join(map(str, DEFAULT_SIZES)), help="comma separated, e.g. 32,512,4096")
+    parser.add_argument("--kinds", default=",".join(KINDS))
+    parser.add_argument("--modes", default=",".join(MODES))
+    parser.add_argument("--queries", type=int, default=5, help="start/goal pairs per maze")
+    parser.add_argument("--seed", type=int, default=1)
+    parser.add_argument("--format", choices=["csv", "json"], default="csv")
+    parser.add_argument("--no-memory", action="store_true", help="skip the tracemalloc pass")
+    parser.add_argument("--output", help="write to this file instead of stdout")
+    args = parser.parse_args()
+
+    sizes = [int(size) for size in args.sizes.split(",")]
+    kinds = [kind.strip() for kind in args.kinds.split(",")]
+    modes = [mode.strip().lower() for mode in args.modes.split(",")]
+    for name, chosen, known in (("kind", kinds, KINDS), ("mode", modes, MODES)):
+        for value in chosen:
+            if value not in known:
+                parser.error(f"unknown {name} '{value}', choose from: {', '.join(known)}")
+
+    out = open(args.output, "w", newline="") if args.output else sys.stdout
+    writer = csv.DictWriter(out, fieldnames=COLUMNS) if args.format == "csv" else None
+    if writer:
+        writer.writeheader()
+    for row in run(sizes, kinds, modes, args.queries, args.seed, not args.no_memory):
+        if writer:
+            writer.writerow(row)
+        else:
+            out.write(json.dumps(row) + "\n")
+        out.flush()
+    if args.output:
+        out.close()
@@ -0,0 +1,125 @@
+#######################################################
+#### Adam Syed and Teagan Clark
+#### 11/24/25
+#### Purpose: Bidirectional A* and bidirectional Dijkstra.
+#### One search grows from the robot, another from the goal cells, and
+#### they stop once they meet and no shorter path can exist. On long or
+#### blocked routes each side only has to flood about half as far.
+#######################################################
+from routing import Leg, as_grid, new_open_set
+
+
+############################################################
+#### Bidirectional search from start to the nearest of goals.
+####
+#### Both directions use the averaged potential
+####     p(n) = (h_goal(n) - h_start(n)) / 2
+#### (forward keys g + p, backward keys g - p), which keeps the two
+#### heuristics consistent with each other. With it the search can stop
+#### as soon as
+####     best forward key + best backward key >= mu
+#### where mu is the cheapest start-goal path found so far.
+#### Keys are doubled so they stay integers. Without the heuristic
+#### (Dijkstra) p = 0 and this is the classic stopping rule.
+############################################################
+def bidirectional_search(maze, start, goals, use_heuristic=True):
+    grid = as_grid(maze)
+    start = tuple(start)
+    goals = [tuple(goal) for goal in goals if grid.is_open(goal)]
+
+    if not grid.is_open(start) or not goals:
+        return None
+
+    rows, cols, walkable = grid.rows, grid.cols, grid.open
+    start_r, start_c = start
+
+    #### 2 * p(n)
+    def potential(r, c):
+        if not use_heuristic:
+            return 0
+        to_goal = min(abs(r - gr) + abs(c - gc) for gr, gc in goals)
+        return to_goal - (abs(r - start_r) + abs(c - start_c))
+
+    forward = grid.search_state(0)
+    backward = grid.search_state(1)
+    forward_open = new_open_set(forward)
+    backward_open = new_open_set(backward)
+
+    #### Seed the forward side with the start and the backward side with every goal
+    for state, open_set, cells, sign in ((forward, forward_open, [start], 1),
+                                         (backward, backward_open, goals, -1)):
+        generation = state.reset()
+        for cell in cells:
+            i = grid.index(cell)
+            state.stamp[i] = generation
+            state.g[i] = 0
+            state.parent[i] = -1
+            open_set.push(sign * potential(*cell), i)
+
+    best = float("inf")
+    meet = -1
+    source = grid.index(start)
+    if backward.stamp[source] == backward.generation:
+        best, meet = 0, source
+
+    while True:
+        top_forward = forward_open.peek()
+        top_backward = backward_open.peek()
+        if top_forward is None or top_backward is None:
+            break
+        if top_forward + top_backward >= 2 * best:
+            break
+
+        #### Grow the side with the smaller frontier
+        if len(forward_open.heap) <= len(backward_open.heap):
+            state, open_set, other, sign = forward, forward_open, backward, 1
+        else:
+            state, open_set, other, sign = backward, backward_open, forward, -1
+
+        generation = state.generation
+        stamp, closed, g, parent = state.stamp, state.closed, state.g, state.parent
+        other_stamp, other_g, other_generation = other.stamp, other.g, other.generation
+
+        current = open_set.pop()[1]
+        r, c = divmod(current, cols)
+        new_g = g[current] + 1
+
+        for nr, nc, n in ((r, c + 1, current + 1), (r, c - 1, current - 1),
+                          (r + 1, c, current + cols), (r - 1, c, current - cols)):
+            if 0 <= nr < rows and 0 <= nc < cols and walkable[n] and closed[n] != generation:
+                if stamp[n] != generation or new_g < g[n]:
+                    stamp[n] = generation
+                    g[n] = new_g
+                    parent[n] = current
+                    open_set.push(2 * new_g + sign * potential(nr, nc), n)
+
+                    #### The two searches touch: a candidate start-goal path
+                    if other_stamp[n] == other_generation and new_g + other_g[n] < best:
+                        best = new_g + other_g[n]
+                        meet = n
+
+    if meet == -1:
+        return None
+    return build_meeting_leg(grid, start, meet, forward, backward)
+
+
+############################################################
+#### Join the forward half (start -> meet) with the backward half
+#### (meet -> goal) into one Leg
+############################################################
+def build_meeting_leg(grid, start, meet, forward, backward):
+    path = []
+    current = meet
+    while forward.parent[current] != -1:
+        path.append(grid.pos(current))
+        current = forward.parent[current]
+    path.reverse()
+
+    current = meet
+    while backward.parent[current] != -1:
+        current = backward.parent[current]
+        path.append(grid.pos(current))
+
+    goal = grid.pos(current)
+    labels = [(step, abs(r - goal[0]) + abs(c - goal[1])) for step, (r, c) in enumerate(path, 1)]
+    return Leg(start, goal, path, labels)
@@ -0,0 +1,230 @@
+#######################################################
+#### Adam Syed and Teagan Clark
+#### 11/24/25
+#### Purpose: Cooperative planning for several delivery robots on the
+#### same map (cooperative A* / windowed HCA*). Robots are planned one
+#### after another in space-time (cell, time step) against a shared
+#### reservation table, so paths that would collide in a doorway are
+#### resolved while planning instead of by stop-and-wait at runtime.
+#######################################################
+import heapq
+
+from distances import DistanceTable
+from routing import as_grid
+
+
+######################################################
+#### Which cells (and which moves) are taken at which time step.
+#### Everything is stored as plain ints in sets/dicts for fast lookups:
+####   vertex key = t * size + cell
+####   edge key   = (t * size + from cell) * size + to cell
+#### A robot that has arrived is parked: its cell is taken from then on.
+######################################################
+class ReservationTable:
+    def __init__(self, size):
+        self.size = size
+        self.vertices = set()
+        self.edges = set()
+        self.parked = {}          # cell -> first time step it is parked on
+        self.last_used = {}       # cell -> last time step anyone reserved it
+
+    def clear(self):
+        self.vertices.clear()
+        self.edges.clear()
+        self.parked.clear()
+        self.last_used.clear()
+
+    def is_free(self, cell, t):
+        if t * self.size + cell in self.vertices:
+            return False
+        parked = self.parked.get(cell)
+        return parked is None or t < parked
+
+    #### Moving a -> b between t and t + 1 must not swap with a robot moving b -> a
+    def move_free(self, a, b, t):
+        return (t * self.size + b) * self.size + a not in self.edges
+
+    ############################################################
+    #### Reserve a timed path (cells[i] is the cell at time t0 + i).
+    #### park=True keeps the last cell taken for every later time step.
+    ############################################################
+    def reserve(self, cells, t0=0, park=True):
+        size = self.size
+        for i, cell in enumerate(cells):
+            t = t0 + i
+            self.vertices.add(t * size + cell)
+            self.last_used[cell] = max(self.last_used.get(cell, -1), t)
+            if i > 0:
+                self.edges.add((((t - 1) * size + cells[i - 1]) * size) + cell)
+        if park and cells:
+            self.parked[cells[-1]] = t0 + len(cells) - 1
+
+
+######################################################
+#### Plans robots in priority order against one reservation table.
+#### The heuristic for each goal is the true walking distance ignoring
+#### other robots (one BFS per goal, cached in a DistanceTable).
+######################################################
+class CooperativePlanner:
+    def __init__(self, maze, max_time=None):
+        self.grid = as_grid(maze)
+        self.table = ReservationTable(self.grid.rows * self.grid.cols)
+        self.distances = DistanceTable(self.grid)
+        self.max_time = max_time or 4 * (self.grid.rows + self.grid.cols)
+
+    def distance_to(self, goal):
+        self.distances.add(goal)
+        return self.distances.dist[goal]
+
+    ############################################################
+    #### Space-time A* from start (at time t0) toward goal.
+    #### Each step the robot moves E, W, S, N or waits; all cost 1, except
+    #### waiting on the goal which is free.
+    #### window=None: plan until the robot is on its goal and can stay there.
+    #### window=w: plan exactly w steps and stop at the state with the best
+    #### g + h (windowed HCA*); only those w steps are reserved.
+    #### Returns the list of cells from t0 on, or None.
+    ############################################################
+    def search(self, start, goal, t0=0, window=None):
+        grid, table = self.grid, self.table
+        rows, cols, walkable = grid.rows, grid.cols, grid.open
+        source, target = grid.index(start), grid.index(goal)
+        dist = self.distance_to(goal)
+        if dist[source] < 0 or not table.is_free(source, t0):
+            return None
+        if window is None and target in table.parked:
+            return None     # another robot ends its route on this goal
+
+        horizon = t0 + (window if window is not None else self.max_time)
+        size = table.size
+        g = {t0 * size + source: 0}
+        parent = {t0 * size + source: -1}
+        heap = [(dist[source], 0, t0, source)]
+        closed = set()
+
+        while heap:
+            _, cost, t, cell = heapq.heappop(heap)
+            key = t * size + cell
+            if key in closed:
+                continue
+            closed.add(key)
+
+            if window is not None:
+                done = t == horizon
+            else:
+                done = cell == target and t >= table.last_used.get(cell, -1)
+            if done:
+                cells = []
+                while key != -1:
+                    cells.append(key % size)
+                    key = parent[key]
+                cells.reverse()
+                return cells
+
+            if t >= horizon:
+                continue
+
+            r, c = divmod(cell, cols)
+            for nr, nc, n in ((r, c, cell), (r, c + 1, cell + 1), (r, c - 1, cell - 1),
+                              (r + 1, c, cell + cols), (r - 1, c, cell - cols)):
+                if not (0 <= nr < rows and 0 <= nc < cols and walkable[n]) or dist[n] < 0:
+                    continue
+                if not table.is_free(n, t + 1) or not table.move_free(cell, n, t):
+                    continue
+                step = 0 if n == cell == target else 1
+                n_key = (t + 1) * size + n
+                new_cost = cost + step
+                if n_key not in closed and new_cost < g.get(n_key, float("inf")):
+                    g[n_key] = new_cost
+                    parent[n_key] = key
+                    heapq.heappush(heap, (new_cost + dist[n], new_cost, t + 1, n))
+        return None
+
+    ############################################################
+    #### Cooperative A*: plan every robot to its goal, in the given order,
+    #### each one avoiding the paths already reserved.
+    #### robots is a list of (start, goal). Returns one timed path per
+    #### robot (positions at t = 0, 1, 2, ...) or None if it found none.
+    ############################################################
+    def plan(self, robots):
+        grid = self.grid
+        self.table.clear()
+        paths = []
+        for start, goal in robots:
+            cells = self.search(tuple(start), tuple(goal))
+            if cells is None:
+                paths.append(None)
+                continue
+            self.table.reserve(cells)
+            paths.append([grid.pos(cell) for cell in cells])
+        return paths
+
+    ############################################################
+    #### Windowed HCA*: every tick, replan all robots for the next
+    #### `window` steps (rotating who goes first), then let them walk
+    #### `window // 2` steps. Runs until everyone is on their goal or
+    #### max_time steps have passed. Returns one timed path per robot.
+    ############################################################
+    def plan_windowed(self, robots, window=8):
+        grid = self.grid
+        positions = [tuple(start) for start, _ in robots]
+        goals = [tuple(goal) for _, goal in robots]
+        paths = [[pos] for pos in positions]
+        advance = max(1, window // 2)
+        t = 0
+        tick = 0
+
+        while t < self.max_time and any(p != goal for p, goal in zip(positions, goals)):
+            self.plan_tick(positions, goals, t, window, tick)
+            for i, cells in enumerate(self.tick_paths):
+                for cell in cells[1:advance + 1]:
+                    paths[i].append(grid.pos(cell))
+                positions[i] = paths[i][-1]
+            t += advance
+            tick += 1
+        return paths
+
+    ############################################################
+    #### One planning tick for all robots (usable on its own by a
+    #### controller that runs the robots in real time).
+    #### A robot boxed in by robots planned before it is moved to the
+    #### front of the order and the tick is planned again; robots whose
+    #### goal cannot be reached at all go first and just wait.
+    ############################################################
+    def plan_tick(self, positions, goals, t, window=8, tick=0):
+        count = len(positions)
+        stuck = [i for i in range(count) if self.distance_to(goals[i])[self.grid.index(positions[i])] < 0]
+        order = stuck + [(k + tick) % count for k in range(count) if (k + tick) % count not in stuck]
+        for attempt in range(count + 1):
+            failed = self.plan_order(positions, goals, t, window, order, len(stuck), attempt < count)
+            if failed is None:
+                break
+            order.remove(failed)
+            order.insert(len(stuck), failed)
+        return self.tick_paths
+
+    ############################################################
+    #### Plan the robots in `order` for one window. The first `fixed`
+    #### robots (and any robot when strict=False) wait in place if no
+    #### plan is found; otherwise the failing robot's index is returned.
+    ############################################################
+    def plan_order(self, positions, goals, t, window, order, fixed=0, strict=True):
+        grid, table = self.grid, self.table
+        table.clear()
+        self.tick_paths = [None] * len(positions)
+
+        #### Everyone's current cell is taken right now
+        for pos in positions:
+            table.vertices.add(t * table.size + grid.index(pos))
+
+        for k, i in enumerate(order):
+            source = grid.index(positions[i])
+            table.vertices.discard(t * table.size + source)
+            cells = None if k < fixed else self.search(positions[i], goals[i], t, window)
+            if cells is None:
+                if strict and k > fixed:
+                    return i
+                cells = [source] * (window + 1)
+            table.reserve(cells, t, park=False)
+            self.tick_paths[i] = cells
+        return None
@@ -0,0 +1,127 @@
+#######################################################
+#### Adam Syed and Teagan Clark
+#### 11/24/25
+#### Purpose: Precomputed distance and next-hop tables for the fixed
+#### ward drop-off points, so ward-to-ward legs are answered by lookup
+#### instead of a fresh search per leg.
+#######################################################
+from array import array
+
+from routing import Leg, algorithm_key, as_grid, manhattan
+
+#### Maps with more cells than this are better routed without a table:
+#### building it is one breadth-first search of the whole map per point
+TABLE_CELL_LIMIT = 10000
+
+
+######################################################
+#### One breadth-first search is run *from* every drop-off point.
+#### Every move costs 1 unit, so BFS gives exact distances. The BFS
+#### parent of a cell is its next hop toward that drop-off, which means
+#### the table also answers legs that start anywhere on the map, as
+#### long as they end at a drop-off point.
+#### Memory is two int arrays of rows * cols per drop-off point.
+######################################################
+class DistanceTable:
+    def __init__(self, maze, points=()):
+        self.grid = as_grid(maze)
+        self.version = self.grid.version
+        self.dist = {}
+        self.next_hop = {}
+        for point in points:
+            self.add(point)
+
+    def __contains__(self, point):
+        return tuple(point) in self.dist
+
+    ############################################################
+    #### Single-source search from one drop-off point.
+    #### dist[cell] = steps from cell to the point (-1 if unreachable)
+    #### next_hop[cell] = the neighbour one step closer to the point
+    ############################################################
+    def add(self, point):
+        point = tuple(point)
+        if point in self.dist:
+            return
+
+        grid = self.grid
+        rows, cols, walkable = grid.rows, grid.cols, grid.open
+        dist = array("i", [-1]) * (rows * cols)
+        next_hop = array("i", [-1]) * (rows * cols)
+
+        if grid.is_open(point):
+            source = grid.index(point)
+            dist[source] = 0
+            frontier = [source]
+            steps = 0
+            while frontier:
+                steps += 1
+                next_frontier = []
+                for current in frontier:
+                    r, c = divmod(current, cols)
+                    for nr, nc, n in ((r, c + 1, current + 1), (r, c - 1, current - 1),
+                                      (r + 1, c, current + cols), (r - 1, c, current - cols)):
+                        if 0 <= nr < rows and 0 <= nc < cols and walkable[n] and dist[n] == -1:
+                            dist[n] = steps
+                            next_hop[n] = current
+                            next_frontier.append(n)
+                frontier = next_frontier
+
+        self.dist[point] = dist
+        self.next_hop[point] = next_hop
+
+    ############################################################
+    #### Exact number of moves from start to goal, or None when the goal
+    #### cannot be reached. goal must be one of the table's points.
+    ############################################################
+    def distance(self, start, goal):
+        if not self.grid.is_open(start):
+            return None
+        d = self.dist[tuple(goal)][self.grid.index(start)]
+        return None if d < 0 else d
+
+    ############################################################
+    #### Unroll the next-hop chain from start to goal.
+    #### Like Leg.path, the start cell itself is not included.
+    ############################################################
+    def path(self, start, goal):
+        if self.distance(start, goal) is None:
+            return None
+
+        grid = self.grid
+        next_hop = self.next_hop[tuple(goal)]
+        target = grid.index(goal)
+        current = grid.index(start)
+        path = []
+        while current != target:
+            current = next_hop[current]
+            path.append(grid.pos(current))
+        return path
+
+    ############################################################
+    #### Same Leg that routing.search() would return for A* or Dijkstra
+    #### (same cost and labels; ties may be broken differently)
+    ############################################################
+    def leg(self, start, goal, algorithm="A*"):
+        start, goal = tuple(start), tuple(goal)
+        path = self.path(start, goal)
+        if path is None:
+            return None
+
+        use_h = algorithm_key(algorithm) != "dijkstra"
+        labels = [(step, manhattan(pos, goal) if use_h else 0) for step, pos in enumerate(path, 1)]
+        return Leg(start, goal, path, labels)
+
+    ############################################################
+    #### Leg to whichever of goals is closest to start (all of goals must
+    #### be table points). Ties go to the first goal listed.
+    ############################################################
+    def nearest_leg(self, start, goals, algorithm="A*"):
+        best, best_goal = None, None
+        for goal in goals:
+            d = self.distance(start, goal)
+            if d is not None and (best is None or d < best):
+                best, best_goal = d, goal
+        if best_goal is None:
+            return None
+        return self.leg(start, best_goal, algorithm)
@@ -0,0 +1,193 @@
+#######################################################
+#### Adam Syed and Teagan Clark
+#### 11/24/25
+#### Purpose: Incremental replanning with D* Lite.
+#### The planner keeps its search tree between queries. When the robot
+#### moves or a few cells open/close (a ward door shuts, a corridor is
+#### blocked), only the part of the tree those changes affect is
+#### repaired, instead of a full reset and a new search from scratch.
+#######################################################
+import heapq
+
+from routing import Leg, as_grid
+
+INF = float("inf")
+
+#### D* Lite planners planner_for() keeps per grid
+MAX_PLANNERS = 16
+
+
+######################################################
+#### D* Lite searches backwards from the goal (or several goal cells,
+#### e.g. the drop-offs of one ward), so moving the robot
+#### (the start) does not invalidate anything already computed.
+####   g(s)   - current distance estimate from s to the goal
+####   rhs(s) - one-step lookahead: min over neighbours s' of g(s') + 1
+#### A cell is consistent when g == rhs; only inconsistent cells are
+#### on the heap. The heap uses lazy deletion like routing.OpenSet.
+######################################################
+class DStarLite:
+    def __init__(self, maze, start, *goals):
+        self.grid = as_grid(maze)
+        self.start = tuple(start)
+        self.goals = {tuple(goal) for goal in goals}
+        self.goal = tuple(goals[0])
+        self.restart()
+
+    #### Drop the search tree and seed the heap with the goal cells again
+    def restart(self):
+        self.last = self.start
+        self.km = 0
+        self.g = {}
+        self.rhs = {}
+        self.heap = []
+        self.expanded = 0
+        self.version = self.grid.version
+        for goal in self.goals:
+            self.update_vertex(goal)
+
+    def heuristic(self, a, b):
+        return abs(a[0] - b[0]) + abs(a[1] - b[1])
+
+    def key(self, s):
+        best = min(self.g.get(s, INF), self.rhs.get(s, INF))
+        return (best + self.heuristic(self.start, s) + self.km, best)
+
+    #### Open 4-connected neighbours; a closed cell has no edges at all
+    def neighbours(self, s):
+        grid = self.grid
+        if not grid.is_open(s):
+            return []
+        r, c = s
+        return [n for n in ((r, c + 1), (r, c - 1), (r + 1, c), (r - 1, c)) if grid.is_open(n)]
+
+    def update_vertex(self, s):
+        if s in self.goals:
+            self.rhs[s] = 0 if self.grid.is_open(s) else INF
+        else:
+            self.rhs[s] = min((self.g.get(n, INF) + 1 for n in self.neighbours(s)), default=INF)
+        if self.g.get(s, INF) != self.rhs.get(s, INF):
+            heapq.heappush(self.heap, (self.key(s), s))
+
+    #### Smallest key of an inconsistent cell (stale entries are dropped)
+    def top_key(self):
+        heap, g, rhs = self.heap, self.g, self.rhs
+        while heap and g.get(heap[0][1], INF) == rhs.get(heap[0][1], INF):
+            heapq.heappop(heap)
+        return heap[0][0] if heap else (INF, INF)
+
+    def compute_shortest_path(self):
+        g, rhs = self.g, self.rhs
+        while self.top_key() < self.key(self.start) or rhs.get(self.start, INF) != g.get(self.start, INF):
+            if not self.heap:
+                break
+            old_key, u = heapq.heappop(self.heap)
+            if g.get(u, INF) == rhs.get(u, INF):
+                continue
+            new_key = self.key(u)
+            if old_key != new_key:
+                heapq.heappush(self.heap, (new_key, u))
+                continue
+
+            self.expanded += 1
+            if g.get(u, INF) > rhs.get(u, INF):
+                #### Overconsistent: settle u and tell its neighbours
+                g[u] = rhs[u]
+                for n in self.neighbours(u):
+                    self.update_vertex(n)
+            else:
+                #### Underconsistent: u got more expensive, recompute it and its neighbours
+                g[u] = INF
+                self.update_vertex(u)
+                for n in self.neighbours(u):
+                    self.update_vertex(n)
+
+    ############################################################
+    #### The robot has moved to pos. Only the heuristic offset km changes;
+    #### the search tree is kept.
+    ############################################################
+    def move_to(self, pos):
+        pos = tuple(pos)
+        self.km += self.heuristic(self.last, pos)
+        self.last = pos
+        self.start = pos
+
+    ############################################################
+    #### Open/close cells. changes maps (row, col) -> True for a wall and
+    #### False for open floor. The grid (and its maze) is updated and the
+    #### cells around each change are queued for repair.
+    ############################################################
+    def update_cells(self, changes):
+        for pos, wall in changes.items():
+            self.grid.set_wall(tuple(pos), wall)
+        self.catch_up()
+
+    ############################################################
+    #### Queue the cells around every wall change made since the last
+    #### query, whoever made it (see Grid.changes). If the grid no longer
+    #### remembers all of them, the tree is rebuilt from scratch.
+    ############################################################
+    def catch_up(self):
+        grid = self.grid
+        if self.version == grid.version:
+            return
+        missed = [pos for version, pos in grid.changes if version > self.version]
+        if len(missed) < grid.version - self.version:
+            self.restart()
+            return
+        self.version = grid.version
+
+        touched = set()
+        for r, c in missed:
+            touched.update([(r, c), (r, c + 1), (r, c - 1), (r + 1, c), (r - 1, c)])
+        for s in touched:
+            if 0 <= s[0] < grid.rows and 0 <= s[1] < grid.cols:
+                if not grid.is_open(s):
+                    self.g.pop(s, None)
+                self.update_vertex(s)
+
+    ############################################################
+    #### Repair the tree and return the current best Leg from the robot's
+    #### position to the nearest goal (None if every goal is cut off)
+    ############################################################
+    def replan(self, start=None, changes=None):
+        if start is not None and tuple(start) != self.start:
+            self.move_to(start)
+        if changes:
+            self.update_cells(changes)
+        self.catch_up()
+        self.compute_shortest_path()
+        return self.leg()
+
+    #### Follow the cheapest neighbour from the start down to a goal
+    def leg(self):
+        if self.g.get(self.start, INF) == INF and self.start not in self.goals:
+            return None
+        path = []
+        current = self.start
+        while current not in self.goals:
+            current = min(self.neighbours(current), key=lambda n: (self.g.get(n, INF), n))
+            if self.g.get(current, INF) == INF:
+                return None
+            path.append(current)
+        labels = [(step, self.heuristic(pos, current)) for step, pos in enumerate(path, 1)]
+        return Leg(self.start, current, path, labels)
+
+
+############################################################
+#### The grid's planner for this set of targets, created on first use.
+#### Used for the "D* Lite" algorithm: every leg toward the same ward
+#### reuses the tree of the last one, and a wall change made with
+#### Grid.set_wall() in between is repaired instead of searched again.
+#### Only the most recently used planners are kept.
+############################################################
+def planner_for(grid, start, goals):
+    key = tuple(sorted(set(map(tuple, goals))))
+    planner = grid.planners.get(key)
+    if planner is None:
+        planner = grid.planners[key] = DStarLite(grid, start, *key)
+        while len(grid.planners) > MAX_PLANNERS:
+            grid.planners.popitem(last=False)
+    else:
+        grid.planners.move_to_end(key)
+    return planner
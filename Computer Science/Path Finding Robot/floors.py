@@ -0,0 +1,246 @@
+#######################################################
+#### Adam Syed and Teagan Clark
+#### 11/24/25
+#### Purpose: Multi-floor buildings. Each floor is its own maze, joined
+#### to other floors by declared transition cells (elevators, stairs)
+#### that cost more than a corridor step. Floors are only loaded when a
+#### route actually needs them.
+#######################################################
+import heapq
+
+from distances import DistanceTable
+from routing import Leg, as_grid, search
+
+
+######################################################
+#### A one-way move from a cell on one floor to a cell on another.
+#### Building.add_transition() adds both directions by default.
+######################################################
+class Transition:
+    def __init__(self, from_floor, from_pos, to_floor, to_pos, cost, kind="elevator"):
+        #### Same-floor shortcuts would make the Manhattan estimate too optimistic
+        if from_floor == to_floor:
+            raise ValueError(f"transition must join two different floors, got floor {from_floor} twice")
+        self.from_floor = from_floor
+        self.from_pos = tuple(from_pos)
+        self.to_floor = to_floor
+        self.to_pos = tuple(to_pos)
+        self.cost = cost
+        self.kind = kind
+
+
+######################################################
+#### A loaded floor: its grid plus exact distances to every transition
+#### cell on it (one BFS per transition cell, see distances.py)
+######################################################
+class Floor:
+    def __init__(self, maze, exits):
+        self.grid = as_grid(maze)
+        self.table = DistanceTable(self.grid, exits)
+
+
+######################################################
+#### A route across floors: an ordered list of steps, each either
+#### ("walk", floor, Leg) or ("ride", Transition).
+#### cost = corridor steps + transition costs.
+######################################################
+class FloorRoute:
+    def __init__(self, start, goal, steps):
+        self.start = start
+        self.goal = goal
+        self.steps = steps
+
+    @property
+    def segments(self):
+        return [(step[1], step[2]) for step in self.steps if step[0] == "walk"]
+
+    @property
+    def transitions(self):
+        return [step[1] for step in self.steps if step[0] == "ride"]
+
+    @property
+    def cost(self):
+        return sum(leg.cost for _, leg in self.segments) + sum(t.cost for t in self.transitions)
+
+
+######################################################
+#### floors maps a floor id to its maze, or to a function that returns
+#### the maze; functions are only called the first time the floor is
+#### needed, so unused floors never take any memory.
+######################################################
+class Building:
+    def __init__(self, floors, transitions=()):
+        self.sources = dict(floors)
+        self.loaded = {}
+        self.exits = {}
+        for transition in transitions:
+            self.add_exit(transition)
+
+    def add_transition(self, floor_a, pos_a, floor_b, pos_b, cost, kind="elevator", both_ways=True):
+        self.add_exit(Transition(floor_a, pos_a, floor_b, pos_b, cost, kind))
+        if both_ways:
+            self.add_exit(Transition(floor_b, pos_b, floor_a, pos_a, cost, kind))
+
+    def add_exit(self, transition):
+        self.exits.setdefault(transition.from_floor, []).append(transition)
+        if transition.from_floor in self.loaded:
+            self.loaded[transition.from_floor].table.add(transition.from_pos)
+
+    #### Load a floor the first time it is used
+    def floor(self, floor_id):
+        if floor_id not in self.loaded:
+            source = self.sources[floor_id]
+            maze = source() if callable(source) else source
+            exits = [t.from_pos for t in self.exits.get(floor_id, [])]
+            self.loaded[floor_id] = Floor(maze, exits)
+        return self.loaded[floor_id]
+
+    ############################################################
+    #### Lower bound on the cost from every transition cell (before riding)
+    #### to the goal: Dijkstra backwards over the transitions, with every
+    #### walk on a floor counted as its Manhattan distance. A ride can land
+    #### on a different (row, col) than it left from, so leaving a floor and
+    #### coming back can beat walking across it; the bounds cover that too.
+    ############################################################
+    def transition_bounds(self, goal):
+        goal_floor, goal_pos = goal
+        arrivals = {}
+        for exits in self.exits.values():
+            for t in exits:
+                arrivals.setdefault(t.to_floor, []).append(t)
+
+        best = {}
+        heap = []
+        for t in arrivals.get(goal_floor, []):
+            best[t] = t.cost + abs(t.to_pos[0] - goal_pos[0]) + abs(t.to_pos[1] - goal_pos[1])
+            heap.append((best[t], id(t), t))
+        heapq.heapify(heap)
+        while heap:
+            cost, _, onward = heapq.heappop(heap)
+            if cost > best[onward]:
+                continue
+            for t in arrivals.get(onward.from_floor, []):
+                new_cost = cost + t.cost + abs(t.to_pos[0] - onward.from_pos[0]) + abs(t.to_pos[1] - onward.from_pos[1])
+                if new_cost < best.get(t, float("inf")):
+                    best[t] = new_cost
+                    heapq.heappush(heap, (new_cost, id(t), t))
+        return best
+
+    ############################################################
+    #### Admissible estimate from (floor, pos) to the goal: the smaller of
+    #### walking straight there (goal floor only) and walking to an exit
+    #### plus that exit's bound. Only the transition list is used, never
+    #### a floor's map, so estimating never loads a floor.
+    ############################################################
+    def heuristic(self, floor_id, pos, goal, bounds):
+        goal_floor, goal_pos = goal
+        best = float("inf")
+        if floor_id == goal_floor:
+            best = abs(pos[0] - goal_pos[0]) + abs(pos[1] - goal_pos[1])
+        for t in self.exits.get(floor_id, []):
+            if t in bounds:
+                best = min(best, abs(pos[0] - t.from_pos[0]) + abs(pos[1] - t.from_pos[1]) + bounds[t])
+        return best
+
+    ############################################################
+    #### Route from start to goal, both given as (floor, (row, col)).
+    #### A* over an abstract graph whose nodes are the start, the goal and
+    #### the transition cells. Walking to a transition cell is looked up in
+    #### that floor's distance table; walking to the goal is searched for
+    #### this query only, so the tables never grow with the goals asked
+    #### for. A floor is loaded only when the search expands a node on it.
+    ############################################################
+    def route(self, start, goal):
+        start = (start[0], tuple(start[1]))
+        goal = (goal[0], tuple(goal[1]))
+
+        bounds = self.transition_bounds(goal)
+        estimate = self.heuristic(start[0], start[1], goal, bounds)
+        if estimate == float("inf"):
+            return None
+
+        g = {start: 0}
+        parent = {start: None}
+        heap = [(estimate, 0, start)]
+        goal_legs = {}      # cell on the goal floor -> Leg walking from it to the goal
+
+        while heap:
+            _, cost, node = heapq.heappop(heap)
+            if cost > g[node]:
+                continue
+
+            if node == goal:
+                return self.build_route(start, goal, parent, goal_legs)
+
+            floor_id, pos = node
+            floor = self.floor(floor_id)
+            if not floor.grid.is_open(pos):
+                continue
+
+            moves = []
+
+            #### Ride a transition that starts right here
+            for t in self.exits.get(floor_id, []):
+                if t.from_pos == pos:
+                    moves.append(((t.to_floor, t.to_pos), t.cost, t))
+
+            #### Walk to the goal or to any exit on this floor
+            if floor_id == goal[0]:
+                if pos not in goal_legs:
+                    goal_legs[pos] = search(floor.grid, pos, goal[1])
+                leg = goal_legs[pos]
+                moves.append((goal, leg.cost if leg else None, None))
+            for t in self.exits.get(floor_id, []):
+                if t.from_pos != pos:
+                    moves.append(((floor_id, t.from_pos), floor.table.distance(pos, t.from_pos), None))
+
+            for n, step, transition in moves:
+                if step is None:
+                    continue
+                new_g = cost + step
+                if new_g < g.get(n, float("inf")):
+                    g[n] = new_g
+                    parent[n] = (node, transition)
+                    heapq.heappush(heap, (new_g + self.heuristic(n[0], n[1], goal, bounds), new_g, n))
+
+        return None
+
+    #### Unroll the abstract route into per-floor Legs and transitions
+    def build_route(self, start, goal, parent, goal_legs):
+        nodes = []
+        node = goal
+        while node is not None:
+            nodes.append(node)
+            node = parent[node][0] if parent[node] else None
+        nodes.reverse()
+
+        steps = []
+        walk = None     # (floor, start cell, cells) of the walk in progress
+        for a, b in zip(nodes, nodes[1:]):
+            transition = parent[b][1]
+            if transition is not None:
+                if walk:
+                    steps.append(walk_step(*walk))
+                    walk = None
+                steps.append(("ride", transition))
+                continue
+
+            #### Consecutive walks on one floor become a single Leg
+            if b == goal and a[1] in goal_legs:
+                path = goal_legs[a[1]].path
+            else:
+                path = self.floor(a[0]).table.path(a[1], b[1])
+            if walk:
+                walk[2].extend(path)
+            else:
+                walk = (a[0], a[1], list(path))
+
+        if walk:
+            steps.append(walk_step(*walk))
+        return FloorRoute(start, goal, steps)
+
+
+def walk_step(floor_id, start, path):
+    end = path[-1] if path else start
+    labels = [(step, abs(r - end[0]) + abs(c - end[1])) for step, (r, c) in enumerate(path, 1)]
+    return ("walk", floor_id, Leg(start, end, path, labels))
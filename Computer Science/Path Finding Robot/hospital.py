@@ -0,0 +1,241 @@
+#######################################################
+#### Adam Syed and Teagan Clark
+#### 11/24/25
+#### Purpose: Hospital map, ward tables and input file parsing for the
+#### path finding robot. Nothing in here needs a display.
+#######################################################
+
+
+############################################################
+#### Priority by ward code (2–13)
+############################################################
+ward_priority = {
+    2: 1,   # admissions
+    3: 2,   # general
+    4: 5,   # emergency
+    5: 4,   # maternity
+    6: 4,   # surgical
+    7: 5,   # oncology
+    8: 5,   # ICU
+    9: 1,   # isolation
+    10: 3,  # pediatric
+    11: 5,  # burn ward
+    12: 3,  # hematology
+    13: 2   # medical ward
+}
+
+############################################################
+#### Map ward *names* to the numeric codes used in the maze
+############################################################
+ward_codes = {
+    "ADMISSIONS": 2,
+    "GENERAL": 3,
+    "GENERAL WARD": 3,
+    "EMERGENCY": 4,
+    "ER": 4,
+    "MATERNITY": 5,
+    "MATERNITY WARD": 5,
+    "SURGICAL": 6,
+    "SURGICAL WARD": 6,
+    "ONCOLOGY": 7,
+    "ICU": 8,
+    "ISOLATION": 9,
+    "ISOLATION WARD": 9,
+    "PEDIATRIC": 10,
+    "PEDIATRIC WARD": 10,
+    "BURN": 11,
+    "BURN WARD": 11,
+    "HEMATOLOGY": 12,
+    "MEDICAL": 13,
+    "MEDICAL WARD": 13
+}
+
+############################################################
+#### Explicit ward → list of (row, col) locations
+############################################################
+ward_locations = {
+    2:  [(6, 27), (7, 28), (10, 28), (13, 28), (20, 10), (20, 11)],           # admissions (Multiple drop-offs)
+    3:  [(6, 6), (6, 7), (7, 5), (7, 18), (12, 7), (13, 7), (16, 14)],       # general
+    4:  [(7, 22), (8, 21), (11, 21), (12, 15), (13, 19), (14, 15), (14, 19)],# emergency
+    5:  [(5, 6), (5, 7), (6, 4)],                                            # maternity
+    6:  [(20, 19), (21, 18), (24, 18), (25, 21)],                            # surgical
+    7:  [(14, 7), (17, 6), (17, 17), (20, 6), (21, 21), (22, 5), (24, 4)],   # oncology
+    8:  [(15, 21), (18, 22)],                                                # ICU
+    9:  [(8, 4), (10, 5), (11, 19), (17, 15), (24, 2)],                      # isolation
+    10: [(22, 16), (23, 9), (25, 9)],                                        # pediatric
+    11: [(13, 10), (18, 10)],                                                 # burn ward
+    12: [(21, 13)],                                                          # hematology
+    13: [(25, 20), (25, 22)]                                                 # medical ward
+}
+
+############################################################
+#### Fill colour of each maze value (Tk colour names), used by the
+#### viewer and by the headless renderer
+############################################################
+CELL_COLORS = {
+    1: 'black',             # walls
+    0: 'white',             # floor
+    2: 'grey',              # admissions
+    3: 'red',               # general
+    4: 'yellow',            # emergency
+    5: 'blue',              # maternity ward
+    6: 'maroon',            # surgical ward
+    7: 'green',             # oncology
+    8: 'orange',            # ICU
+    9: 'lightskyblue1',     # isolation ward
+    10: 'olivedrab1',       # pediatric
+    11: 'purple',           # burn ward
+    12: 'orangered2',       # hematology
+    13: 'lawngreen',        # medical ward
+}
+
+#### One colour per trip, in the order the legs are driven
+PATH_COLORS = ['green', 'skyblue', 'orange', 'purple', 'yellow', 'pink']
+
+#### Every drop-off point of every ward
+def drop_off_points(wards=None):
+    _, _, locations = ward_tables(wards)
+    return [loc for locs in locations.values() for loc in locs]
+
+#### Default start state (will be overwritten if input file provides Start:)
+default_start = (8, 3)
+
+
+############################################################
+#### The (ward_priority, ward_codes, ward_locations) tables to use:
+#### the ones above, or those from a map file's metadata (mapfile.py)
+############################################################
+def ward_tables(wards=None):
+    if wards:
+        return wards["ward_priority"], wards["ward_codes"], wards["ward_locations"]
+    return ward_priority, ward_codes, ward_locations
+
+
+############################################################
+#### Start position for a "Start: <ward>" line: the first location of
+#### the ward, or agent_pos unchanged (with a warning) if it is unknown.
+#### Messages are printed to file (stdout by default).
+############################################################
+def start_position(line, agent_pos, wards=None, file=None):
+    _, codes, locations = ward_tables(wards)
+    start_name = line.split(":", 1)[1].strip().upper()
+    if start_name not in codes:
+        print(f"WARNING: Unknown start ward name in input file: '{line}' – using default start {agent_pos}", file=file)
+        return agent_pos
+
+    start_code = codes[start_name]
+    locs = locations.get(start_code, [])
+    if not locs:
+        print(f"WARNING: No locations mapped for start ward '{start_name}' – using default start {agent_pos}", file=file)
+        return agent_pos
+
+    # Use the first defined location for that start ward
+    print(f"Start location set to ward '{start_name}' at {locs[0]}", file=file)
+    return locs[0]
+
+
+############################################################
+#### Goal for one delivery ward name:
+#### (row, col, priority, ward name, locations), or None (with a warning)
+#### if the ward is unknown or has no drop-off. Warnings are printed to
+#### file (stdout by default).
+############################################################
+def ward_goal(line, agent_pos, wards=None, file=None):
+    priorities, codes, locations = ward_tables(wards)
+    ward_name = line.strip().upper()
+    if ward_name not in codes:
+        print(f"WARNING: Unknown ward name in input file: '{line}' – skipping.", file=file)
+        return None
+
+    ward_code = codes[ward_name]
+    priority = priorities.get(ward_code, 1)
+    locs = locations.get(ward_code, [])
+
+    if not locs:
+        print(f"WARNING: No locations mapped for ward '{ward_name}' – skipping.", file=file)
+        return None
+
+    # If ward has multiple drop-offs, keep them all: the router delivers to the one
+    # nearest to wherever the robot is by then, and tour.order_goals() scores the
+    # stops the same way. The Manhattan-nearest one to the start is only the
+    # position reported for the goal (e.g. when it cannot be reached).
+    best_loc = min(
+        locs,
+        key=lambda pos: abs(pos[0] - agent_pos[0]) + abs(pos[1] - agent_pos[1])
+    )
+
+    return (best_loc[0], best_loc[1], priority, ward_name, list(locs))
+
+
+############################################################
+#### Read algorithm + start ward + goal ward names from input file
+#### Returns (algorithm, start position, goal positions) where each goal
+#### is (row, col, priority, ward name, locations), sorted by priority
+#### (high first). locations lists every drop-off of the ward.
+#### wards replaces the tables above, e.g. the metadata of a map file
+#### (see mapfile.py).
+############################################################
+def read_input_file(input_filename, start=default_start, wards=None):
+    agent_pos = start
+
+    with open(input_filename, "r") as f:
+        # First line is the algorithm name
+        algorithm = f.readline().strip()
+
+        goal_positions = []
+        for line in f:
+            line = line.strip()
+            if not line:
+                continue
+
+            # Handle start line: "Start: Admissions"
+            if line.lower().startswith("start:"):
+                agent_pos = start_position(line, agent_pos, wards)
+                continue
+
+            # Otherwise, treat it as a delivery ward name
+            goal = ward_goal(line, agent_pos, wards)
+            if goal is not None:
+                goal_positions.append(goal)
+
+    # Sort by priority (high first)
+    goal_positions = sorted(goal_positions, key=lambda x: x[2], reverse=True)
+
+    return algorithm, agent_pos, goal_positions
+
+
+############################################################
+#### Maze definition
+############################################################
+maze = [
+    [0, 0, 1, 1, 1, 1, 1, 1, 1, 1, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0],
+    [0, 0, 1, 5, 5, 5, 5, 5, 5, 1, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0],
+    [0, 0, 1, 5, 5, 5, 5, 5, 5, 1, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0],
+    [0, 0, 1, 5, 5, 5, 5, 5, 5, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0],
+    [0, 0, 1, 5, 5, 5, 5, 5, 5, 1, 3, 3, 3, 3, 3, 3, 3, 3, 3, 1, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0],
+    [0, 0, 1, 5, 5, 5, 5, 5, 5, 1, 3, 3, 3, 3, 3, 3, 3, 3, 3, 1, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0],
+    [1, 1, 1, 1, 5, 1, 3, 3, 1, 1, 3, 3, 3, 3, 3, 3, 3, 3, 3, 1, 1, 1, 0, 1, 1, 1, 1, 0, 1, 0],
+    [1, 0, 0, 0, 0, 3, 3, 3, 3, 3, 3, 3, 3, 3, 3, 3, 3, 3, 3, 0, 0, 1, 4, 4, 4, 1, 2, 2, 2, 0],
+    [1, 0, 0, 0, 9, 1, 3, 3, 3, 3, 3, 3, 3, 3, 3, 3, 3, 1, 1, 1, 0, 4, 4, 4, 4, 1, 2, 2, 1, 0],
+    [1, 0, 0, 0, 1, 9, 1, 3, 3, 3, 3, 3, 3, 3, 3, 3, 3, 1, 9, 1, 0, 1, 4, 4, 4, 1, 2, 2, 1, 0],
+    [1, 0, 0, 0, 1, 9, 3, 3, 3, 3, 3, 3, 3, 3, 3, 3, 3, 1, 9, 1, 0, 1, 4, 4, 4, 1, 2, 2, 2, 0],
+    [1, 0, 0, 0, 1, 1, 1, 3, 3, 3, 3, 3, 3, 3, 3, 1, 1, 1, 9, 9, 0, 4, 4, 4, 4, 1, 2, 2, 1, 0],
+    [1, 0, 0, 0, 0, 0, 0, 3, 3, 3, 3, 3, 3, 3, 3, 4, 4, 1, 1, 1, 0, 1, 1, 1, 1, 1, 1, 1, 1, 0],
+    [1, 0, 0, 0, 0, 0, 0, 3, 3, 3, 3, 3, 3, 3, 3, 4, 4, 1, 4, 4, 0, 1, 8, 1, 2, 2, 2, 2, 2, 0],
+    [1, 0, 0, 0, 1, 1, 1, 7, 1, 1, 11, 1, 3, 3, 3, 4, 4, 1, 1, 4, 0, 1, 8, 1, 1, 1, 1, 1, 1, 0],
+    [1, 0, 0, 0, 1, 7, 7, 7, 1, 1, 11, 1, 3, 3, 3, 1, 1, 7, 7, 1, 0, 8, 8, 8, 8, 8, 8, 8, 1, 0],
+    [1, 0, 0, 0, 1, 7, 7, 1, 11, 11, 11, 1, 3, 3, 3, 1, 1, 7, 7, 1, 0, 1, 8, 8, 8, 8, 8, 8, 1, 0],
+    [1, 0, 0, 0, 1, 1, 7, 1, 1, 1, 11, 1, 1, 1, 0, 5, 1, 7, 1, 1, 0, 1, 1, 8, 8, 8, 8, 8, 1, 0],
+    [1, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 8, 8, 8, 8, 8, 8, 1, 0],
+    [1, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 1, 8, 8, 8, 8, 8, 1, 0],
+    [1, 1, 1, 0, 0, 1, 7, 7, 1, 1, 2, 2, 1, 1, 1, 1, 1, 0, 1, 6, 1, 0, 1, 1, 1, 1, 1, 1, 1, 1],
+    [1, 1, 1, 0, 0, 1, 7, 7, 7, 7, 1, 1, 12, 12, 12, 12, 1, 0, 6, 6, 1, 7, 7, 7, 7, 7, 7, 1, 1, 1],
+    [1, 1, 1, 0, 0, 7, 7, 7, 1, 1, 10, 10, 1, 1, 1, 1, 10, 0, 6, 6, 1, 7, 7, 7, 7, 7, 7, 1, 1, 1],
+    [1, 1, 0, 0, 0, 1, 1, 1, 10, 10, 10, 10, 10, 10, 10, 1, 10, 0, 6, 6, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1],
+    [1, 1, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 6, 6, 6, 6, 6, 6, 6, 6, 6, 6, 1, 1],
+    [1, 1, 9, 0, 7, 1, 10, 10, 10, 10, 10, 10, 10, 10, 10, 10, 10, 1, 6, 1, 13, 6, 13, 1, 6, 6, 6, 6, 1, 1],
+    [1, 1, 0, 0, 7, 1, 10, 10, 10, 10, 10, 10, 10, 10, 10, 10, 10, 1, 6, 1, 13, 13, 13, 1, 6, 6, 6, 6, 1, 1],
+    [1, 1, 0, 0, 0, 1, 10, 10, 10, 10, 10, 10, 10, 10, 10, 10, 10, 1, 6, 1, 13, 13, 13, 1, 6, 6, 6, 6, 1, 1],
+    [1, 1, 9, 9, 9, 1, 10, 10, 10, 10, 10, 10, 10, 10, 10, 10, 10, 1, 6, 1, 13, 13, 13, 1, 6, 6, 6, 6, 1, 1],
+    [1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1]
+]
@@ -0,0 +1,289 @@
+#######################################################
+#### Adam Syed and Teagan Clark
+#### 11/24/25
+#### Purpose: Hierarchical path finding (HPA*) for very large maps.
+#### The map is cut into square clusters. Once per map we find the
+#### entrances between neighbouring clusters (doorways, corridor
+#### openings) and the walking distance between every two entrances of
+#### the same cluster. A query then searches this small abstract graph
+#### and only refines the cluster segments the route actually uses.
+#######################################################
+import heapq
+import threading
+
+from routing import Leg, as_grid
+
+
+############################################################
+#### Cluster side length: about a third of the map on small maps,
+#### 32 cells on big floor plans
+############################################################
+def default_cluster_size(grid):
+    return min(32, max(8, max(grid.rows, grid.cols) // 3))
+
+
+#### Held while a graph is built, so threads sharing a grid cache
+#### (see server.worker_grid) build it once
+build_lock = threading.Lock()
+
+
+############################################################
+#### Abstract graph is cached on the grid so it is built once per map
+############################################################
+def hierarchy_for(maze, cluster_size=None):
+    grid = as_grid(maze)
+    size = cluster_size or default_cluster_size(grid)
+    key = ("hpa", size)
+    if key not in grid.cache:
+        with build_lock:
+            if key not in grid.cache:
+                grid.cache[key] = HierarchicalMap(grid, size)
+    return grid.cache[key]
+
+
+######################################################
+#### Abstract graph of cluster entrances.
+#### Nodes are cell indices; edges[node] is a list of (node, cost).
+######################################################
+class HierarchicalMap:
+    def __init__(self, maze, cluster_size=10):
+        self.grid = as_grid(maze)
+        self.size = cluster_size
+        self.edges = {}
+        self.cluster_nodes = {}
+
+        self.build_entrances()
+        for cluster, nodes in self.cluster_nodes.items():
+            self.connect_cluster(cluster, nodes)
+
+    def cluster_of(self, index):
+        r, c = divmod(index, self.grid.cols)
+        return r // self.size, c // self.size
+
+    #### (top, left, bottom, right) cell bounds of a cluster, bottom/right exclusive
+    def bounds(self, cluster):
+        top, left = cluster[0] * self.size, cluster[1] * self.size
+        return top, left, min(top + self.size, self.grid.rows), min(left + self.size, self.grid.cols)
+
+    def add_node(self, index):
+        if index not in self.edges:
+            self.edges[index] = []
+            self.cluster_nodes.setdefault(self.cluster_of(index), []).append(index)
+
+    ############################################################
+    #### Entrances: maximal runs of open cell pairs along each border
+    #### between two clusters. Short runs get one transition in the
+    #### middle, long runs one at each end.
+    ############################################################
+    def build_entrances(self):
+        grid, size = self.grid, self.size
+        rows, cols, walkable = grid.rows, grid.cols, grid.open
+
+        #### Horizontal borders: row r-1 above, row r below
+        for r in range(size, rows, size):
+            self.scan_border([((r - 1) * cols + c, r * cols + c) for c in range(cols)], walkable)
+
+        #### Vertical borders: column c-1 left, column c right
+        for c in range(size, cols, size):
+            self.scan_border([(r * cols + c - 1, r * cols + c) for r in range(rows)], walkable)
+
+    def scan_border(self, pairs, walkable):
+        run = []
+        for a, b in pairs + [(None, None)]:
+            if a is not None and walkable[a] and walkable[b] and \
+               (not run or self.cluster_of(a) == self.cluster_of(run[0][0])):
+                run.append((a, b))
+                continue
+
+            if run:
+                if len(run) < 6:
+                    transitions = [run[len(run) // 2]]
+                else:
+                    transitions = [run[0], run[-1]]
+                for x, y in transitions:
+                    self.add_node(x)
+                    self.add_node(y)
+                    self.edges[x].append((y, 1))
+                    self.edges[y].append((x, 1))
+            run = [(a, b)] if a is not None and walkable[a] and walkable[b] else []
+
+    ############################################################
+    #### Intra-cluster edges: walking distance between every two
+    #### entrances of a cluster, staying inside the cluster
+    ############################################################
+    def connect_cluster(self, cluster, nodes):
+        for node in nodes:
+            dist, _ = self.local_search(node, cluster)
+            for other in nodes:
+                if other != node and other in dist:
+                    self.edges[node].append((other, dist[other]))
+
+    ############################################################
+    #### Breadth-first search from source that never leaves the cluster.
+    #### Returns (distance, parent) dicts keyed by cell index.
+    ############################################################
+    def local_search(self, source, cluster, target=None):
+        top, left, bottom, right = self.bounds(cluster)
+        cols, walkable = self.grid.cols, self.grid.open
+        dist = {source: 0}
+        parent = {source: -1}
+        frontier = [source]
+        while frontier:
+            next_frontier = []
+            for current in frontier:
+                if current == target:
+                    return dist, parent
+                r, c = divmod(current, cols)
+                d = dist[current] + 1
+                for nr, nc, n in ((r, c + 1, current + 1), (r, c - 1, current - 1),
+                                  (r + 1, c, current + cols), (r - 1, c, current - cols)):
+                    if top <= nr < bottom and left <= nc < right and walkable[n] and n not in dist:
+                        dist[n] = d
+                        parent[n] = current
+                        next_frontier.append(n)
+            frontier = next_frontier
+        return dist, parent
+
+    ############################################################
+    #### Route from start to the nearest of goals.
+    #### 1) connect start and goals to the entrances of their clusters
+    #### 2) A* over the abstract graph, reaching the goals in order of
+    ####    abstract cost
+    #### 3) refine each candidate's abstract route into grid cells and
+    ####    smooth it; keep the shortest
+    #### A goal is a candidate until a smoothed path at most as long as
+    #### its Manhattan distance is found. Paths are near-optimal: they
+    #### are only forced through the cluster entrances, and smoothing
+    #### straightens most of those detours out again.
+    ############################################################
+    def search(self, start, goals):
+        grid = self.grid
+        start = tuple(start)
+        goals = [tuple(goal) for goal in goals if grid.is_open(goal)]
+        if not grid.is_open(start) or not goals:
+            return None
+
+        source = grid.index(start)
+        targets = {grid.index(goal) for goal in goals}
+
+        #### Temporary edges for this query only
+        extra = {}
+        start_cluster = self.cluster_of(source)
+        dist, _ = self.local_search(source, start_cluster)
+        extra[source] = [(n, dist[n]) for n in self.cluster_nodes.get(start_cluster, []) if n in dist and n != source]
+        for target in targets:
+            if target == source:
+                continue
+            cluster = self.cluster_of(target)
+            dist, _ = self.local_search(target, cluster)
+            for n in self.cluster_nodes.get(cluster, []):
+                if n in dist and n != target:
+                    extra.setdefault(n, []).append((target, dist[n]))
+            if cluster == start_cluster and source in dist:
+                extra[source].append((target, dist[source]))
+
+        best = None
+        for route in self.abstract_routes(source, targets, goals, extra):
+            path = self.smooth([start] + self.refine(route))
+            if best is None or len(path) < len(best):
+                best = path
+            #### No remaining goal can be reached in fewer steps than this
+            remaining = [goal for goal in goals if grid.index(goal) in targets]
+            if all(abs(start[0] - r) + abs(start[1] - c) >= len(best) - 1 for r, c in remaining):
+                break
+
+        if best is None:
+            return None
+        goal = best[-1]
+        path = best[1:]
+        labels = [(step, abs(r - goal[0]) + abs(c - goal[1])) for step, (r, c) in enumerate(path, 1)]
+        return Leg(start, goal, path, labels)
+
+    ############################################################
+    #### A* over the abstract graph. Yields the abstract route (a list of
+    #### node indices) to each target in order of abstract cost, taking it
+    #### out of targets as it is reached. The heuristic is the distance to
+    #### the nearest goal, which is consistent, so targets come off the
+    #### heap in order of their true abstract cost.
+    ############################################################
+    def abstract_routes(self, source, targets, goals, extra):
+        cols = self.grid.cols
+
+        def heuristic(index):
+            r, c = divmod(index, cols)
+            return min(abs(r - gr) + abs(c - gc) for gr, gc in goals)
+
+        g = {source: 0}
+        parent = {source: -1}
+        closed = set()
+        heap = [(heuristic(source), source)]
+        while heap and targets:
+            _, current = heapq.heappop(heap)
+            if current in closed:
+                continue
+            closed.add(current)
+
+            if current in targets:
+                targets.discard(current)
+                route = []
+                node = current
+                while node != -1:
+                    route.append(node)
+                    node = parent[node]
+                route.reverse()
+                yield route
+
+            for n, cost in self.edges.get(current, []) + extra.get(current, []):
+                new_g = g[current] + cost
+                if n not in closed and new_g < g.get(n, float("inf")):
+                    g[n] = new_g
+                    parent[n] = current
+                    heapq.heappush(heap, (new_g + heuristic(n), n))
+
+    #### Turn an abstract route into the cells walked after its first node
+    def refine(self, route):
+        grid = self.grid
+        indices = []
+        for a, b in zip(route, route[1:]):
+            cluster = self.cluster_of(a)
+            if cluster != self.cluster_of(b):
+                indices.append(b)
+                continue
+            _, parent = self.local_search(a, cluster, target=b)
+            segment = []
+            current = b
+            while current != a:
+                segment.append(current)
+                current = parent[current]
+            indices.extend(reversed(segment))
+        return [grid.pos(i) for i in indices]
+
+    ############################################################
+    #### Path smoothing: from each cell, look along the four straight
+    #### lines (up to one cluster side) for a later cell of the path that
+    #### is fewer steps away in a straight line than along the path, and
+    #### cut the path short through it. cells starts with the start cell.
+    ############################################################
+    def smooth(self, cells):
+        grid = self.grid
+        position = {cell: i for i, cell in enumerate(cells)}
+        smoothed = []
+        i = 0
+        while True:
+            smoothed.append(cells[i])
+            if i == len(cells) - 1:
+                return smoothed
+            best_gain, best_j, best_line = 0, i + 1, []
+            for dr, dc in ((0, 1), (0, -1), (1, 0), (-1, 0)):
+                r, c = cells[i]
+                line = []
+                for step in range(1, self.size + 1):
+                    r, c = r + dr, c + dc
+                    if not grid.is_open((r, c)):
+                        break
+                    line.append((r, c))
+                    j = position.get((r, c), -1)
+                    if j - i - step > best_gain:
+                        best_gain, best_j, best_line = j - i - step, j, line[:-1]
+            smoothed.extend(best_line)
+            i = best_j
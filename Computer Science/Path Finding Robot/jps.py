@@ -0,0 +1,201 @@
+#######################################################
+#### Adam Syed and Teagan Clark
+#### 11/24/25
+#### Purpose: Jump Point Search for uniform-cost grids.
+#### Instead of pushing every corridor cell onto the heap, JPS jumps in a
+#### straight line until something interesting happens (the goal, or a
+#### wall corner that creates a "forced" neighbour) and only pushes that
+#### jump point. Paths have the same cost as plain A*.
+####   diagonal=False: 4-connected moves (FindPath.py, A*Maze(1).py)
+####   diagonal=True:  8-connected moves with unit cost diagonals, corner
+####                   cutting allowed (A*Euclidean(2).py)
+#######################################################
+from routing import Leg, as_grid, new_open_set
+
+
+############################################################
+#### Multi-target Jump Point Search from start to the nearest of goals.
+#### Returns a Leg with every cell of the path (not just the jump
+#### points), or None when no goal can be reached.
+############################################################
+def jump_search(maze, start, goals, diagonal=False, state=None):
+    grid = as_grid(maze)
+    start = tuple(start)
+    goals = [tuple(goal) for goal in goals if grid.is_open(goal)]
+
+    if not grid.is_open(start) or not goals:
+        return None
+
+    rows, cols, walkable = grid.rows, grid.cols, grid.open
+    targets = {grid.index(goal) for goal in goals}
+
+    def is_open(r, c):
+        return 0 <= r < rows and 0 <= c < cols and walkable[r * cols + c] == 1
+
+    #### Manhattan for 4 moves, Chebyshev for 8 unit-cost moves
+    def heuristic(r, c):
+        if diagonal:
+            return min(max(abs(r - gr), abs(c - gc)) for gr, gc in goals)
+        return min(abs(r - gr) + abs(c - gc) for gr, gc in goals)
+
+    ############################################################
+    #### Walk from (r, c) in direction (dr, dc) until a jump point.
+    #### Returns the jump point (r, c) or None if the walk hits a wall.
+    ############################################################
+    def jump(r, c, dr, dc):
+        while True:
+            r += dr
+            c += dc
+            if not is_open(r, c):
+                return None
+            if r * cols + c in targets:
+                return r, c
+
+            if diagonal:
+                if dr and dc:
+                    #### Diagonal: forced neighbour behind a wall corner
+                    if (is_open(r - dr, c + dc) and not is_open(r - dr, c)) or \
+                       (is_open(r + dr, c - dc) and not is_open(r, c - dc)):
+                        return r, c
+                    #### Or a jump point along either straight component
+                    if jump(r, c, dr, 0) is not None or jump(r, c, 0, dc) is not None:
+                        return r, c
+                elif dc:
+                    if (is_open(r + 1, c + dc) and not is_open(r + 1, c)) or \
+                       (is_open(r - 1, c + dc) and not is_open(r - 1, c)):
+                        return r, c
+                else:
+                    if (is_open(r + dr, c + 1) and not is_open(r, c + 1)) or \
+                       (is_open(r + dr, c - 1) and not is_open(r, c - 1)):
+                        return r, c
+            else:
+                if dc:
+                    #### Horizontal: a side opens up that was walled behind us
+                    if (is_open(r - 1, c) and not is_open(r - 1, c - dc)) or \
+                       (is_open(r + 1, c) and not is_open(r + 1, c - dc)):
+                        return r, c
+                else:
+                    if (is_open(r, c - 1) and not is_open(r - dr, c - 1)) or \
+                       (is_open(r, c + 1) and not is_open(r - dr, c + 1)):
+                        return r, c
+                    #### Vertical moves stop wherever a horizontal jump would
+                    if jump(r, c, 0, 1) is not None or jump(r, c, 0, -1) is not None:
+                        return r, c
+
+    ############################################################
+    #### Directions worth exploring from (r, c) given the direction we
+    #### arrived from (pruned neighbours)
+    ############################################################
+    def directions(r, c, parent_index):
+        if parent_index == -1:
+            if diagonal:
+                return [(0, 1), (0, -1), (1, 0), (-1, 0), (1, 1), (1, -1), (-1, 1), (-1, -1)]
+            return [(0, 1), (0, -1), (1, 0), (-1, 0)]
+
+        pr, pc = divmod(parent_index, cols)
+        dr = (r > pr) - (r < pr)
+        dc = (c > pc) - (c < pc)
+
+        if not diagonal:
+            if dc:
+                return [(0, dc), (1, 0), (-1, 0)]
+            return [(dr, 0), (0, 1), (0, -1)]
+
+        found = []
+        if dr and dc:
+            found += [(dr, 0), (0, dc), (dr, dc)]
+            if is_open(r - dr, c + dc) and not is_open(r - dr, c):
+                found.append((-dr, dc))
+            if is_open(r + dr, c - dc) and not is_open(r, c - dc):
+                found.append((dr, -dc))
+        elif dc:
+            found.append((0, dc))
+            if is_open(r + 1, c + dc) and not is_open(r + 1, c):
+                found.append((1, dc))
+            if is_open(r - 1, c + dc) and not is_open(r - 1, c):
+                found.append((-1, dc))
+        else:
+            found.append((dr, 0))
+            if is_open(r + dr, c + 1) and not is_open(r, c + 1):
+                found.append((dr, 1))
+            if is_open(r + dr, c - 1) and not is_open(r, c - 1):
+                found.append((dr, -1))
+        return found
+
+    if state is None:
+        state = grid.search_state()
+    generation = state.reset()
+    stamp, closed, g, h, parent = state.stamp, state.closed, state.g, state.h, state.parent
+
+    source = grid.index(start)
+    stamp[source] = generation
+    g[source] = 0
+    h[source] = heuristic(*start)
+    parent[source] = -1
+
+    open_set = new_open_set(state)
+    open_set.push(h[source], source)
+
+    while True:
+        entry = open_set.pop()
+        if entry is None:
+            return None
+        current = entry[1]
+
+        #### Stop if a goal is reached
+        if current in targets:
+            return build_jump_leg(grid, start, current, state, diagonal)
+
+        r, c = divmod(current, cols)
+        for dr, dc in directions(r, c, parent[current]):
+            point = jump(r, c, dr, dc)
+            if point is None:
+                continue
+
+            n = point[0] * cols + point[1]
+            if closed[n] == generation:
+                continue
+
+            #### Jumps are straight lines, so their length is a simple distance
+            if diagonal:
+                new_g = g[current] + max(abs(point[0] - r), abs(point[1] - c))
+            else:
+                new_g = g[current] + abs(point[0] - r) + abs(point[1] - c)
+
+            if stamp[n] != generation or new_g < g[n]:
+                stamp[n] = generation
+                g[n] = new_g
+                h[n] = heuristic(*point)
+                parent[n] = current
+                open_set.push(new_g + h[n], n)
+
+
+############################################################
+#### Fill in the cells between consecutive jump points.
+#### A jump in a 4-connected search is always a straight line; an
+#### 8-connected jump is a straight or a diagonal line.
+############################################################
+def build_jump_leg(grid, start, target, state, diagonal=False):
+    parent = state.parent
+    points = []
+    current = target
+    while current != -1:
+        points.append(grid.pos(current))
+        current = parent[current]
+    points.reverse()
+
+    goal = points[-1]
+    path = []
+    for (r, c), (nr, nc) in zip(points, points[1:]):
+        dr = (nr > r) - (nr < r)
+        dc = (nc > c) - (nc < c)
+        while (r, c) != (nr, nc):
+            r += dr
+            c += dc
+            path.append((r, c))
+
+    if diagonal:
+        labels = [(step, max(abs(r - goal[0]), abs(c - goal[1]))) for step, (r, c) in enumerate(path, 1)]
+    else:
+        labels = [(step, abs(r - goal[0]) + abs(c - goal[1])) for step, (r, c) in enumerate(path, 1)]
+    return Leg(start, goal, path, labels)
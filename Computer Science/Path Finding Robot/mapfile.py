@@ -0,0 +1,160 @@
+#######################################################
+#### Adam Syed and Teagan Clark
+#### 11/24/25
+#### Purpose: Compact map files. A map is stored as a small header, a
+#### JSON metadata section (ward tables, default start) and the grid as
+#### one byte per cell (0 floor, 1 wall, 2-13 ward codes). The grid is
+#### memory-mapped on load, so even multi-million-cell floor plans open
+#### without building nested lists.
+####
+#### Usage: python mapfile.py <maze text file> <output .hmap>
+#######################################################
+import ast
+import json
+import mmap
+import struct
+import sys
+
+from routing import WALL, Grid
+
+#### magic, format version, rows, cols, metadata length in bytes
+HEADER = struct.Struct("<4sHIII")
+MAGIC = b"HMAP"
+FORMAT_VERSION = 1
+
+#### bytes.translate() table turning cell values into walkable flags
+OPEN_FLAGS = bytes(0 if value == WALL else 1 for value in range(256))
+
+
+######################################################
+#### An opened map file. cells is a read-only view straight onto the
+#### mapped file; nothing is copied until grid() or to_maze() is called.
+#### metadata holds ward_priority, ward_codes, ward_locations and
+#### default_start in the same shape as the tables in hospital.py.
+######################################################
+class MapFile:
+    def __init__(self, path):
+        self.path = path
+        with open(path, "rb") as f:
+            self.mmap = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+        magic, version, self.rows, self.cols, meta_size = HEADER.unpack_from(self.mmap, 0)
+        if magic != MAGIC:
+            self.mmap.close()
+            raise ValueError(f"{path} is not a map file")
+        if version != FORMAT_VERSION:
+            self.mmap.close()
+            raise ValueError(f"{path} has map format version {version}, expected {FORMAT_VERSION}")
+
+        start = HEADER.size + meta_size
+        end = start + self.rows * self.cols
+        if len(self.mmap) < end:
+            self.mmap.close()
+            raise ValueError(f"{path} is truncated: {self.rows}x{self.cols} grid needs {end} bytes")
+
+        self.metadata = decode_metadata(json.loads(self.mmap[HEADER.size:start].decode("utf-8")))
+        self.cells = memoryview(self.mmap)[start:end]
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def close(self):
+        self.cells.release()
+        self.mmap.close()
+
+    def value(self, pos):
+        return self.cells[pos[0] * self.cols + pos[1]]
+
+    ############################################################
+    #### Routing grid for this map. The walkable flags are one
+    #### translate() over the mapped bytes, with no Python loop per cell.
+    ############################################################
+    def grid(self):
+        return Grid(None, self.rows, self.cols, bytearray(self.cells.tobytes().translate(OPEN_FLAGS)))
+
+    #### List-of-lists maze, for the viewer and other code that indexes maze[r][c]
+    def to_maze(self):
+        cols = self.cols
+        return [self.cells[r * cols:(r + 1) * cols].tolist() for r in range(self.rows)]
+
+
+def load_map(path):
+    return MapFile(path)
+
+
+############################################################
+#### Write a map file. maze is a list of rows of cell values (0-255).
+#### metadata defaults to the hospital's own ward tables.
+############################################################
+def save_map(path, maze, metadata=None):
+    if metadata is None:
+        metadata = hospital_metadata()
+    rows, cols = len(maze), len(maze[0])
+    meta = json.dumps(encode_metadata(metadata), separators=(",", ":")).encode("utf-8")
+    with open(path, "wb") as f:
+        f.write(HEADER.pack(MAGIC, FORMAT_VERSION, rows, cols, len(meta)))
+        f.write(meta)
+        for row in maze:
+            if len(row) != cols:
+                raise ValueError(f"every maze row must have {cols} cells")
+            f.write(bytes(row))
+
+
+############################################################
+#### Read a maze written as a Python list of lists (the format used in
+#### hospital.py), optionally as "maze = [...]"
+############################################################
+def import_text(path):
+    with open(path, "r") as f:
+        text = f.read()
+    if "=" in text.split("[", 1)[0]:
+        text = text.split("=", 1)[1]
+    maze = ast.literal_eval(text.strip())
+    if not maze or not all(isinstance(row, list) and len(row) == len(maze[0]) for row in maze):
+        raise ValueError(f"{path} does not hold a rectangular list of rows")
+    return maze
+
+
+def hospital_metadata():
+    import hospital
+    return {
+        "ward_priority": hospital.ward_priority,
+        "ward_codes": hospital.ward_codes,
+        "ward_locations": hospital.ward_locations,
+        "default_start": hospital.default_start,
+    }
+
+
+#### JSON keys are always strings and JSON has no tuples; convert both ways
+def encode_metadata(metadata):
+    encoded = dict(metadata)
+    if "ward_priority" in encoded:
+        encoded["ward_priority"] = {str(k): v for k, v in encoded["ward_priority"].items()}
+    if "ward_locations" in encoded:
+        encoded["ward_locations"] = {str(k): [list(loc) for loc in v] for k, v in encoded["ward_locations"].items()}
+    if "default_start" in encoded:
+        encoded["default_start"] = list(encoded["default_start"])
+    return encoded
+
+
+def decode_metadata(metadata):
+    decoded = dict(metadata)
+    if "ward_priority" in decoded:
+        decoded["ward_priority"] = {int(k): v for k, v in decoded["ward_priority"].items()}
+    if "ward_locations" in decoded:
+        decoded["ward_locations"] = {int(k): [tuple(loc) for loc in v] for k, v in decoded["ward_locations"].items()}
+    if "default_start" in decoded:
+        decoded["default_start"] = tuple(decoded["default_start"])
+    return decoded
+
+
+if __name__ == "__main__":
+    if len(sys.argv) != 3:
+        print("Usage: python mapfile.py <maze text file> <output .hmap>")
+        sys.exit(1)
+    maze = import_text(sys.argv[1])
+    save_map(sys.argv[2], maze)
+    print(f"Wrote {len(maze)}x{len(maze[0])} map to {sys.argv[2]}")
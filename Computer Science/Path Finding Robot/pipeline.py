@@ -0,0 +1,69 @@
+#######################################################
+#### Adam Syed and Teagan Clark
+#### 11/24/25
+#### Purpose: Plan a trip's legs on a background thread. The worker runs
+#### routing.plan_legs() and hands every finished leg to the GUI thread
+#### through a queue, so the viewer can animate leg k while leg k+1 is
+#### still being searched and never blocks on a search itself. Each
+#### leg's search is recorded as the profiler's "search" phase.
+#######################################################
+import queue
+import threading
+
+from profiling import profiler
+from routing import plan_legs
+
+#### Marks the end of the worker's results
+DONE = object()
+
+
+######################################################
+#### planner = LegPlanner(grid, start, goals, "A*", table, cache)
+#### planner.start(); then poll planner.ready() from the GUI thread.
+#### ready() never blocks: it returns the (index, goal, leg, stats)
+#### tuples finished since the last call, and sets planner.finished once
+#### the last leg has been handed over. An error in the worker is raised
+#### again by ready(), in the GUI thread, once the legs finished before it
+#### have been returned; planner.finished is set when it is raised.
+######################################################
+class LegPlanner:
+    def __init__(self, maze, start, goals, algorithm="A*", table=None, cache=None):
+        self.goals = list(goals)
+        self.results = queue.Queue()
+        self.finished = False
+        self.error = None
+        self.thread = threading.Thread(target=self.run, args=(maze, start, algorithm, table, cache), daemon=True)
+
+    def start(self):
+        self.thread.start()
+
+    def run(self, maze, start, algorithm, table, cache):
+        try:
+            legs = plan_legs(maze, start, self.goals, algorithm, table, cache)
+            for index, goal in enumerate(self.goals):
+                with profiler.phase("search"):
+                    leg, stats = next(legs)
+                self.results.put((index, goal, leg, stats))
+        except Exception as error:
+            self.results.put(error)
+        finally:
+            self.results.put(DONE)
+
+    def ready(self):
+        items = []
+        while not self.finished and self.error is None:
+            try:
+                item = self.results.get_nowait()
+            except queue.Empty:
+                break
+            if item is DONE:
+                self.finished = True
+            elif isinstance(item, Exception):
+                self.error = item
+            else:
+                items.append(item)
+
+        if self.error is not None and not items:
+            self.finished = True
+            raise self.error
+        return items
@@ -0,0 +1,148 @@
+#######################################################
+#### Adam Syed and Teagan Clark
+#### 11/24/25
+#### Purpose: Opt-in profiling of the program's phases (setup, parse,
+#### draw, search, reconstruct). Each phase is timed with
+#### perf_counter(), can also be measured with tracemalloc, and one
+#### chosen phase can run under cProfile. A compact per-phase report is
+#### printed at the end of the run.
+####
+#### Enable with the environment variables
+####   ROBOT_PROFILE=1               phase timers
+####   ROBOT_PROFILE_MEMORY=1        tracemalloc peak per phase
+####   ROBOT_PROFILE_CPROFILE=draw   cProfile on one phase
+#### or the matching FindPath.py flags (--profile, --profile-memory,
+#### --cprofile PHASE).
+#######################################################
+import atexit
+import contextlib
+import cProfile
+import io
+import os
+import pstats
+import sys
+import threading
+import time
+import tracemalloc
+
+#### Rows of the cProfile listing shown in the report
+CPROFILE_ROWS = 15
+
+#### Shared do-nothing context for phases while profiling is off
+NO_PHASE = contextlib.nullcontext()
+
+
+######################################################
+#### Collects calls, total and worst time (and the tracemalloc peak
+#### above the phase's starting point) per phase name.
+#### Phases may nest, and may run on several threads at once (the
+#### viewer's planner thread records "search"). tracemalloc has one peak
+#### for the whole process, so every phase open at the time sees a
+#### peak: an inner phase's peak counts for the phase around it, and
+#### phases running together count each other's allocations.
+######################################################
+class Profiler:
+    def __init__(self):
+        self.enabled = False
+        self.memory = False
+        self.cprofile_phase = None
+        self.phases = {}        # name -> [calls, total seconds, max seconds, peak bytes]
+        self.profiles = {}      # name -> cProfile.Profile
+        self.open = []          # [start memory, highest memory seen] per open phase, on any thread
+        self.lock = threading.Lock()
+        self.pending = False    # something was measured since the last report
+
+    def enable(self, memory=False, cprofile_phase=None):
+        if not self.enabled:
+            atexit.register(self.report_at_exit)
+        self.enabled = True
+        self.memory = memory
+        self.cprofile_phase = cprofile_phase
+        if memory and not tracemalloc.is_tracing():
+            tracemalloc.start()
+
+    #### Context manager around one run of a phase
+    def phase(self, name):
+        if not self.enabled:
+            return NO_PHASE
+        return self.measure(name)
+
+    @contextlib.contextmanager
+    def measure(self, name):
+        frame = None
+        if self.memory:
+            with self.lock:
+                self.see_peak()
+                tracemalloc.reset_peak()
+                current = tracemalloc.get_traced_memory()[0]
+                frame = [current, current]
+                self.open.append(frame)
+
+        profile = None
+        if name == self.cprofile_phase:
+            profile = self.profiles.setdefault(name, cProfile.Profile())
+            profile.enable()
+
+        started = time.perf_counter()
+        try:
+            yield
+        finally:
+            elapsed = time.perf_counter() - started
+            if profile is not None:
+                profile.disable()
+
+            with self.lock:
+                peak_bytes = 0
+                if frame is not None:
+                    self.see_peak()
+                    self.open = [other for other in self.open if other is not frame]
+                    peak_bytes = frame[1] - frame[0]
+
+                entry = self.phases.setdefault(name, [0, 0.0, 0.0, 0])
+                entry[0] += 1
+                entry[1] += elapsed
+                entry[2] = max(entry[2], elapsed)
+                entry[3] = max(entry[3], peak_bytes)
+                self.pending = True
+
+    #### Fold tracemalloc's peak into every open phase (lock held)
+    def see_peak(self):
+        peak = tracemalloc.get_traced_memory()[1]
+        for frame in self.open:
+            frame[1] = max(frame[1], peak)
+
+    ############################################################
+    #### One line per phase, slowest total first, then the cProfile
+    #### listing of the chosen phase
+    ############################################################
+    def report(self):
+        lines = ["#### Profile (ms)",
+                 f"{'phase':<14}{'calls':>7}{'total':>11}{'mean':>10}{'max':>10}" +
+                 (f"{'peak KiB':>11}" if self.memory else "")]
+        for name, (calls, total, worst, peak) in sorted(self.phases.items(), key=lambda item: -item[1][1]):
+            line = f"{name:<14}{calls:>7}{total * 1000:>11.2f}{total * 1000 / calls:>10.3f}{worst * 1000:>10.3f}"
+            if self.memory:
+                line += f"{peak / 1024:>11.1f}"
+            lines.append(line)
+
+        for name, profile in self.profiles.items():
+            out = io.StringIO()
+            pstats.Stats(profile, stream=out).sort_stats("cumulative").print_stats(CPROFILE_ROWS)
+            lines.append(f"#### cProfile: {name}")
+            lines.append(out.getvalue().strip())
+        return "\n".join(lines)
+
+    def dump(self, stream=None):
+        print(self.report(), file=stream or sys.stderr)
+        self.pending = False
+
+    def report_at_exit(self):
+        if self.pending:
+            self.dump()
+
+
+profiler = Profiler()
+
+if os.environ.get("ROBOT_PROFILE") or os.environ.get("ROBOT_PROFILE_CPROFILE"):
+    profiler.enable(memory=bool(os.environ.get("ROBOT_PROFILE_MEMORY")),
+                    cprofile_phase=os.environ.get("ROBOT_PROFILE_CPROFILE") or None)
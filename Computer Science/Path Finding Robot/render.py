@@ -0,0 +1,247 @@
+#######################################################
+#### Adam Syed and Teagan Clark
+#### 11/24/25
+#### Purpose: Headless route images. Draws the maze colouring of
+#### draw_maze() and the coloured trips of reconstruct_path() straight to
+#### a PNG, or to an animated GIF of the robot walking the route, with
+#### PIL. No tkinter and no display are needed, so audit snapshots can be
+#### made in batch jobs on servers.
+####
+#### Usage: python render.py inputfile1.txt [inputfile2.txt ...] [--out-dir renders]
+####                         [--gif] [--scale 25] [--labels] [--map hospital.hmap] [--workers N]
+#######################################################
+import argparse
+import os
+from concurrent.futures import ProcessPoolExecutor
+
+from PIL import Image, ImageDraw
+
+from distances import TABLE_CELL_LIMIT, DistanceTable
+from hospital import CELL_COLORS, PATH_COLORS, default_start, drop_off_points, maze, read_input_file
+from mapfile import MapFile, load_map
+from routing import Grid, goal_targets, plan
+from tour import order_goals
+
+#### Pixels per cell, as in the viewer
+DEFAULT_SCALE = 25
+
+#### Marker colours, as in the viewer
+START_COLOR = 'lime green'
+GOAL_COLOR = 'firebrick'
+AGENT_COLOR = 'navy'
+
+#### GIF timing (ms), as in the viewer: one step, and the pause after each leg
+STEP_MS = 100
+LEG_PAUSE_MS = 500
+
+#### Labels (START, GOAL, g/h) are only drawn on cells at least this big
+LABEL_MIN = 20
+
+#### RGB of the Tk colour names used on the map (Tk uses the X11 colour table)
+X11_RGB = {
+    'black': (0, 0, 0),
+    'white': (255, 255, 255),
+    'grey': (190, 190, 190),
+    'red': (255, 0, 0),
+    'yellow': (255, 255, 0),
+    'blue': (0, 0, 255),
+    'maroon': (176, 48, 96),
+    'green': (0, 255, 0),
+    'orange': (255, 165, 0),
+    'lightskyblue1': (176, 226, 255),
+    'olivedrab1': (192, 255, 62),
+    'purple': (160, 32, 240),
+    'orangered2': (238, 64, 0),
+    'lawngreen': (124, 252, 0),
+    'skyblue': (135, 206, 235),
+    'pink': (255, 192, 203),
+    'lime green': (50, 205, 50),
+    'firebrick': (178, 34, 34),
+    'navy': (0, 0, 128),
+}
+
+#### Per-process renderer state, filled in by load_renderer()
+worker = {}
+
+
+######################################################
+#### Renders routes on one map. The map itself is turned into a
+#### palette image with one pixel per cell once; every route image is a
+#### copy of it with the trips drawn in, scaled up with nearest-neighbour
+#### resampling. cells holds one value per cell, row by row.
+######################################################
+class RouteRenderer:
+    def __init__(self, cells, rows, cols, scale=DEFAULT_SCALE, labels=False):
+        self.rows = rows
+        self.cols = cols
+        self.scale = scale
+        self.labels = labels and scale >= LABEL_MIN
+
+        #### One palette entry per colour name; cell values are mapped onto it
+        names = list(dict.fromkeys(list(CELL_COLORS.values()) + ['white'] + PATH_COLORS +
+                                   [START_COLOR, GOAL_COLOR, AGENT_COLOR]))
+        self.color = {name: index for index, name in enumerate(names)}
+        palette = [level for name in names for level in X11_RGB[name]]
+        table = bytes(self.color[CELL_COLORS.get(value, 'white')] for value in range(256))
+
+        self.base = Image.frombytes("P", (cols, rows), bytes(cells).translate(table))
+        self.base.putpalette(palette)
+
+    ############################################################
+    #### Start and goal markers, as draw_maze() sets them. Returns the
+    #### one-pixel-per-cell image to draw on and the labels so far.
+    ############################################################
+    def start_image(self, route):
+        image = self.base.copy()
+        draw = ImageDraw.Draw(image)
+        labels = {}
+        draw.point([(route.start[1], route.start[0])], fill=self.color[START_COLOR])
+        labels[tuple(route.start)] = ('START', 'black')
+        for goal in route.goals:
+            for r, c in goal_targets(goal):
+                draw.point([(c, r)], fill=self.color[GOAL_COLOR])
+                labels[(r, c)] = ('GOAL', 'white')
+        return image, draw, labels
+
+    #### The whole route at once: every completed leg in its trip colour
+    def render(self, route):
+        image, draw, labels = self.start_image(route)
+        agent = tuple(route.start)
+        trip = 0
+        for leg in route.legs:
+            if leg is None:
+                continue
+            color = self.color[PATH_COLORS[trip % len(PATH_COLORS)]]
+            trip += 1
+            draw.point([(c, r) for r, c in leg.path], fill=color)
+            if self.labels:
+                for cell, (g, h) in zip(leg.path, leg.labels):
+                    labels[cell] = (f'g={g}\nh={h}', 'black')
+            agent = leg.goal
+        return self.finish(image, labels, agent)
+
+    ############################################################
+    #### The route walked one step per frame, like the viewer animates
+    #### it. Yields (image, duration in ms); the last step of every leg
+    #### is held for the pause between legs.
+    ############################################################
+    def frames(self, route):
+        image, draw, labels = self.start_image(route)
+        yield self.finish(image.copy(), labels, route.start), STEP_MS
+        trip = 0
+        for leg in route.legs:
+            if leg is None:
+                continue
+            color = self.color[PATH_COLORS[trip % len(PATH_COLORS)]]
+            trip += 1
+            for step, (cell, (g, h)) in enumerate(zip(leg.path, leg.labels)):
+                draw.point([(cell[1], cell[0])], fill=color)
+                if self.labels:
+                    labels[cell] = (f'g={g}\nh={h}', 'black')
+                last = step == len(leg.path) - 1
+                yield self.finish(image.copy(), labels, cell), STEP_MS + (LEG_PAUSE_MS if last else 0)
+
+    #### Put the agent on, scale up and write the labels
+    def finish(self, image, labels, agent):
+        ImageDraw.Draw(image).point([(agent[1], agent[0])], fill=self.color[AGENT_COLOR])
+        scale = self.scale
+        if scale != 1:
+            image = image.resize((self.cols * scale, self.rows * scale), Image.NEAREST)
+        if self.labels:
+            draw = ImageDraw.Draw(image)
+            for (r, c), (text, color) in labels.items():
+                if (r, c) != tuple(agent):
+                    draw.multiline_text(((c + 0.5) * scale, (r + 0.5) * scale), text, fill=self.color[color],
+                                        anchor="mm", align="center")
+        return image
+
+    def save_png(self, route, path):
+        self.render(route).save(path)
+
+    def save_gif(self, route, path):
+        frames, durations = [], []
+        for image, duration in self.frames(route):
+            frames.append(image)
+            durations.append(duration)
+        frames[0].save(path, save_all=True, append_images=frames[1:], duration=durations, loop=0)
+
+
+############################################################
+#### Renderer for a list-of-lists maze or an open MapFile
+############################################################
+def renderer_for(maze, scale=DEFAULT_SCALE, labels=False):
+    if isinstance(maze, MapFile):
+        return RouteRenderer(maze.cells, maze.rows, maze.cols, scale, labels)
+    return RouteRenderer(bytes(v for row in maze for v in row), len(maze), len(maze[0]), scale, labels)
+
+
+############################################################
+#### Process pool initializer: open the map, build the routing grid,
+#### the drop-off table and the renderer once per worker
+############################################################
+def load_renderer(map_path=None, scale=DEFAULT_SCALE, labels=False):
+    source, wards = maze, None
+    if map_path:
+        source = load_map(map_path)
+        wards = source.metadata
+    grid = source.grid() if isinstance(source, MapFile) else Grid(source)
+    worker["map"] = source
+    worker["grid"] = grid
+    worker["wards"] = wards
+    worker["table"] = DistanceTable(grid, drop_off_points(wards)) if grid.rows * grid.cols <= TABLE_CELL_LIMIT else None
+    worker["renderer"] = renderer_for(source, scale, labels)
+
+
+############################################################
+#### Plan one input file the way the viewer does and write its image.
+#### Returns the output path.
+############################################################
+def render_file(job):
+    input_filename, output = job
+    grid, wards, table = worker["grid"], worker["wards"], worker["table"]
+    start = wards.get("default_start", default_start) if wards else default_start
+    algorithm, start, goals = read_input_file(input_filename, start, wards)
+    goals = order_goals(grid, start, goals, algorithm, table)
+    route = plan(grid, start, goals, algorithm, table)
+
+    if output.lower().endswith(".gif"):
+        worker["renderer"].save_gif(route, output)
+    else:
+        worker["renderer"].save_png(route, output)
+    return output
+
+
+############################################################
+#### Render many input files, one image each, on a process pool.
+#### Every worker loads the map once. Yields output paths as they finish.
+############################################################
+def render_files(jobs, map_path=None, scale=DEFAULT_SCALE, labels=False, workers=None):
+    workers = workers or os.cpu_count() or 1
+    if workers == 1 or len(jobs) == 1:
+        load_renderer(map_path, scale, labels)
+        for job in jobs:
+            yield render_file(job)
+        return
+
+    with ProcessPoolExecutor(max_workers=workers, initializer=load_renderer,
+                             initargs=(map_path, scale, labels)) as pool:
+        yield from pool.map(render_file, jobs, chunksize=max(1, len(jobs) // (workers * 4)))
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Render routes to PNG or animated GIF without a display.")
+    parser.add_argument("inputs", nargs="+", help="input files, as given to FindPath.py")
+    parser.add_argument("--out-dir", default=".", help="directory for the images")
+    parser.add_argument("--gif", action="store_true", help="animated GIF of the robot walking instead of a PNG")
+    parser.add_argument("--scale", type=int, default=DEFAULT_SCALE, help="pixels per cell")
+    parser.add_argument("--labels", action="store_true", help="write START, GOAL and g/h on the cells")
+    parser.add_argument("--map", help="map file to draw (see mapfile.py); default is the built-in hospital")
+    parser.add_argument("--workers", type=int)
+    args = parser.parse_args()
+
+    os.makedirs(args.out_dir, exist_ok=True)
+    extension = ".gif" if args.gif else ".png"
+    jobs = [(name, os.path.join(args.out_dir, os.path.splitext(os.path.basename(name))[0] + extension))
+            for name in args.inputs]
+    for output in render_files(jobs, args.map, args.scale, args.labels, args.workers):
+        print(output)
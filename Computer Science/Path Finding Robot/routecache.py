@@ -0,0 +1,95 @@
+#######################################################
+#### Adam Syed and Teagan Clark
+#### 11/24/25
+#### Purpose: Bounded LRU cache of computed legs. Deliveries repeat a lot
+#### (Admissions to ICU, ER to Surgical, ...), so a leg that was already
+#### searched on the same map is handed back from a dictionary instead
+#### of being searched again.
+#######################################################
+import hashlib
+import threading
+from collections import OrderedDict
+
+from routing import algorithm_key, as_grid
+
+DEFAULT_MAX_ENTRIES = 4096
+
+
+############################################################
+#### Fingerprint of a map's walls. Stored in grid.cache, which
+#### Grid.set_wall() clears, so it is only recomputed after a change.
+############################################################
+def map_hash(maze):
+    grid = as_grid(maze)
+    if "map_hash" not in grid.cache:
+        digest = hashlib.blake2b(digest_size=16)
+        digest.update(f"{grid.rows}x{grid.cols}:".encode())
+        digest.update(bytes(grid.open))
+        grid.cache["map_hash"] = digest.hexdigest()
+    return grid.cache["map_hash"]
+
+
+######################################################
+#### Legs keyed on (start cell, target cells, algorithm, map hash).
+#### A changed map has a new hash, so legs planned on the old map are
+#### never returned again; they just age out of the LRU order.
+#### All methods take one lock, so a cache can be shared by threads.
+#### Cached Legs are shared between callers and must not be modified.
+######################################################
+class RouteCache:
+    def __init__(self, max_entries=DEFAULT_MAX_ENTRIES):
+        self.max_entries = max_entries
+        self.entries = OrderedDict()
+        self.lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def __len__(self):
+        return len(self.entries)
+
+    def key(self, maze, start, targets, algorithm):
+        return (tuple(start), tuple(sorted(tuple(t) for t in targets)), algorithm_key(algorithm), map_hash(maze))
+
+    ############################################################
+    #### Cached leg from start to the nearest of targets, or compute()'s
+    #### result (stored for next time) on a miss. Unreachable goals are
+    #### cached too, as None.
+    ############################################################
+    def leg(self, maze, start, targets, algorithm, compute):
+        key = self.key(maze, start, targets, algorithm)
+        with self.lock:
+            if key in self.entries:
+                self.entries.move_to_end(key)
+                self.hits += 1
+                return self.entries[key]
+            self.misses += 1
+
+        #### Searched outside the lock so other threads are not held up
+        leg = compute()
+
+        with self.lock:
+            self.entries[key] = leg
+            self.entries.move_to_end(key)
+            while len(self.entries) > self.max_entries:
+                self.entries.popitem(last=False)
+        return leg
+
+    #### Drop every entry (counters are kept)
+    def clear(self):
+        with self.lock:
+            self.entries.clear()
+
+    def stats(self):
+        with self.lock:
+            total = self.hits + self.misses
+            return {
+                "entries": len(self.entries),
+                "max_entries": self.max_entries,
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_rate": self.hits / total if total else 0.0,
+            }
+
+
+#### Cache shared by everything in this process that does not bring its own
+default_cache = RouteCache()
@@ -0,0 +1,559 @@
+#######################################################
+#### Adam Syed and Teagan Clark
+#### 11/24/25
+#### Purpose: Headless routing engine for the path finding robot.
+#### Computes paths and costs with A*, Dijkstra or Greedy Best-First
+#### without importing tkinter, so routes can be planned on servers
+#### with no display. MazeGame in FindPath.py only draws the result.
+#######################################################
+import heapq
+import time
+from array import array
+from collections import OrderedDict, deque
+
+from stats import SearchStats, tracer
+
+
+#### Maze value used for walls; every other value is walkable floor
+WALL = 1
+
+#### Agent goes E, W, N, and S, whenever possible
+MOVES = [(0, 1), (0, -1), (1, 0), (-1, 0)]
+
+#### Last search generation a SearchState hands out before starting over
+GENERATION_LIMIT = 2 ** 31 - 1
+
+#### Wall changes a Grid remembers for D* Lite planners to catch up on
+CHANGE_LOG = 256
+
+
+######################################################
+#### The maze flattened into one walkable flag per cell,
+#### indexed by row * cols + col.
+#### Grid(None, rows, cols, flags) wraps flags that already exist (e.g. a
+#### shared memory buffer) without copying them; such a grid has no maze.
+######################################################
+class Grid:
+    def __init__(self, maze, rows=None, cols=None, flags=None):
+        self.maze = maze
+        if flags is None:
+            self.rows = len(maze)
+            self.cols = len(maze[0])
+            self.open = bytearray(1 if v != WALL else 0 for row in maze for v in row)
+        else:
+            self.rows = rows
+            self.cols = cols
+            self.open = flags
+        self.states = {}
+
+        #### Data derived from the map (e.g. the HPA* abstract graph), built on demand
+        self.cache = {}
+
+        #### Bumped on every wall change so derived data knows it is stale
+        self.version = 0
+
+        #### The last wall changes as (version, pos), and the D* Lite planners
+        #### (dstar.py) that repair their search tree from them. Unlike the
+        #### cache, neither is dropped when a wall changes.
+        self.changes = deque(maxlen=CHANGE_LOG)
+        self.planners = OrderedDict()
+
+    def index(self, pos):
+        return pos[0] * self.cols + pos[1]
+
+    def pos(self, index):
+        return divmod(index, self.cols)
+
+    def is_open(self, pos):
+        return 0 <= pos[0] < self.rows and 0 <= pos[1] < self.cols and self.open[pos[0] * self.cols + pos[1]] == 1
+
+    ############################################################
+    #### Open or close a cell (door shut, corridor blocked, ...).
+    #### Keeps the maze list in step, drops cached derived data and bumps
+    #### the version. Returns True if the cell actually changed.
+    ############################################################
+    def set_wall(self, pos, wall=True):
+        i = self.index(pos)
+        if self.open[i] == (0 if wall else 1):
+            return False
+        self.open[i] = 0 if wall else 1
+        r, c = pos
+        if self.maze is None:
+            pass
+        elif wall:
+            self.maze[r][c] = WALL
+        elif self.maze[r][c] == WALL:
+            self.maze[r][c] = 0
+        self.cache.clear()
+        self.version += 1
+        self.changes.append((self.version, (r, c)))
+        return True
+
+    #### Search state reused by every search on this grid.
+    #### Searches that need two at once (bidirectional) ask for two slots.
+    def search_state(self, slot=0):
+        if slot not in self.states:
+            self.states[slot] = SearchState(self.rows * self.cols)
+        return self.states[slot]
+
+
+#### Accept either a Grid or a plain list-of-lists maze
+def as_grid(maze):
+    return maze if isinstance(maze, Grid) else Grid(maze)
+
+
+######################################################
+#### Per-cell g(), h() and parent kept in flat int arrays (4 bytes a
+#### cell each, like the DistanceTable).
+#### Instead of resetting every cell before a search, each search gets a
+#### new generation number; a cell whose stamp is older than the current
+#### generation counts as untouched (g = inf). Resetting is O(1), so a
+#### search only costs as much as the cells it actually visits.
+######################################################
+class SearchState:
+    def __init__(self, size):
+        self.generation = 0
+        self.stamp = array("i", [0]) * size     # generation that last wrote g/h/parent
+        self.closed = array("i", [0]) * size    # generation that expanded the cell
+        self.g = array("i", [0]) * size
+        self.h = array("i", [0]) * size
+        self.parent = array("i", [-1]) * size
+        self.open_set = None        # open set of the last search (see OpenSet)
+
+    def reset(self):
+        #### Stamps are 32-bit: clear them (in place) before they overflow
+        if self.generation == GENERATION_LIMIT:
+            zeros = array("i", [0]) * len(self.stamp)
+            self.stamp[:] = zeros
+            self.closed[:] = zeros
+            self.generation = 0
+        self.generation += 1
+        return self.generation
+
+
+######################################################
+#### Open set shared by every search mode.
+#### A binary heap with lazy deletion: when a cell's cost improves it is
+#### simply pushed again, and the old copy is dropped when it is popped
+#### because the cell is already closed. No locks are taken,
+#### unlike queue.PriorityQueue.
+######################################################
+class OpenSet:
+    def __init__(self, state):
+        self.heap = []
+        self.state = state
+        state.open_set = self
+
+    def __bool__(self):
+        return bool(self.heap)
+
+    def push(self, priority, index):
+        heapq.heappush(self.heap, (priority, index))
+
+    #### Best priority that is not closed yet (without closing it), or None
+    def peek(self):
+        heap, closed, generation = self.heap, self.state.closed, self.state.generation
+        while heap and closed[heap[0][1]] == generation:
+            heapq.heappop(heap)
+        return heap[0][0] if heap else None
+
+    #### Returns the best (priority, index) that is not closed yet and closes it,
+    #### or None once only stale entries are left
+    def pop(self):
+        heap, closed, generation = self.heap, self.state.closed, self.state.generation
+        while heap:
+            priority, index = heapq.heappop(heap)
+            if closed[index] == generation:
+                continue
+            closed[index] = generation
+            return priority, index
+        return None
+
+
+######################################################
+#### Open set used while stats are being collected: also counts pushes
+#### and expanded (closed) cells, tracks the largest heap size and when
+#### the heap was last touched (the search ends there and path
+#### reconstruction starts). Every push is either expanded, dropped as
+#### stale or still on the heap, so stale entries need no counter.
+######################################################
+class TracedOpenSet(OpenSet):
+    def __init__(self, state):
+        super().__init__(state)
+        self.pushed = 0
+        self.expanded = 0
+        self.peak = 0
+        self.last_used = time.perf_counter()
+
+    @property
+    def stale(self):
+        return self.pushed - self.expanded - len(self.heap)
+
+    def push(self, priority, index):
+        heapq.heappush(self.heap, (priority, index))
+        self.pushed += 1
+        if len(self.heap) > self.peak:
+            self.peak = len(self.heap)
+
+    def peek(self):
+        result = super().peek()
+        self.last_used = time.perf_counter()
+        return result
+
+    def pop(self):
+        result = super().pop()
+        if result is not None:
+            self.expanded += 1
+        self.last_used = time.perf_counter()
+        return result
+
+
+#### Open set for a new search on state, traced only when stats are on
+def new_open_set(state):
+    return TracedOpenSet(state) if tracer.enabled else OpenSet(state)
+
+
+######################################################
+#### A leg is the route from one position to one goal.
+#### path holds every cell after the start up to and including the goal,
+#### and labels holds the matching (g, h) values shown on the map.
+######################################################
+class Leg:
+    def __init__(self, start, goal, path, labels):
+        self.start = start
+        self.goal = goal
+        self.path = path
+        self.labels = labels
+        self.stats = None       # SearchStats, when stats are enabled
+
+    #### Number of unit moves needed to walk the leg
+    @property
+    def cost(self):
+        return len(self.path)
+
+
+######################################################
+#### A route is the result of planning a multi-goal trip.
+#### legs[i] belongs to goals[i] and is None when that goal was unreachable.
+######################################################
+class Route:
+    def __init__(self, start, goals, legs):
+        self.start = start
+        self.goals = goals
+        self.legs = legs
+        self.stats = None       # one SearchStats per leg, when stats are enabled
+
+    @property
+    def completed(self):
+        return sum(1 for leg in self.legs if leg is not None)
+
+    @property
+    def cost(self):
+        return sum(leg.cost for leg in self.legs if leg is not None)
+
+    #### The full walked path, leg after leg, starting at the start cell
+    @property
+    def path(self):
+        cells = [self.start]
+        for leg in self.legs:
+            if leg is not None:
+                cells.extend(leg.path)
+        return cells
+
+
+#### Algorithm names accepted on the first line of the input file
+ALGORITHM_NAMES = {
+    "a*": "A*",
+    "dijkstra": "Dijkstra",
+    "greedy": "Greedy Best-First",
+    "jps": "Jump Point Search",
+    "bidirectional a*": "Bidirectional A*",
+    "bidirectional dijkstra": "Bidirectional Dijkstra",
+    "hpa*": "Hierarchical A* (HPA*)",
+    "jps 8-way": "Jump Point Search (8-way)",
+    "d* lite": "D* Lite",
+}
+
+
+############################################################
+#### Normalize the algorithm name from the input file.
+#### Anything unknown falls back to A*.
+############################################################
+def algorithm_key(algorithm):
+    name = (algorithm or "").strip().lower()
+    if name in ALGORITHM_NAMES:
+        return name
+    return "a*"
+
+
+############################################################
+#### Manhattan distance
+############################################################
+def manhattan(pos, goal):
+    return abs(pos[0] - goal[0]) + abs(pos[1] - goal[1])
+
+
+############################################################
+#### Single goal search.
+#### A*:       f(n) = g(n) + h(n), one unit per move
+#### Dijkstra: f(n) = g(n), h(n) = 0
+#### Greedy:   f(n) = h(n), g(n) is never increased
+#### JPS:      A* over jump points only (see jps.py)
+#### JPS 8-way: JPS with unit-cost diagonal moves as well
+#### Bidirectional A* / Dijkstra: meet in the middle (see bidirectional.py)
+#### HPA*:     A* over cluster entrances, then refined (see hpa.py)
+#### D* Lite:  backward search kept per target set and repaired after
+####           wall changes (see dstar.py)
+#### Returns a Leg, or None when the goal cannot be reached.
+############################################################
+def search(maze, start, goal, algorithm="A*", state=None):
+    return search_any(maze, start, [goal], algorithm, state)
+
+
+############################################################
+#### Multi-target search: one search toward a whole set of target cells
+#### (e.g. every drop-off of a ward). h(n) is the Manhattan distance to
+#### the closest target, which is still admissible, so A* and Dijkstra
+#### stop at the truly nearest reachable target.
+#### The returned Leg's goal is the target that was reached.
+#### With stats enabled (see stats.py) the Leg also carries its SearchStats.
+############################################################
+def search_any(maze, start, goals, algorithm="A*", state=None):
+    if tracer.enabled:
+        return traced_search(maze, start, goals, algorithm, state)
+    return find_leg(maze, start, goals, algorithm, state)
+
+
+############################################################
+#### search_any() with stats: the counters are read from the traced
+#### open set(s) once the search is over
+############################################################
+def traced_search(maze, start, goals, algorithm="A*", state=None):
+    grid = as_grid(maze)
+    mode = algorithm_key(algorithm)
+    if mode.startswith("bidirectional"):
+        states = [grid.search_state(0), grid.search_state(1)]
+    elif mode in ("hpa*", "d* lite"):
+        states = []
+    else:
+        state = state or grid.search_state()
+        states = [state]
+    for s in states:
+        s.open_set = None
+
+    started = time.perf_counter()
+    leg = find_leg(grid, start, goals, algorithm, state)
+    finished = time.perf_counter()
+
+    stats = SearchStats(mode, start, goals)
+    open_sets = [s.open_set for s in states if s.open_set is not None]
+    if open_sets:
+        stats.expanded = sum(o.expanded for o in open_sets)
+        stats.pushed = sum(o.pushed for o in open_sets)
+        stats.stale = sum(o.stale for o in open_sets)
+        stats.peak_open = sum(o.peak for o in open_sets)
+        searched = max(o.last_used for o in open_sets)
+        stats.phases["search"] = searched - started
+        stats.phases["reconstruct"] = finished - searched if leg else 0.0
+    else:
+        stats.phases["search"] = finished - started
+
+    if leg is not None:
+        stats.path_length = leg.cost
+        leg.stats = stats
+    tracer.record(stats)
+    return leg
+
+
+def find_leg(maze, start, goals, algorithm="A*", state=None):
+    grid = as_grid(maze)
+    mode = algorithm_key(algorithm)
+    start = tuple(start)
+    goals = [tuple(goal) for goal in goals if grid.is_open(goal)]
+
+    if not grid.is_open(start) or not goals:
+        return None
+
+    if mode in ("jps", "jps 8-way"):
+        from jps import jump_search
+        return jump_search(grid, start, goals, diagonal=mode == "jps 8-way", state=state)
+    if mode.startswith("bidirectional"):
+        from bidirectional import bidirectional_search
+        return bidirectional_search(grid, start, goals, use_heuristic=mode == "bidirectional a*")
+    if mode == "hpa*":
+        from hpa import hierarchy_for
+        return hierarchy_for(grid).search(start, goals)
+    if mode == "d* lite":
+        from dstar import planner_for
+        return planner_for(grid, start, goals).replan(start)
+
+    rows, cols, walkable = grid.rows, grid.cols, grid.open
+    targets = {grid.index(goal) for goal in goals}
+    single = len(goals) == 1
+    goal_r, goal_c = goals[0]
+    use_h = mode != "dijkstra"
+    greedy = mode == "greedy"
+
+    if state is None:
+        state = grid.search_state()
+    generation = state.reset()
+    stamp, closed, g, h, parent = state.stamp, state.closed, state.g, state.h, state.parent
+
+    source = grid.index(start)
+    stamp[source] = generation
+    g[source] = 0
+    h[source] = min(manhattan(start, goal) for goal in goals) if use_h else 0
+    parent[source] = -1
+
+    open_set = new_open_set(state)
+
+    #### Add the start state to the queue
+    open_set.push(0, source)
+
+    #### Continue exploring until the queue is exhausted
+    while True:
+        entry = open_set.pop()
+        if entry is None:
+            break
+        current = entry[1]
+
+        #### Stop if a goal is reached
+        if current in targets:
+            return build_leg(grid, start, grid.pos(current), state)
+
+        r, c = divmod(current, cols)
+
+        #### The cost of moving to a new position is 1 unit
+        new_g = g[current] if greedy else g[current] + 1
+
+        #### Agent goes E, W, S, and N, whenever possible
+        for nr, nc, n in ((r, c + 1, current + 1), (r, c - 1, current - 1),
+                          (r + 1, c, current + cols), (r - 1, c, current - cols)):
+            if 0 <= nr < rows and 0 <= nc < cols and walkable[n] and closed[n] != generation:
+                if stamp[n] != generation or new_g < g[n]:
+                    if not use_h:
+                        hn = 0
+                    elif single:
+                        hn = abs(nr - goal_r) + abs(nc - goal_c)
+                    else:
+                        hn = min(abs(nr - tr) + abs(nc - tc) for tr, tc in goals)
+                    stamp[n] = generation
+                    g[n] = new_g
+                    h[n] = hn
+                    parent[n] = current
+
+                    #### Add the new cell to the priority queue
+                    open_set.push(hn if greedy else new_g + hn, n)
+
+    return None
+
+
+############################################################
+#### Traverse from goal back to start to get the path
+############################################################
+def build_leg(grid, start, goal, state):
+    g, h, parent = state.g, state.h, state.parent
+    indices = []
+    current = grid.index(goal)
+    while parent[current] != -1:
+        indices.append(current)
+        current = parent[current]
+    indices.reverse()
+
+    path = [grid.pos(i) for i in indices]
+    labels = [(g[i], h[i]) for i in indices]
+    return Leg(start, goal, path, labels)
+
+
+############################################################
+#### Drop-off cells a goal may be delivered to.
+#### Goals from read_input_file are (row, col, priority, ward name,
+#### locations); any other goal only has its own (row, col).
+############################################################
+def goal_targets(goal):
+    if len(goal) > 4 and goal[4]:
+        return [tuple(loc) for loc in goal[4]]
+    return [(goal[0], goal[1])]
+
+
+############################################################
+#### Plan a multi-goal trip, visiting goals in the given order.
+#### Each goal is (row, col) or any tuple starting with row and col,
+#### e.g. the (row, col, priority, ward name, locations) tuples from the
+#### input file. A goal with several locations is delivered to whichever
+#### one is nearest to where the robot is at that point of the trip.
+#### An unreachable goal is skipped and the robot stays where it is.
+#### With a distances.DistanceTable, A* and Dijkstra legs that end at its
+#### drop-off points are looked up instead of searched, unless the map has
+#### changed since the table was built.
+#### With a routecache.RouteCache, legs already planned on the same map
+#### are taken from the cache.
+############################################################
+def plan(maze, start, goals, algorithm="A*", table=None, cache=None):
+    legs = []
+    stats = []
+    for leg, leg_stats in plan_legs(maze, start, goals, algorithm, table, cache):
+        legs.append(leg)
+        stats.append(leg_stats)
+
+    route = Route(tuple(start), list(goals), legs)
+    if tracer.enabled:
+        route.stats = stats
+    return route
+
+
+############################################################
+#### plan() one leg at a time: yields (leg, stats) for each goal as soon
+#### as it is planned (stats is None while stats are disabled), so a
+#### caller can start using the first legs before the last are searched.
+############################################################
+def plan_legs(maze, start, goals, algorithm="A*", table=None, cache=None):
+    grid = as_grid(maze)
+    #### The table's shortest paths are what A* and Dijkstra would find; the
+    #### other algorithms are searched so their own paths and stats show
+    use_table = (table is not None and table.version == grid.version and
+                 algorithm_key(algorithm) in ("a*", "dijkstra"))
+    current = tuple(start)
+
+    for goal in goals:
+        targets = goal_targets(goal)
+        from_table = use_table and all(target in table for target in targets)
+        if from_table:
+            compute = lambda: table.nearest_leg(current, targets, algorithm)
+        else:
+            compute = lambda: search_any(grid, current, targets, algorithm)
+        leg_stats = None
+        if tracer.enabled:
+            leg, leg_stats = traced_leg(grid, current, targets, algorithm, compute, cache, from_table)
+        else:
+            leg = compute() if cache is None else cache.leg(grid, current, targets, algorithm, compute)
+        yield leg, leg_stats
+        if leg is not None:
+            current = leg.goal
+
+
+############################################################
+#### One plan() leg with stats. A fresh search brings its own stats;
+#### a table or cache answer gets a "table"/"cache" entry with the
+#### lookup time. Cached Legs are shared, so their stats are not touched.
+############################################################
+def traced_leg(grid, current, targets, algorithm, compute, cache, from_table):
+    searched = []
+
+    def run():
+        searched.append(True)
+        return compute()
+
+    started = time.perf_counter()
+    leg = run() if cache is None else cache.leg(grid, current, targets, algorithm, run)
+    elapsed = time.perf_counter() - started
+
+    if searched and not from_table:
+        return leg, tracer.last
+
+    stats = SearchStats(algorithm_key(algorithm), current, targets, "table" if searched else "cache")
+    stats.phases["lookup"] = elapsed
+    if leg is not None:
+        stats.path_length = leg.cost
+    tracer.record(stats)
+    return leg, stats
@@ -0,0 +1,218 @@
+#######################################################
+#### Adam Syed and Teagan Clark
+#### 11/24/25
+#### Purpose: Long-lived routing service. The map, the drop-off distance
+#### table and a route cache are loaded once and kept warm; dispatch
+#### sends route requests over a local socket instead of starting
+#### FindPath.py for every order.
+####
+#### Usage: python server.py [--port 8765 | --unix /tmp/robot.sock]
+####                        [--map hospital.hmap] [--workers N] [--threads]
+#### Protocol: one JSON object per line each way, e.g.
+####   -> {"id": 1, "start": "ER", "goals": ["ICU", "Oncology"], "algorithm": "A*"}
+####   <- {"id": 1, "start": [11, 21], "completed": 2, "cost": 31, "legs": [...]}
+#### Responses carry the request's id and may come back out of order.
+#######################################################
+import argparse
+import asyncio
+import json
+import os
+import threading
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+
+from distances import TABLE_CELL_LIMIT, DistanceTable
+from hospital import default_start, drop_off_points, maze, start_position, ward_goal
+from mapfile import load_map
+from routecache import RouteCache, map_hash
+from routing import ALGORITHM_NAMES, Grid, algorithm_key, as_grid, plan
+from tour import order_goals
+
+#### Requests one connection may have in flight at once
+MAX_IN_FLIGHT = 64
+
+#### Per-process warm state, filled in by load_worker()
+worker = {}
+
+#### Per-thread routing grids over the worker's shared open flags
+local = threading.local()
+
+
+############################################################
+#### Executor initializer: load the map once per worker process (or
+#### once for all threads) and keep it, with its tables, for every request.
+#### Maps over TABLE_CELL_LIMIT cells get no drop-off table.
+############################################################
+def load_worker(map_path=None):
+    wards = None
+    grid = as_grid(maze)
+    if map_path:
+        with load_map(map_path) as hospital_map:
+            grid, wards = hospital_map.grid(), hospital_map.metadata
+    worker["grid"] = grid
+    worker["wards"] = wards
+    worker["table"] = DistanceTable(grid, drop_off_points(wards)) if grid.rows * grid.cols <= TABLE_CELL_LIMIT else None
+    worker["cache"] = RouteCache()
+
+    #### Warm the derived data every thread's grid shares (see worker_grid)
+    map_hash(grid)
+
+
+############################################################
+#### The calling thread's own Grid over the warm map's open flags.
+#### Searches keep their scratch state on the grid, so executor threads
+#### must not share one (see batch.thread_chunk_runner). Derived data
+#### (map hash, HPA* graph) only reads the flags, so every thread's grid
+#### shares the warm grid's cache and it is built once per worker.
+############################################################
+def worker_grid():
+    grid = worker["grid"]
+    if getattr(local, "source", None) is not grid:
+        local.source = grid
+        local.grid = Grid(None, grid.rows, grid.cols, grid.open)
+        local.grid.cache = grid.cache
+    return local.grid
+
+
+############################################################
+#### Reject malformed requests before anything is routed: start is a
+#### ward name, goals a list of ward names and algorithm a known name.
+#### Raises ValueError, which becomes the request's error response.
+############################################################
+def check_request(request):
+    start = request.get("start")
+    if start is not None and not isinstance(start, str):
+        raise ValueError("start must be a ward name")
+    goals = request.get("goals", [])
+    if not isinstance(goals, list) or not all(isinstance(name, str) for name in goals):
+        raise ValueError("goals must be a list of ward names")
+    algorithm = request.get("algorithm", "A*")
+    if not isinstance(algorithm, str) or algorithm.strip().lower() not in ALGORITHM_NAMES:
+        raise ValueError(f"unknown algorithm {algorithm!r}; use one of: {', '.join(ALGORITHM_NAMES)}")
+
+
+############################################################
+#### Answer one route request (runs in the executor).
+#### Wards are parsed like an input file: unknown wards are reported in
+#### "skipped", goals are ordered by priority and then by walking distance.
+############################################################
+def route_request(request):
+    check_request(request)
+    grid, wards, table, cache = worker_grid(), worker["wards"], worker["table"], worker["cache"]
+    start = wards.get("default_start", default_start) if wards else default_start
+    if request.get("start"):
+        start = start_position(f"Start: {request['start']}", start, wards)
+
+    goals, skipped = [], []
+    for name in request.get("goals", []):
+        goal = ward_goal(name, start, wards)
+        if goal is None:
+            skipped.append(name)
+        else:
+            goals.append(goal)
+    goals = sorted(goals, key=lambda x: x[2], reverse=True)
+    algorithm = request.get("algorithm", "A*")
+    goals = order_goals(grid, start, goals, algorithm, table)
+    route = plan(grid, start, goals, algorithm, table, cache)
+    return {
+        "id": request.get("id"),
+        "algorithm": algorithm_key(algorithm),
+        "start": list(start),
+        "completed": route.completed,
+        "cost": route.cost,
+        "skipped": skipped,
+        "legs": [
+            {"ward": goal[3], "priority": goal[2], "goal": list(leg.goal), "cost": leg.cost,
+             "path": [list(cell) for cell in leg.path]} if leg else
+            {"ward": goal[3], "priority": goal[2], "goal": None, "cost": None, "path": None}
+            for goal, leg in zip(route.goals, route.legs)
+        ],
+    }
+
+
+######################################################
+#### asyncio server. Every request line becomes its own task, so one
+#### connection can have many requests in flight; the searches run in
+#### the executor and never block the event loop.
+######################################################
+class RoutingServer:
+    def __init__(self, map_path=None, workers=None, use_processes=True):
+        workers = workers or os.cpu_count() or 1
+        if use_processes:
+            self.executor = ProcessPoolExecutor(max_workers=workers, initializer=load_worker, initargs=(map_path,))
+        else:
+            #### Threads share one warm map (and one GIL); each searches on its own grid
+            load_worker(map_path)
+            self.executor = ThreadPoolExecutor(max_workers=workers)
+        self.served = 0
+
+    async def handle(self, reader, writer):
+        limit = asyncio.Semaphore(MAX_IN_FLIGHT)
+        tasks = set()
+
+        async def answer(line):
+            try:
+                try:
+                    request = json.loads(line)
+                    if not isinstance(request, dict):
+                        raise ValueError("request must be a JSON object")
+                except ValueError as error:
+                    response = {"id": None, "error": f"bad request: {error}"}
+                else:
+                    try:
+                        loop = asyncio.get_running_loop()
+                        response = await loop.run_in_executor(self.executor, route_request, request)
+                    except Exception as error:
+                        response = {"id": request.get("id"), "error": str(error)}
+                writer.write((json.dumps(response) + "\n").encode("utf-8"))
+                await writer.drain()
+                self.served += 1
+            finally:
+                limit.release()
+
+        try:
+            while True:
+                line = await reader.readline()
+                if not line:
+                    break
+                if not line.strip():
+                    continue
+                await limit.acquire()
+                task = asyncio.create_task(answer(line))
+                tasks.add(task)
+                task.add_done_callback(tasks.discard)
+            if tasks:
+                await asyncio.gather(*tasks, return_exceptions=True)
+        finally:
+            writer.close()
+
+    async def serve(self, host="127.0.0.1", port=8765, unix_path=None):
+        if unix_path:
+            server = await asyncio.start_unix_server(self.handle, path=unix_path)
+            where = unix_path
+        else:
+            server = await asyncio.start_server(self.handle, host, port)
+            where = f"{host}:{port}"
+        print(f"#### Routing server listening on {where}", flush=True)
+        async with server:
+            await server.serve_forever()
+
+    def close(self):
+        self.executor.shutdown()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Serve route requests over a local socket.")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--unix", help="listen on this Unix socket path instead of TCP")
+    parser.add_argument("--map", help="map file to load (see mapfile.py); default is the built-in hospital")
+    parser.add_argument("--workers", type=int)
+    parser.add_argument("--threads", action="store_true", help="use a thread pool instead of processes")
+    args = parser.parse_args()
+
+    routing_server = RoutingServer(args.map, args.workers, use_processes=not args.threads)
+    try:
+        asyncio.run(routing_server.serve(port=args.port, unix_path=args.unix))
+    except KeyboardInterrupt:
+        pass
+    finally:
+        routing_server.close()
@@ -0,0 +1,114 @@
+#######################################################
+#### Adam Syed and Teagan Clark
+#### 11/24/25
+#### Purpose: Per-search statistics. When enabled, every search records
+#### how much work it did (cells expanded, heap pushes, stale pops, peak
+#### open-set size), the path length and the time spent in each phase.
+#### The stats are attached to the result and can also be written out as
+#### JSON lines. When disabled, a search only pays for one flag check.
+####
+#### Enable with stats.enable_stats("trace.jsonl") or by setting the
+#### ROBOT_STATS environment variable to a file name (or to 1 for no file).
+#######################################################
+import copy
+import json
+import os
+import threading
+
+
+######################################################
+#### What one search (or table/cache lookup) cost.
+#### source is "search", "table" or "cache"; counters a mode does not
+#### track (e.g. HPA* has no per-cell open set) stay None.
+#### phases maps a phase name (parse, search, reconstruct, lookup,
+#### render) to seconds.
+######################################################
+class SearchStats:
+    def __init__(self, algorithm, start, goals, source="search"):
+        self.algorithm = algorithm
+        self.start = tuple(start)
+        self.goals = [tuple(goal) for goal in goals]
+        self.source = source
+        self.expanded = None
+        self.pushed = None
+        self.stale = None
+        self.peak_open = None
+        self.path_length = None
+        self.phases = {}
+
+    #### Copy with its own phases, to add to (e.g. render time) without
+    #### changing the stats of a Leg that a RouteCache hands out again
+    def copy(self):
+        other = copy.copy(self)
+        other.phases = dict(self.phases)
+        return other
+
+    def as_dict(self):
+        return {
+            "event": self.source,
+            "algorithm": self.algorithm,
+            "start": list(self.start),
+            "goals": [list(goal) for goal in self.goals],
+            "expanded": self.expanded,
+            "pushed": self.pushed,
+            "stale": self.stale,
+            "peak_open": self.peak_open,
+            "path_length": self.path_length,
+            "phases_ms": {name: round(seconds * 1000, 4) for name, seconds in self.phases.items()},
+        }
+
+
+######################################################
+#### Process-wide switch and JSON lines sink. Searches check
+#### tracer.enabled once; everything else only runs when it is True.
+######################################################
+class Tracer:
+    def __init__(self):
+        self.enabled = False
+        self.sink = None
+        self.lock = threading.Lock()
+        self.local = threading.local()
+
+    def enable(self, path=None):
+        self.disable()
+        if path:
+            self.sink = open(path, "a")
+        self.enabled = True
+
+    def disable(self):
+        self.enabled = False
+        if self.sink is not None:
+            self.sink.close()
+            self.sink = None
+
+    #### Stats of the last search run by the calling thread
+    @property
+    def last(self):
+        return getattr(self.local, "last", None)
+
+    def record(self, stats):
+        self.local.last = stats
+        self.write(stats.as_dict())
+
+    def write(self, record):
+        if self.sink is None:
+            return
+        line = json.dumps(record)
+        with self.lock:
+            self.sink.write(line + "\n")
+            self.sink.flush()
+
+
+tracer = Tracer()
+
+
+def enable_stats(path=None):
+    tracer.enable(path)
+
+
+def disable_stats():
+    tracer.disable()
+
+
+if os.environ.get("ROBOT_STATS"):
+    enable_stats(None if os.environ["ROBOT_STATS"] == "1" else os.environ["ROBOT_STATS"])
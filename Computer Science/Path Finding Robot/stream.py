@@ -0,0 +1,202 @@
+#######################################################
+#### Adam Syed and Teagan Clark
+#### 11/24/25
+#### Purpose: Streaming delivery requests. Instead of reading one input
+#### file and exiting, the robot keeps taking orders, one per line, from
+#### stdin, a named pipe or a JSONL file that is still being written,
+#### and routes each one as it arrives. Memory use is bounded by
+#### max_pending, however long the stream runs.
+####
+#### Usage: python stream.py [file|-] [--follow] [--algorithm A*]
+#### Lines are ward names ("ICU"), "Start: <ward>", or JSON objects
+#### such as {"id": 17, "ward": "ICU"} or {"start": "ER"}.
+#######################################################
+import argparse
+import heapq
+import json
+import queue
+import sys
+import threading
+import time
+
+from distances import TABLE_CELL_LIMIT, DistanceTable
+from hospital import default_start, drop_off_points, maze, start_position, ward_goal
+from routecache import RouteCache
+from routing import as_grid, plan
+
+#### Requests read but not routed yet; the reader blocks when this is full
+DEFAULT_MAX_PENDING = 256
+
+
+######################################################
+#### One delivery order: the goal tuple from hospital.ward_goal(), the
+#### order id (from the JSON line, or its position in the stream) and
+#### when it was read
+######################################################
+class DeliveryRequest:
+    def __init__(self, request_id, goal, received):
+        self.id = request_id
+        self.goal = goal
+        self.received = received
+
+    @property
+    def priority(self):
+        return self.goal[2]
+
+    @property
+    def ward(self):
+        return self.goal[3]
+
+
+############################################################
+#### Lines of a file that is still being appended to (like tail -f).
+#### A line is only handed out once its newline has been written.
+############################################################
+def follow(path, poll=0.2, stop=None):
+    with open(path, "r") as f:
+        partial = ""
+        while stop is None or not stop.is_set():
+            line = f.readline()
+            if not line:
+                time.sleep(poll)
+                continue
+            partial += line
+            if partial.endswith("\n"):
+                yield partial
+                partial = ""
+
+
+######################################################
+#### Routes requests one at a time from wherever the robot stopped
+#### last. Waiting requests are served highest priority first and, within
+#### a priority, in arrival order. Legs between drop-off points come from
+#### a DistanceTable (on maps up to TABLE_CELL_LIMIT cells), and repeated
+#### legs come from a RouteCache, so each request costs about the same
+#### however long the stream has been running.
+######################################################
+class DeliveryStream:
+    def __init__(self, maze, algorithm="A*", start=default_start, wards=None,
+                 max_pending=DEFAULT_MAX_PENDING, cache=None):
+        self.grid = as_grid(maze)
+        self.table = None
+        if self.grid.rows * self.grid.cols <= TABLE_CELL_LIMIT:
+            self.table = DistanceTable(self.grid, drop_off_points(wards))
+        self.cache = cache if cache is not None else RouteCache()
+        self.algorithm = algorithm
+        self.wards = wards
+        self.position = tuple(start)
+        self.max_pending = max_pending
+        self.pending = []       # heap of (-priority, sequence, DeliveryRequest)
+        self.sequence = 0
+        self.routed = 0
+
+    ############################################################
+    #### Parse one input line. "Start:" lines move the robot at once;
+    #### ward lines are queued. Returns the DeliveryRequest, or None.
+    #### Messages go to stderr: stdout carries only the routed records.
+    ############################################################
+    def submit(self, line):
+        line = line.strip()
+        if not line:
+            return None
+
+        self.sequence += 1
+        request_id = self.sequence
+        if line.startswith("{"):
+            try:
+                order = json.loads(line)
+            except ValueError:
+                print(f"WARNING: Unreadable request line: '{line}' – skipping.", file=sys.stderr)
+                return None
+            request_id = order.get("id", request_id)
+            if "start" in order:
+                self.position = start_position(f"Start: {order['start']}", self.position, self.wards, sys.stderr)
+            if "ward" not in order:
+                return None
+            line = str(order["ward"])
+        elif line.lower().startswith("start:"):
+            self.position = start_position(line, self.position, self.wards, sys.stderr)
+            return None
+
+        goal = ward_goal(line, self.position, self.wards, sys.stderr)
+        if goal is None:
+            return None
+        request = DeliveryRequest(request_id, goal, time.perf_counter())
+        heapq.heappush(self.pending, (-request.priority, self.sequence, request))
+        return request
+
+    #### Route the most urgent waiting request; returns (request, Leg or None)
+    def next_delivery(self):
+        _, _, request = heapq.heappop(self.pending)
+        route = plan(self.grid, self.position, [request.goal], self.algorithm, self.table, self.cache)
+        leg = route.legs[0]
+        if leg is not None:
+            self.position = leg.goal
+        self.routed += 1
+        return request, leg
+
+    ############################################################
+    #### Route every request from an iterable of lines (a file, stdin,
+    #### follow(...)) as it arrives. A reader thread feeds a bounded queue,
+    #### so a fast producer is slowed down instead of filling memory.
+    #### Yields (request, leg) pairs.
+    ############################################################
+    def run(self, lines):
+        inbox = queue.Queue(maxsize=self.max_pending)
+        done = object()
+
+        def read():
+            try:
+                for line in lines:
+                    inbox.put(line)
+            finally:
+                inbox.put(done)
+
+        threading.Thread(target=read, daemon=True).start()
+
+        finished = False
+        while not finished or self.pending:
+            #### Wait for input only when there is nothing left to route
+            block = not self.pending
+            while not finished and len(self.pending) < self.max_pending:
+                try:
+                    line = inbox.get(block=block)
+                except queue.Empty:
+                    break
+                if line is done:
+                    finished = True
+                else:
+                    self.submit(line)
+                block = not self.pending
+
+            if self.pending:
+                yield self.next_delivery()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Route delivery requests as they arrive.")
+    parser.add_argument("source", nargs="?", default="-", help="file or named pipe to read, - for stdin")
+    parser.add_argument("--follow", action="store_true", help="keep reading the file as it grows")
+    parser.add_argument("--algorithm", default="A*")
+    args = parser.parse_args()
+
+    if args.source == "-":
+        lines = sys.stdin
+    elif args.follow:
+        lines = follow(args.source)
+    else:
+        lines = open(args.source, "r")
+
+    stream = DeliveryStream(maze, args.algorithm)
+    started = time.perf_counter()
+    for request, leg in stream.run(lines):
+        print(json.dumps({
+            "id": request.id,
+            "ward": request.ward,
+            "priority": request.priority,
+            "goal": list(leg.goal) if leg else None,
+            "cost": leg.cost if leg else None,
+            "latency_ms": round((time.perf_counter() - request.received) * 1000, 3),
+        }), flush=True)
+    elapsed = time.perf_counter() - started
+    print(f"#### Routed {stream.routed} requests in {elapsed:.2f}s", file=sys.stderr)
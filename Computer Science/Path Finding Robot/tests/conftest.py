@@ -0,0 +1,69 @@
+#### The modules under test live one directory up
+import os
+import random
+import sys
+from collections import deque
+
+import pytest
+
+ROBOT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROBOT_DIR)
+
+STRAIGHT = [(0, 1), (0, -1), (1, 0), (-1, 0)]
+DIAGONAL = [(1, 1), (1, -1), (-1, 1), (-1, -1)]
+
+
+############################################################
+#### random_maze(seed) -> (maze, open cells): a small list-of-lists maze
+#### with about `walls` of its cells walled off
+############################################################
+@pytest.fixture
+def random_maze():
+    def make(seed, walls=0.3):
+        rng = random.Random(seed)
+        rows, cols = rng.randint(3, 16), rng.randint(3, 16)
+        maze = [[1 if rng.random() < walls else 0 for _ in range(cols)] for _ in range(rows)]
+        cells = [(r, c) for r in range(rows) for c in range(cols) if maze[r][c] != 1]
+        return maze, cells
+    return make
+
+
+############################################################
+#### bfs_cost(maze, start, goals, diagonal=False) -> fewest moves to the
+#### nearest goal, or None. The reference every search is checked against.
+############################################################
+@pytest.fixture
+def bfs_cost():
+    def cost(maze, start, goals, diagonal=False):
+        rows, cols = len(maze), len(maze[0])
+        moves = STRAIGHT + DIAGONAL if diagonal else STRAIGHT
+        goals = set(map(tuple, goals))
+        seen = {tuple(start): 0}
+        frontier = deque([tuple(start)])
+        while frontier:
+            r, c = frontier.popleft()
+            if (r, c) in goals:
+                return seen[(r, c)]
+            for dr, dc in moves:
+                n = (r + dr, c + dc)
+                if 0 <= n[0] < rows and 0 <= n[1] < cols and maze[n[0]][n[1]] != 1 and n not in seen:
+                    seen[n] = seen[(r, c)] + 1
+                    frontier.append(n)
+        return None
+    return cost
+
+
+############################################################
+#### walkable(maze, leg, diagonal=False): every step of the leg moves to
+#### an open neighbour
+############################################################
+@pytest.fixture
+def walkable():
+    def check(maze, leg, diagonal=False):
+        cells = [tuple(leg.start)] + [tuple(cell) for cell in leg.path]
+        for (r, c), (nr, nc) in zip(cells, cells[1:]):
+            step = max(abs(r - nr), abs(c - nc)) if diagonal else abs(r - nr) + abs(c - nc)
+            if step != 1 or maze[nr][nc] == 1:
+                return False
+        return True
+    return check
@@ -0,0 +1,41 @@
+#### Changing the speed must move the tick that is already waiting
+from animation import Animation
+
+
+#### Records after()/after_cancel() instead of running a Tk event loop
+class FakeRoot:
+    def __init__(self):
+        self.waiting = {}
+        self.count = 0
+
+    def after(self, ms, callback):
+        self.count += 1
+        self.waiting[self.count] = (ms, callback)
+        return self.count
+
+    def after_cancel(self, after_id):
+        del self.waiting[after_id]
+
+    #### Run the one waiting callback, as if its delay had passed
+    def fire(self):
+        (after_id,) = self.waiting
+        _, callback = self.waiting.pop(after_id)
+        callback()
+
+    def delay(self):
+        ((ms, _),) = self.waiting.values()
+        return ms
+
+
+def test_speed_change_reschedules_pending_tick():
+    root = FakeRoot()
+    animation = Animation(root, [(1000, lambda: None), (1000, lambda: None)], lambda: None)
+    animation.start()
+    root.fire()
+    assert 990 <= root.delay() <= 1000
+
+    animation.faster()
+    assert 490 <= root.delay() <= 500
+
+    animation.set_speed(0.25)
+    assert 3900 <= root.delay() <= 4000
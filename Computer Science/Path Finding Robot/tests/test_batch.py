@@ -0,0 +1,32 @@
+#### route_many() on a process or thread pool must give the same routes
+#### as planning every job one after another
+import random
+
+import pytest
+
+from batch import route_many
+from hospital import maze
+from routing import Grid, plan
+
+
+@pytest.fixture
+def jobs():
+    grid = Grid(maze)
+    cells = [(r, c) for r in range(grid.rows) for c in range(grid.cols) if grid.is_open((r, c))]
+    rng = random.Random(7)
+    return [(rng.choice(cells), rng.sample(cells, rng.randint(1, 3))) for _ in range(40)]
+
+
+@pytest.mark.parametrize("use_processes", [True, False], ids=["processes", "threads"])
+@pytest.mark.parametrize("algorithm", ["A*", "JPS"])
+def test_pool_matches_serial(jobs, use_processes, algorithm):
+    results = dict(route_many(maze, jobs, algorithm, workers=2, use_processes=use_processes, chunk_size=6))
+    assert sorted(results) == list(range(len(jobs)))
+
+    grid = Grid(maze)
+    for index, (start, goals) in enumerate(jobs):
+        expected = plan(grid, start, goals, algorithm)
+        route = results[index]
+        assert route.cost == expected.cost
+        assert route.completed == expected.completed
+        assert route.path == expected.path
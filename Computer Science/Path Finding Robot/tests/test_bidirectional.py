@@ -0,0 +1,41 @@
+#### Bidirectional A* and Dijkstra costs must equal breadth-first search
+import random
+
+import pytest
+
+from bidirectional import bidirectional_search
+from routing import Grid, search_any
+from stats import disable_stats, enable_stats, tracer
+
+
+@pytest.mark.parametrize("use_heuristic", [True, False], ids=["a*", "dijkstra"])
+def test_costs_match_bfs(random_maze, bfs_cost, walkable, use_heuristic):
+    for seed in range(300):
+        maze, cells = random_maze(seed)
+        if len(cells) < 2:
+            continue
+        rng = random.Random(seed)
+        start = rng.choice(cells)
+        goals = rng.sample(cells, min(len(cells), rng.randint(1, 4)))
+
+        leg = bidirectional_search(Grid(maze), start, goals, use_heuristic)
+        expected = bfs_cost(maze, start, goals)
+        if expected is None:
+            assert leg is None
+            continue
+        assert leg.cost == expected
+        assert leg.goal in goals
+        assert walkable(maze, leg)
+
+
+def test_enclosed_goal_is_given_up_early():
+    #### The goal sits in a one-cell pocket; the backward side is tiny
+    maze = [[0] * 40 for _ in range(40)]
+    for r, c in [(19, 20), (21, 20), (20, 19), (20, 21)]:
+        maze[r][c] = 1
+    enable_stats()
+    try:
+        assert search_any(Grid(maze), (0, 0), [(20, 20)], "Bidirectional A*") is None
+    finally:
+        disable_stats()
+    assert tracer.last.expanded < 10
@@ -0,0 +1,67 @@
+#### Cooperative paths must never put two robots on one cell or swap them
+import random
+
+import pytest
+
+from cooperative import CooperativePlanner
+from hospital import maze
+
+
+############################################################
+#### Pad every path with its last cell (a parked robot stays put) and
+#### check the moves, vertex conflicts and edge (swap) conflicts
+############################################################
+def check_paths(grid, robots, paths):
+    timed = [(start, path) for (start, _), path in zip(robots, paths) if path is not None]
+    length = max(len(path) for _, path in timed)
+    padded = [path + [path[-1]] * (length - len(path)) for _, path in timed]
+
+    for (start, _), path in zip(timed, padded):
+        assert path[0] == tuple(start)
+        for (r, c), (nr, nc) in zip(path, path[1:]):
+            assert abs(r - nr) + abs(c - nc) <= 1
+            assert grid.is_open((nr, nc))
+
+    for t in range(length):
+        cells = [path[t] for path in padded]
+        assert len(set(cells)) == len(cells), f"vertex conflict at t={t}"
+        if t > 0:
+            moves = {(path[t - 1], path[t]) for path in padded if path[t - 1] != path[t]}
+            assert not any((b, a) in moves for a, b in moves), f"swap at t={t}"
+
+
+@pytest.fixture
+def robots():
+    def make(seed, count):
+        planner = CooperativePlanner(maze)
+        grid = planner.grid
+        cells = [(r, c) for r in range(grid.rows) for c in range(grid.cols) if grid.is_open((r, c))]
+        picked = random.Random(seed).sample(cells, 2 * count)
+        return planner, list(zip(picked[:count], picked[count:]))
+    return make
+
+
+def test_doorway_swap_is_resolved():
+    planner = CooperativePlanner(maze)
+    robots = [((19, 3), (24, 3)), ((24, 3), (19, 3))]
+    for paths in (planner.plan(robots), planner.plan_windowed(robots, window=8)):
+        check_paths(planner.grid, robots, paths)
+        assert [path[-1] for path in paths] == [(24, 3), (19, 3)]
+
+
+@pytest.mark.parametrize("seed", range(5))
+def test_cooperative_paths_have_no_conflicts(robots, seed):
+    planner, jobs = robots(seed, 8)
+    paths = planner.plan(jobs)
+    assert any(path is not None for path in paths)
+    check_paths(planner.grid, jobs, paths)
+    for (_, goal), path in zip(jobs, paths):
+        assert path is None or path[-1] == goal
+
+
+@pytest.mark.parametrize("seed", range(5))
+def test_windowed_paths_have_no_conflicts(robots, seed):
+    planner, jobs = robots(seed, 8)
+    paths = planner.plan_windowed(jobs, window=8)
+    check_paths(planner.grid, jobs, paths)
+    assert len({len(path) for path in paths}) == 1
@@ -0,0 +1,87 @@
+#### D* Lite must keep matching a fresh A* search while the robot moves
+#### and cells open and close
+import random
+
+from dstar import DStarLite, planner_for
+from routing import CHANGE_LOG, Grid, find_leg
+
+
+def test_replans_match_astar_after_edits(random_maze, walkable):
+    for seed in range(150):
+        maze, cells = random_maze(seed)
+        if len(cells) < 2:
+            continue
+        rng = random.Random(seed)
+        start, goal = rng.sample(cells, 2)
+        grid = Grid(maze)
+        planner = DStarLite(grid, start, goal)
+        leg = planner.replan()
+
+        for _ in range(15):
+            #### Walk a few steps along the current leg, then shut or open some cells
+            if leg is not None and leg.path:
+                start = leg.path[min(len(leg.path), rng.randint(1, 3)) - 1]
+            changes = {}
+            for _ in range(rng.randint(1, 3)):
+                cell = (rng.randrange(grid.rows), rng.randrange(grid.cols))
+                if cell not in (start, goal):
+                    changes[cell] = rng.random() < 0.5
+
+            leg = planner.replan(start=start, changes=changes)
+            expected = find_leg(Grid(maze), start, [goal], "A*")
+            if expected is None:
+                assert leg is None
+                continue
+            assert leg.cost == expected.cost
+            assert leg.goal == goal
+            assert walkable(maze, leg)
+
+
+def test_algorithm_name_matches_astar_for_ward_targets(random_maze):
+    for seed in range(150):
+        maze, cells = random_maze(seed)
+        if len(cells) < 4:
+            continue
+        rng = random.Random(seed)
+        grid = Grid(maze)
+        wards = [rng.sample(cells, rng.randint(1, 3)) for _ in range(3)]
+        for _ in range(10):
+            grid.set_wall(rng.choice(cells), rng.random() < 0.3)
+            start = rng.choice(cells)
+            goals = rng.choice(wards)
+            leg = find_leg(grid, start, goals, "D* Lite")
+            expected = find_leg(grid, start, goals, "A*")
+            assert (leg is None) == (expected is None)
+            if leg is not None:
+                assert leg.cost == expected.cost
+                assert leg.goal in goals
+
+
+def test_wall_change_is_repaired_not_searched_again():
+    grid = Grid([[0] * 40 for _ in range(40)])
+    first = find_leg(grid, (0, 0), [(39, 39)], "D* Lite")
+    planner = planner_for(grid, (0, 0), [(39, 39)])
+    full = planner.expanded
+
+    #### Block a corridor cell far from the route's start
+    grid.set_wall(first.path[-5])
+    leg = find_leg(grid, (0, 0), [(39, 39)], "D* Lite")
+    assert planner_for(grid, (0, 0), [(39, 39)]) is planner
+    assert leg.cost == 78
+    assert first.path[-5] not in leg.path
+    assert planner.expanded - full < full
+
+
+def test_missed_changes_rebuild_the_tree():
+    grid = Grid([[0] * 20 for _ in range(20)])
+    planner = DStarLite(grid, (0, 0), (19, 19))
+    assert planner.replan().cost == 38
+
+    #### More changes than the grid remembers, ending with a wall row
+    for i in range(CHANGE_LOG + 1):
+        grid.set_wall((5, 5), i % 2 == 0)
+    for c in range(19):
+        grid.set_wall((10, c))
+    leg = planner.replan()
+    assert leg.cost == find_leg(grid, (0, 0), [(19, 19)], "A*").cost
+    assert (10, 19) in leg.path
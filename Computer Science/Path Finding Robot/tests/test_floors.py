@@ -0,0 +1,125 @@
+#### Building.route() across two copies of the hospital floor
+import heapq
+import random
+
+import pytest
+
+from floors import Building
+from hospital import maze
+from routing import Grid, search
+
+ELEVATORS = [((18, 1), 15), ((7, 29), 40)]
+
+
+@pytest.fixture
+def building():
+    building = Building({1: maze, 2: [row[:] for row in maze]})
+    for pos, cost in ELEVATORS:
+        building.add_transition(1, pos, 2, pos, cost)
+    return building
+
+
+def open_cells(grid, count, seed):
+    rng = random.Random(seed)
+    cells = [(r, c) for r in range(grid.rows) for c in range(grid.cols) if grid.is_open((r, c))]
+    return rng.sample(cells, count)
+
+
+#### Cheapest walk, ride one elevator, walk
+def expected_cost(grid, start, goal):
+    best = None
+    for pos, cost in ELEVATORS:
+        there, back = search(grid, start, pos), search(grid, pos, goal)
+        if there is not None and back is not None:
+            total = there.cost + cost + back.cost
+            best = total if best is None else min(best, total)
+    return best
+
+
+def test_routes_are_cheapest_and_walkable(building):
+    grid = Grid(maze)
+    for start, goal in zip(open_cells(grid, 20, 1), open_cells(grid, 20, 2)):
+        route = building.route((1, start), (2, goal))
+        expected = expected_cost(grid, start, goal)
+        if expected is None:
+            assert route is None
+            continue
+        assert route.cost == expected
+
+        position = (1, start)
+        for step in route.steps:
+            if step[0] == "ride":
+                assert position == (step[1].from_floor, step[1].from_pos)
+                position = (step[1].to_floor, step[1].to_pos)
+                continue
+            _, floor_id, leg = step
+            cells = [position[1]] + leg.path
+            assert all(grid.is_open(cell) for cell in cells)
+            assert all(abs(a[0] - b[0]) + abs(a[1] - b[1]) == 1 for a, b in zip(cells, cells[1:]))
+            position = (floor_id, leg.goal)
+        assert position == (2, goal)
+
+
+def test_goals_do_not_grow_the_tables(building):
+    grid = Grid(maze)
+    start = open_cells(grid, 1, 3)[0]
+    for goal in open_cells(grid, 30, 4):
+        building.route((1, start), (1, goal))
+        building.route((1, start), (2, goal))
+    assert all(len(floor.table.dist) == len(ELEVATORS) for floor in building.loaded.values())
+
+
+#### Dijkstra over every (floor, cell), walking and riding
+def reference_cost(floors, building, start, goal):
+    dist = {start: 0}
+    heap = [(0, start)]
+    while heap:
+        cost, (floor_id, (r, c)) = heapq.heappop(heap)
+        if (floor_id, (r, c)) == goal:
+            return cost
+        if cost > dist[(floor_id, (r, c))]:
+            continue
+        grid = Grid(floors[floor_id])
+        moves = [((floor_id, n), 1) for n in ((r, c + 1), (r, c - 1), (r + 1, c), (r - 1, c)) if grid.is_open(n)]
+        moves += [((t.to_floor, t.to_pos), t.cost) for t in building.exits.get(floor_id, []) if t.from_pos == (r, c)]
+        for n, step in moves:
+            if cost + step < dist.get(n, float("inf")):
+                dist[n] = cost + step
+                heapq.heappush(heap, (cost + step, n))
+    return None
+
+
+def test_ride_away_and_back_beats_walking():
+    #### Up from (9, 0), one step on floor 2, back down next to the goal:
+    #### 3 moves instead of a 27-step walk along floor 1
+    floor = [[0] * 20 for _ in range(10)]
+    building = Building({1: floor, 2: [row[:] for row in floor]})
+    building.add_transition(1, (9, 0), 2, (0, 0), 0, both_ways=False)
+    building.add_transition(2, (0, 1), 1, (0, 18), 0, both_ways=False)
+    route = building.route((1, (8, 0)), (1, (0, 19)))
+    assert route.cost == 3
+    assert len(route.transitions) == 2
+
+
+def test_rides_landing_on_other_cells(random_maze):
+    #### Elevators that come out somewhere else: going up and back down
+    #### can be shorter than walking across a floor
+    for seed in range(300):
+        rng = random.Random(seed)
+        floors, cells = {}, {}
+        for floor_id in (1, 2, 3):
+            floors[floor_id], cells[floor_id] = random_maze(seed * 3 + floor_id, walls=0.2)
+        if any(len(c) < 2 for c in cells.values()):
+            continue
+        building = Building(floors)
+        for _ in range(rng.randint(1, 5)):
+            a, b = rng.sample([1, 2, 3], 2)
+            building.add_transition(a, rng.choice(cells[a]), b, rng.choice(cells[b]), rng.randint(0, 4),
+                                    both_ways=rng.random() < 0.5)
+
+        for _ in range(5):
+            a, b = rng.choice([1, 2, 3]), rng.choice([1, 2, 3])
+            start, goal = (a, rng.choice(cells[a])), (b, rng.choice(cells[b]))
+            route = building.route(start, goal)
+            expected = reference_cost(floors, building, start, goal)
+            assert (route.cost if route else None) == expected
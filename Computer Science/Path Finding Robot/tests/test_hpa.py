@@ -0,0 +1,35 @@
+#### HPA* legs must be walkable and close to the shortest path
+import pytest
+
+from hospital import drop_off_points, maze, ward_locations
+from hpa import hierarchy_for
+from routing import Grid, search_any
+
+
+@pytest.fixture(scope="module")
+def grid():
+    return Grid(maze)
+
+
+def walkable(grid, leg):
+    cells = [leg.start] + leg.path
+    return (all(grid.is_open(cell) for cell in cells) and
+            all(abs(a[0] - b[0]) + abs(a[1] - b[1]) == 1 for a, b in zip(cells, cells[1:])))
+
+
+def test_ward_legs_are_near_shortest(grid):
+    hierarchy = hierarchy_for(grid)
+    wards = [[tuple(loc) for loc in locs] for locs in ward_locations.values() if locs]
+    exact = found = 0
+    for start in drop_off_points():
+        for targets in wards:
+            shortest = search_any(grid, start, targets, "A*")
+            leg = hierarchy.search(start, targets)
+            if shortest is None:
+                assert leg is None
+                continue
+            assert walkable(grid, leg) and leg.goal in targets
+            assert shortest.cost <= leg.cost <= 1.2 * shortest.cost
+            exact += shortest.cost
+            found += leg.cost
+    assert found <= 1.01 * exact
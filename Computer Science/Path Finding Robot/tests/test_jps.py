@@ -0,0 +1,38 @@
+#### Jump Point Search costs must equal breadth-first search on random grids
+import random
+
+import pytest
+
+from jps import jump_search
+from routing import Grid, search_any
+from stats import disable_stats, enable_stats
+
+
+@pytest.mark.parametrize("diagonal", [False, True], ids=["4-way", "8-way"])
+def test_costs_match_bfs(random_maze, bfs_cost, walkable, diagonal):
+    for seed in range(300):
+        maze, cells = random_maze(seed)
+        if len(cells) < 2:
+            continue
+        rng = random.Random(seed)
+        start = rng.choice(cells)
+        goals = rng.sample(cells, min(len(cells), rng.randint(1, 3)))
+
+        leg = jump_search(Grid(maze), start, goals, diagonal=diagonal)
+        expected = bfs_cost(maze, start, goals, diagonal)
+        if expected is None:
+            assert leg is None
+            continue
+        assert leg.cost == expected
+        assert leg.goal in goals
+        assert walkable(maze, leg, diagonal)
+
+
+def test_open_floor_expands_few_cells():
+    enable_stats()
+    try:
+        leg = search_any(Grid([[0] * 60 for _ in range(60)]), (0, 0), [(59, 59)], "JPS")
+    finally:
+        disable_stats()
+    assert leg.cost == 118
+    assert leg.stats.expanded < 200
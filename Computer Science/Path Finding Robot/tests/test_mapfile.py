@@ -0,0 +1,48 @@
+#### Map files must load back exactly what was saved
+import pytest
+
+import hospital
+from mapfile import hospital_metadata, import_text, load_map, save_map
+from routing import Grid
+
+
+def test_hospital_round_trip(tmp_path):
+    path = tmp_path / "hospital.hmap"
+    save_map(path, hospital.maze)
+    with load_map(path) as loaded:
+        assert (loaded.rows, loaded.cols) == (len(hospital.maze), len(hospital.maze[0]))
+        assert loaded.to_maze() == hospital.maze
+        assert loaded.value((20, 10)) == hospital.maze[20][10]
+        assert loaded.grid().open == Grid(hospital.maze).open
+        assert loaded.metadata == hospital_metadata()
+
+
+def test_custom_metadata_round_trip(tmp_path):
+    maze = [[0, 1, 2], [13, 0, 1]]
+    metadata = {"ward_priority": {2: 5}, "ward_locations": {2: [(0, 2)]}, "default_start": (1, 1), "name": "annex"}
+    save_map(tmp_path / "annex.hmap", maze, metadata)
+    with load_map(tmp_path / "annex.hmap") as loaded:
+        assert loaded.to_maze() == maze
+        assert loaded.metadata == metadata
+
+
+def test_import_text(tmp_path):
+    path = tmp_path / "maze.txt"
+    path.write_text("maze = [\n    [0, 1],\n    [2, 0],\n]\n")
+    assert import_text(path) == [[0, 1], [2, 0]]
+
+    path.write_text("[[0, 1], [0]]")
+    with pytest.raises(ValueError):
+        import_text(path)
+
+
+def test_bad_files_are_rejected(tmp_path):
+    path = tmp_path / "bad.hmap"
+    path.write_bytes(b"NOPE" + bytes(32))
+    with pytest.raises(ValueError, match="not a map file"):
+        load_map(path)
+
+    save_map(path, [[0] * 8 for _ in range(8)], {})
+    path.write_bytes(path.read_bytes()[:-1])
+    with pytest.raises(ValueError, match="truncated"):
+        load_map(path)
@@ -0,0 +1,56 @@
+#### LegPlanner hands over the legs plan() would plan, profiles them and reports errors
+import os
+import time
+
+import pytest
+
+import pipeline
+from hospital import maze, read_input_file
+from profiling import Profiler
+from routing import Grid, plan
+
+ROBOT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+#### Poll ready() like the viewer does until the planner is finished
+def drain(planner, timeout=10):
+    items = []
+    deadline = time.monotonic() + timeout
+    while not planner.finished:
+        assert time.monotonic() < deadline
+        items.extend(planner.ready())
+        time.sleep(0.001)
+    return items
+
+
+def test_planner_legs_match_plan_and_are_profiled(monkeypatch):
+    profiler = Profiler()
+    profiler.enabled = True
+    monkeypatch.setattr(pipeline, "profiler", profiler)
+
+    grid = Grid(maze)
+    algorithm, start, goals = read_input_file(os.path.join(ROBOT_DIR, "inputfile1.txt"))
+    planner = pipeline.LegPlanner(grid, start, goals, algorithm)
+    planner.start()
+    items = drain(planner)
+
+    assert [leg.path for _, _, leg, _ in items] == [leg.path for leg in plan(grid, start, goals, algorithm).legs]
+    assert profiler.phases["search"][0] == len(goals)
+
+
+def test_ready_hands_over_legs_before_raising(monkeypatch):
+    def failing_legs(maze, start, goals, algorithm, table, cache):
+        yield "first leg", None
+        yield "second leg", None
+        raise RuntimeError("planner failed")
+
+    monkeypatch.setattr(pipeline, "plan_legs", failing_legs)
+    planner = pipeline.LegPlanner(Grid(maze), (0, 0), ["a", "b", "c"])
+    planner.start()
+    planner.thread.join()
+
+    assert [leg for _, _, leg, _ in planner.ready()] == ["first leg", "second leg"]
+    assert not planner.finished
+    with pytest.raises(RuntimeError, match="planner failed"):
+        planner.ready()
+    assert planner.finished
@@ -0,0 +1,57 @@
+#### RouteCache hits, LRU eviction, and misses after the map changes
+from hospital import maze
+from routecache import RouteCache, map_hash
+from routing import Grid, plan, search_any
+
+
+def counting(grid, start, targets):
+    calls = []
+
+    def compute():
+        calls.append(start)
+        return search_any(grid, start, targets)
+    return compute, calls
+
+
+def test_repeated_leg_is_a_hit():
+    grid = Grid(maze)
+    cache = RouteCache()
+    compute, calls = counting(grid, (19, 3), [(24, 3)])
+    first = cache.leg(grid, (19, 3), [(24, 3)], "A*", compute)
+    second = cache.leg(grid, (19, 3), [(24, 3)], "a*", compute)
+    assert second is first
+    assert len(calls) == 1
+    assert (cache.hits, cache.misses) == (1, 1)
+    assert cache.stats()["hit_rate"] == 0.5
+
+
+def test_least_recently_used_leg_is_evicted():
+    grid = Grid(maze)
+    cache = RouteCache(max_entries=2)
+    starts = [(19, 3), (24, 3), (19, 4)]
+    for start in starts:
+        cache.leg(grid, start, [(20, 10)], "A*", counting(grid, start, [(20, 10)])[0])
+    assert len(cache) == 2
+
+    #### (19, 3) was the oldest, so it is searched again; (19, 4) is still cached
+    compute, calls = counting(grid, (19, 3), [(20, 10)])
+    cache.leg(grid, (19, 3), [(20, 10)], "A*", compute)
+    cache.leg(grid, (19, 4), [(20, 10)], "A*", compute)
+    assert calls == [(19, 3)]
+
+
+def test_wall_change_is_a_miss():
+    grid = Grid([row[:] for row in maze])
+    cache = RouteCache()
+    before = map_hash(grid)
+    route = plan(grid, (19, 3), [(24, 3)], cache=cache)
+    assert cache.misses == 1
+
+    grid.set_wall(route.legs[0].path[0])
+    assert map_hash(grid) != before
+    detour = plan(grid, (19, 3), [(24, 3)], cache=cache)
+    assert (cache.hits, cache.misses) == (0, 2)
+    assert route.legs[0].path[0] not in detour.legs[0].path
+
+    plan(grid, (19, 3), [(24, 3)], cache=cache)
+    assert cache.hits == 1
@@ -0,0 +1,58 @@
+#### Which plan() legs may come from the drop-off table, and search state reuse
+import os
+
+import pytest
+
+from distances import DistanceTable
+from hospital import drop_off_points, maze, read_input_file
+from routing import GENERATION_LIMIT, Grid, plan
+from stats import disable_stats, enable_stats
+
+ROBOT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+@pytest.fixture
+def trip():
+    enable_stats()
+    try:
+        grid = Grid(maze)
+        table = DistanceTable(grid, drop_off_points())
+        _, start, goals = read_input_file(os.path.join(ROBOT_DIR, "inputfile1.txt"))
+        yield grid, table, start, goals
+    finally:
+        disable_stats()
+
+
+@pytest.mark.parametrize("algorithm", ["A*", "Dijkstra"])
+def test_shortest_path_legs_come_from_table(trip, algorithm):
+    grid, table, start, goals = trip
+    route = plan(grid, start, goals, algorithm, table)
+    assert [stats.source for stats in route.stats] == ["table"] * len(goals)
+    assert route.cost == plan(grid, start, goals, algorithm).cost
+
+
+@pytest.mark.parametrize("algorithm", ["Greedy", "JPS", "Bidirectional A*", "Bidirectional Dijkstra", "HPA*"])
+def test_other_algorithms_search_their_own_legs(trip, algorithm):
+    grid, table, start, goals = trip
+    route = plan(grid, start, goals, algorithm, table)
+    searched = plan(grid, start, goals, algorithm)
+    assert [stats.source for stats in route.stats] == ["search"] * len(goals)
+    assert [leg.path for leg in route.legs] == [leg.path for leg in searched.legs]
+    if algorithm != "HPA*":
+        #### HPA* has no per-cell open set to count
+        assert [stats.expanded for stats in route.stats] == [stats.expanded for stats in searched.stats]
+        assert all(stats.expanded for stats in route.stats)
+
+
+@pytest.mark.parametrize("algorithm", ["A*", "Dijkstra", "JPS", "Bidirectional A*"])
+def test_searches_survive_generation_wrap(algorithm):
+    _, start, goals = read_input_file(os.path.join(ROBOT_DIR, "inputfile2.txt"))
+    expected = plan(Grid(maze), start, goals, algorithm)
+
+    grid = Grid(maze)
+    plan(grid, start, goals, algorithm)
+    for state in grid.states.values():
+        state.generation = GENERATION_LIMIT - 1
+    route = plan(grid, start, goals, algorithm)
+    assert all(state.generation < GENERATION_LIMIT for state in grid.states.values())
+    assert [leg and leg.path for leg in route.legs] == [leg and leg.path for leg in expected.legs]
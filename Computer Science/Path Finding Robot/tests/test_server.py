@@ -0,0 +1,68 @@
+#### Route requests answered on a thread pool must match serial answers
+import random
+import sys
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+import server
+from hospital import ward_codes
+
+ALGORITHMS = ["A*", "Greedy", "Dijkstra", "JPS", "Bidirectional A*", "HPA*"]
+
+
+def requests(count, seed=1):
+    rng = random.Random(seed)
+    names = list(ward_codes)
+    return [{"id": i, "start": rng.choice(names), "goals": rng.sample(names, 4),
+             "algorithm": rng.choice(ALGORITHMS)} for i in range(count)]
+
+
+def test_threaded_requests_match_serial():
+    server.load_worker()
+    batch = requests(300)
+    serial = [server.route_request(request) for request in batch]
+
+    #### Switch threads often so searches really interleave
+    interval = sys.getswitchinterval()
+    sys.setswitchinterval(1e-6)
+    try:
+        for _ in range(3):
+            #### Start cold so every thread really searches
+            server.worker["cache"].clear()
+            with ThreadPoolExecutor(max_workers=8) as pool:
+                assert list(pool.map(server.route_request, batch)) == serial
+    finally:
+        sys.setswitchinterval(interval)
+
+
+def test_each_thread_searches_on_its_own_grid():
+    server.load_worker()
+    with ThreadPoolExecutor(max_workers=4) as pool:
+        grids = list(pool.map(lambda _: server.worker_grid(), range(4)))
+    main = server.worker_grid()
+    assert main is server.worker_grid()
+    assert main is not server.worker["grid"]
+    assert all(grid.open is server.worker["grid"].open for grid in grids)
+    assert all(grid is not main for grid in grids)
+    assert all(grid.cache is server.worker["grid"].cache for grid in grids)
+
+
+def test_threads_share_one_hpa_graph():
+    server.load_worker()
+    with ThreadPoolExecutor(max_workers=4) as pool:
+        list(pool.map(server.route_request, [{"goals": ["ICU"], "algorithm": "HPA*"}] * 8))
+    assert [key[0] for key in server.worker["grid"].cache].count("hpa") == 1
+
+
+@pytest.mark.parametrize("request_", [
+    {"goals": "ICU"},
+    {"goals": ["ICU", 5]},
+    {"goals": ["ICU"], "algorithm": 5},
+    {"goals": ["ICU"], "algorithm": "Teleport"},
+    {"start": ["ER"], "goals": ["ICU"]},
+])
+def test_malformed_requests_are_rejected(request_):
+    server.load_worker()
+    with pytest.raises(ValueError):
+        server.route_request(request_)
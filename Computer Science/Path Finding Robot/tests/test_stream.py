@@ -0,0 +1,29 @@
+#### stream.py's stdout must stay machine-readable JSON lines
+import json
+import os
+import subprocess
+import sys
+
+ROBOT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+LINES = [
+    "Start: ER",
+    "ICU",
+    "Narnia",
+    '{"id": 7, "ward": "Oncology", "start": "Admissions"}',
+    '{"id": 8, "ward": "Atlantis"}',
+    "{not json",
+    "Start: Nowhere",
+    "Burn",
+]
+
+
+def test_stdout_carries_only_records():
+    result = subprocess.run([sys.executable, os.path.join(ROBOT_DIR, "stream.py"), "-"],
+                            input="\n".join(LINES) + "\n", capture_output=True, text=True, check=True)
+    records = [json.loads(line) for line in result.stdout.splitlines()]
+    #### Waiting requests are served by priority, so the order depends on timing
+    assert sorted(record["ward"] for record in records) == ["BURN", "ICU", "ONCOLOGY"]
+    assert {record["ward"]: record["id"] for record in records}["ONCOLOGY"] == 7
+    for message in ("Start location set", "Unknown ward name", "Unreadable request line", "Unknown start ward"):
+        assert message in result.stderr
@@ -0,0 +1,53 @@
+#### order_goals() must never make a bundled input file's trip longer
+import glob
+import itertools
+import os
+
+import pytest
+
+from distances import DistanceTable
+from hospital import drop_off_points, maze, read_input_file
+from routing import Grid, plan
+from tour import order_goals, priority_tiers
+
+ROBOT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+INPUT_FILES = sorted(glob.glob(os.path.join(ROBOT_DIR, "inputfile*.txt")))
+
+
+#### (fewest goals missed, walked cost) of the trip plan() drives
+def score(grid, table, algorithm, start, goals):
+    route = plan(grid, start, goals, algorithm, table)
+    return -route.completed, route.cost
+
+
+@pytest.mark.parametrize("input_file", INPUT_FILES, ids=os.path.basename)
+def test_order_goals_never_worse_than_file_order(input_file):
+    grid = Grid(maze)
+    table = DistanceTable(grid, drop_off_points())
+    algorithm, start, goals = read_input_file(input_file)
+
+    ordered = order_goals(grid, start, goals, algorithm, table)
+    assert sorted(map(id, ordered)) == sorted(map(id, goals))
+    assert score(grid, table, algorithm, start, ordered) <= score(grid, table, algorithm, start, goals)
+
+
+@pytest.mark.parametrize("algorithm", [None, "Greedy", "HPA*"], ids=["file", "greedy", "hpa"])
+@pytest.mark.parametrize("input_file", INPUT_FILES, ids=os.path.basename)
+def test_order_goals_matches_brute_force(input_file, algorithm):
+    #### Orders are scored with the legs the trip's own algorithm walks
+    grid = Grid(maze)
+    table = DistanceTable(grid, drop_off_points())
+    file_algorithm, start, goals = read_input_file(input_file)
+    algorithm = algorithm or file_algorithm
+
+    best = min(score(grid, table, algorithm, start, [goal for tier in tiers for goal in tier])
+               for tiers in itertools.product(*[itertools.permutations(tier) for tier in priority_tiers(goals)]))
+    assert score(grid, table, algorithm, start, order_goals(grid, start, goals, algorithm, table)) == best
+
+
+def test_order_goals_without_table_matches_table():
+    grid = Grid(maze)
+    table = DistanceTable(grid, drop_off_points())
+    algorithm, start, goals = read_input_file(os.path.join(ROBOT_DIR, "inputfile_partial.txt"))
+    assert (score(grid, table, algorithm, start, order_goals(grid, start, goals, algorithm)) ==
+            score(grid, table, algorithm, start, order_goals(grid, start, goals, algorithm, table)))
@@ -0,0 +1,232 @@
+#######################################################
+#### Adam Syed and Teagan Clark
+#### 11/24/25
+#### Purpose: Order the delivery stops so the robot walks as little as
+#### possible. Priority tiers stay strict (high priority first); only the
+#### order of stops *within* a tier is optimized, using real grid
+#### distances. A stop with several drop-offs is scored the way plan()
+#### drives it: to the nearest drop-off from wherever the robot is, and
+#### on from there. Small tiers are solved exactly with Held-Karp, large
+#### tiers with a nearest-neighbour tour improved by 2-opt and Or-opt.
+#######################################################
+from routing import algorithm_key, as_grid, goal_targets, search_any
+
+
+#### Tiers with at most this many stops are solved exactly
+EXACT_LIMIT = 10
+
+INF = float("inf")
+
+
+############################################################
+#### Walking distance from a to the nearest drop-off of goal, and that
+#### drop-off: (distance, drop-off), or None if none can be reached.
+#### The leg is searched with the trip's algorithm, so a Greedy or HPA*
+#### trip is ordered by the legs it will actually walk. Like plan(), A*
+#### and Dijkstra use the DistanceTable when it holds every drop-off of
+#### the goal and was built for the grid's current version.
+############################################################
+def walk_leg(grid, table, a, goal, algorithm="A*"):
+    targets = goal_targets(goal)
+    if (table is not None and table.version == grid.version and algorithm_key(algorithm) in ("a*", "dijkstra") and
+            all(t in table for t in targets)):
+        best = None
+        for target in targets:
+            d = table.distance(a, target)
+            if d is not None and (best is None or d < best[0]):
+                best = (d, target)
+        return best
+    if a in targets:
+        return 0, a
+    leg = search_any(grid, a, targets, algorithm)
+    return None if leg is None else (leg.cost, leg.goal)
+
+
+############################################################
+#### Split goals (already sorted high priority first) into tiers of
+#### equal priority. Goals are (row, col, priority, ...) tuples.
+############################################################
+def priority_tiers(goals):
+    tiers = []
+    for goal in goals:
+        if tiers and tiers[-1][0][2] == goal[2]:
+            tiers[-1].append(goal)
+        else:
+            tiers.append([goal])
+    return tiers
+
+
+############################################################
+#### Reorder goals tier by tier, starting from start, for a trip that
+#### plan() will drive with algorithm.
+#### Where a tier ends decides what the next tier costs, so every drop-off
+#### a tier can end on is carried into the next tier with its cost, and
+#### the order is read back from the cheapest final position.
+#### Stops that cannot be reached are kept at the end of their tier.
+############################################################
+def order_goals(maze, start, goals, algorithm="A*", table=None, exact_limit=EXACT_LIMIT):
+    grid = as_grid(maze)
+    frontier = {tuple(start): 0}
+    steps = []
+
+    for tier in priority_tiers(goals):
+        frontier, back, unreachable = order_tier(grid, table, frontier, tier, algorithm, exact_limit)
+        steps.append((tier, back, unreachable))
+
+    pos = min(frontier, key=frontier.get)
+    ordered = []
+    for tier, back, unreachable in reversed(steps):
+        previous, order = back[pos]
+        ordered[:0] = [tier[k] for k in order] + unreachable
+        pos = previous
+    return ordered
+
+
+############################################################
+#### Shortest visiting orders for one tier.
+#### frontier maps each position the previous tier can end on to the
+#### cost of getting there. A leg's cost depends on which drop-off the
+#### robot stands on, so tours are scored by walking them: each leg goes
+#### to the nearest drop-off of the next stop and continues from there;
+#### leg(pos, k) memoizes those legs.
+#### Returns (new frontier, {end: (frontier position, order)}, unreachable goals).
+############################################################
+def order_tier(grid, table, frontier, tier, algorithm="A*", exact_limit=EXACT_LIMIT):
+    legs = {}
+
+    def leg(pos, k):
+        if (pos, k) not in legs:
+            legs[(pos, k)] = walk_leg(grid, table, pos, tier[k], algorithm)
+        return legs[(pos, k)]
+
+    #### Every frontier position lies in the start's component
+    origin = next(iter(frontier))
+    reachable = [k for k in range(len(tier)) if leg(origin, k) is not None]
+    unreachable = [tier[k] for k in range(len(tier)) if leg(origin, k) is None]
+    if not reachable:
+        return frontier, {pos: (pos, []) for pos in frontier}, unreachable
+
+    if len(reachable) <= exact_limit:
+        ends = held_karp(frontier, reachable, leg)
+    else:
+        first = min(frontier, key=frontier.get)
+        order = improve_tour(first, nearest_neighbour_tour(first, reachable, leg), leg)
+        length, end = walk_tour(first, order, leg)
+        ends = {end: (frontier[first] + length, first, order)}
+
+    return ({end: cost for end, (cost, _, _) in ends.items()},
+            {end: (previous, order) for end, (_, previous, order) in ends.items()},
+            unreachable)
+
+
+############################################################
+#### Walk the stops in order: (total distance, final position).
+#### Every stop is reachable from the start, and every drop-off reached
+#### lies in the start's component, so every leg exists.
+############################################################
+def walk_tour(start, order, leg):
+    total = 0
+    pos = start
+    for k in order:
+        d, pos = leg(pos, k)
+        total += d
+    return total, pos
+
+
+def tour_length(start, order, leg):
+    return walk_tour(start, order, leg)[0]
+
+
+############################################################
+#### Held-Karp dynamic program over (visited stops, drop-off the robot
+#### stands on), started from every frontier position at its cost.
+#### From a position the next leg is fixed (nearest drop-off), so the
+#### table only holds positions that can actually be reached.
+#### O(2^n * n * positions). Returns {end: (cost, frontier position, order)}.
+############################################################
+def held_karp(frontier, stops, leg):
+    n = len(stops)
+    full = 1 << n
+
+    #### layers[mask][pos] = (cost, previous position, stop index j)
+    layers = [dict() for _ in range(full)]
+    for pos, cost in frontier.items():
+        layers[0][pos] = (cost, None, -1)
+
+    for mask in range(full):
+        for pos, (here, _, _) in layers[mask].items():
+            for j in range(n):
+                if mask & (1 << j):
+                    continue
+                d, end = leg(pos, stops[j])
+                new_mask = mask | (1 << j)
+                best = layers[new_mask].get(end)
+                if best is None or here + d < best[0]:
+                    layers[new_mask][end] = (here + d, pos, j)
+
+    #### Walk the parents back from every final position
+    ends = {}
+    for end, (cost, _, _) in layers[full - 1].items():
+        pos, mask, order = end, full - 1, []
+        while mask:
+            _, previous, j = layers[mask][pos]
+            order.append(stops[j])
+            mask, pos = mask ^ (1 << j), previous
+        order.reverse()
+        ends[end] = (cost, pos, order)
+    return ends
+
+
+############################################################
+#### Greedy starting tour: always walk to the closest unvisited stop
+############################################################
+def nearest_neighbour_tour(start, stops, leg):
+    unvisited = list(stops)
+    order = []
+    pos = start
+    while unvisited:
+        k = min(unvisited, key=lambda k: (leg(pos, k)[0], k))
+        unvisited.remove(k)
+        order.append(k)
+        pos = leg(pos, k)[1]
+    return order
+
+
+############################################################
+#### 2-opt and Or-opt moves on an open path with a fixed start.
+#### Leg costs depend on the drop-off reached before, so every
+#### candidate is scored by walking it. The first shorter candidate
+#### replaces the tour; repeats until no move makes the path shorter.
+############################################################
+def improve_tour(start, order, leg):
+    tour = list(order)
+    best = tour_length(start, tour, leg)
+    improved = True
+
+    while improved:
+        improved = False
+        for candidate in tour_moves(tour):
+            length = tour_length(start, candidate, leg)
+            if length < best:
+                tour, best, improved = candidate, length, True
+                break
+
+    return tour
+
+
+def tour_moves(tour):
+    #### 2-opt: reverse tour[i..j]
+    for i in range(len(tour) - 1):
+        for j in range(i + 1, len(tour)):
+            yield tour[:i] + tour[i:j + 1][::-1] + tour[j + 1:]
+
+    #### Or-opt: move a run of 1-3 stops somewhere else in the path,
+    #### possibly reversed
+    for length in (1, 2, 3):
+        for i in range(len(tour) - length + 1):
+            segment = tour[i:i + length]
+            rest = tour[:i] + tour[i + length:]
+            for k in range(len(rest) + 1):
+                if k != i:
+                    yield rest[:k] + segment + rest[k:]
+                yield rest[:k] + segment[::-1] + rest[k:]
@@ -0,0 +1,366 @@
+#######################################################
+#### Adam Syed and Teagan Clark
+#### 11/24/25
+#### Purpose: Viewport renderer for the viewer. Only the cells inside the
+#### window are drawn, so the number of canvas items depends on the window
+#### size and not on the map size. The view can be panned (drag with the
+#### left mouse button) and zoomed (mouse wheel). When cells get too small
+#### for one rectangle each, the whole view is drawn as a single raster
+#### image instead, with the routes painted into it.
+#######################################################
+import math
+from operator import itemgetter
+
+import tkinter as tk
+
+#### Below this cell size (pixels) the view is drawn as one raster image
+RASTER_BELOW = 20
+
+#### Cell labels (START, GOAL, g/h) are only drawn on cells at least this big
+LABEL_MIN = 20
+
+#### Largest cell size the view can be zoomed in to
+MAX_CELL_SIZE = 100
+
+#### Zoom step of one mouse wheel notch
+ZOOM_STEP = 1.25
+
+
+######################################################
+#### cells holds one value per cell, row by row (bytes, or the memoryview
+#### of a map file); colors maps a cell value to its fill colour.
+#### What the animation changes (fills, labels, the agent) is kept per
+#### cell in fills/labels, so cells scrolled out of view lose nothing.
+#### set_cell() and move_agent() only record changes; flush() draws the
+#### changes that are visible, and redraw() draws the whole view again
+#### after a pan or zoom.
+#### left/top are the map coordinates (in cells) of the view's top-left
+#### corner, cell_size is the size of one cell in pixels.
+######################################################
+class Viewport:
+    def __init__(self, canvas, rows, cols, cells, colors, default_color="white", cell_size=25, width=None, height=None):
+        self.canvas = canvas
+        self.rows = rows
+        self.cols = cols
+        self.cells = cells
+        self.colors = colors
+        self.default_color = default_color
+        self.width = width or cols * cell_size
+        self.height = height or rows * cell_size
+
+        self.left = 0.0
+        self.top = 0.0
+        self.cell_size = cell_size
+        self.min_cell_size = min(cell_size, self.width / cols, self.height / rows)
+        self.fit()
+
+        #### Per-cell changes on top of the map colours
+        self.fills = {}         # cell -> fill colour
+        self.labels = {}        # cell -> (text, font, text colour)
+        self.dirty = set()
+        self.agent = None
+        self.agent_color = "navy"
+        self.agent_moved = False
+
+        #### Item mode: pooled rectangles and texts for the visible cells
+        self.rects = []
+        self.rects_shown = 0
+        self.cell_rects = {}    # visible cell -> rectangle item
+        self.texts_free = []
+        self.cell_texts = {}    # visible labelled cell -> text item
+
+        #### Raster mode: one image item and its photo
+        self.raster = False
+        self.image = None
+        self.image_item = None
+        self.rgb = {}           # colour name -> (r, g, b), 0-255
+
+        self.agent_item = None
+        self.redraw_pending = None
+        self.drag = None
+
+    ############################################################
+    #### Mouse bindings: drag to pan, wheel to zoom around the pointer,
+    #### and keep the view size in step with the window
+    ############################################################
+    def bind(self):
+        self.canvas.bind("<ButtonPress-1>", self.start_drag)
+        self.canvas.bind("<B1-Motion>", self.drag_to)
+        self.canvas.bind("<MouseWheel>", self.wheel)
+        self.canvas.bind("<Button-4>", self.wheel)
+        self.canvas.bind("<Button-5>", self.wheel)
+        self.canvas.bind("<Configure>", self.resize)
+
+    #### Zoom out until the whole map fits in the view, if it does not already
+    def fit(self):
+        self.cell_size = min(self.cell_size, max(self.min_cell_size, min(self.width / self.cols, self.height / self.rows)))
+        self.left = self.top = 0.0
+        self.clamp()
+
+    #### Keep the map inside the view when it is bigger than the view
+    def clamp(self):
+        self.left = min(max(self.left, 0.0), max(0.0, self.cols - self.width / self.cell_size))
+        self.top = min(max(self.top, 0.0), max(0.0, self.rows - self.height / self.cell_size))
+
+    #### First and last (exclusive) visible row and column
+    def visible_range(self):
+        size = self.cell_size
+        r0 = max(0, int(self.top))
+        c0 = max(0, int(self.left))
+        r1 = min(self.rows, math.ceil(self.top + self.height / size))
+        c1 = min(self.cols, math.ceil(self.left + self.width / size))
+        return r0, r1, c0, c1
+
+    def is_visible(self, cell):
+        r0, r1, c0, c1 = self.visible_range()
+        return r0 <= cell[0] < r1 and c0 <= cell[1] < c1
+
+    #### Canvas coordinates of a cell's square
+    def cell_box(self, r, c):
+        size = self.cell_size
+        x, y = (c - self.left) * size, (r - self.top) * size
+        return (x, y, x + size, y + size)
+
+    def color_of(self, cell):
+        if cell in self.fills:
+            return self.fills[cell]
+        return self.colors.get(self.cells[cell[0] * self.cols + cell[1]], self.default_color)
+
+    ############################################################
+    #### Recording changes (drawn by the next flush)
+    ############################################################
+    def set_cell(self, cell, fill=None, text=None, font=None, text_fill=None):
+        cell = tuple(cell)
+        if fill is not None:
+            self.fills[cell] = fill
+        if text is not None:
+            old_text, old_font, old_fill = self.labels.get(cell, ("", None, "black"))
+            self.labels[cell] = (text, font or old_font, text_fill or old_fill)
+        self.dirty.add(cell)
+
+    def move_agent(self, cell, color=None):
+        self.agent = tuple(cell)
+        if color is not None:
+            self.agent_color = color
+        self.agent_moved = True
+
+    ############################################################
+    #### Draw the recorded changes that are inside the view. Changes
+    #### outside the view are already in fills/labels for later redraws.
+    ############################################################
+    def flush(self):
+        if self.redraw_pending is not None:
+            return      # the pending redraw draws everything
+        if self.dirty:
+            r0, r1, c0, c1 = self.visible_range()
+            for cell in self.dirty:
+                if r0 <= cell[0] < r1 and c0 <= cell[1] < c1:
+                    if self.raster:
+                        self.paint_pixels(cell)
+                    else:
+                        self.canvas.itemconfig(self.cell_rects[cell], fill=self.color_of(cell))
+                        self.draw_label(cell)
+            self.dirty.clear()
+        if self.agent_moved:
+            self.draw_agent()
+        self.canvas.update_idletasks()
+
+    ############################################################
+    #### Draw the whole view from scratch (after a pan, zoom or resize)
+    ############################################################
+    def redraw(self):
+        self.redraw_pending = None
+        self.dirty.clear()
+        if self.cell_size >= RASTER_BELOW:
+            self.draw_items()
+        else:
+            self.draw_raster()
+        self.draw_agent()
+
+    #### Coalesce the redraws asked for by a burst of mouse events
+    def request_redraw(self):
+        if self.redraw_pending is None:
+            self.redraw_pending = self.canvas.after_idle(self.redraw)
+
+    ############################################################
+    #### Item mode: one pooled rectangle per visible cell, and one pooled
+    #### text per visible labelled cell when cells are big enough
+    ############################################################
+    def draw_items(self):
+        if self.image_item is not None:
+            self.canvas.itemconfig(self.image_item, state="hidden")
+        self.raster = False
+
+        r0, r1, c0, c1 = self.visible_range()
+        need = (r1 - r0) * (c1 - c0)
+        while len(self.rects) < need:
+            self.rects.append(self.canvas.create_rectangle(0, 0, 0, 0))
+
+        self.cell_rects = {}
+        rects = iter(self.rects)
+        for r in range(r0, r1):
+            for c in range(c0, c1):
+                item = next(rects)
+                self.cell_rects[(r, c)] = item
+                self.canvas.coords(item, *self.cell_box(r, c))
+                self.canvas.itemconfig(item, fill=self.color_of((r, c)), state="normal")
+        for item in self.rects[need:self.rects_shown]:
+            self.canvas.itemconfig(item, state="hidden")
+        self.rects_shown = need
+
+        for item in self.cell_texts.values():
+            self.canvas.itemconfig(item, state="hidden")
+            self.texts_free.append(item)
+        self.cell_texts = {}
+        for cell in self.labels:
+            if r0 <= cell[0] < r1 and c0 <= cell[1] < c1:
+                self.draw_label(cell)
+        self.canvas.tag_raise("label")
+
+    def draw_label(self, cell):
+        if cell not in self.labels or self.cell_size < LABEL_MIN:
+            return
+        text, font, fill = self.labels[cell]
+        item = self.cell_texts.get(cell)
+        if item is None:
+            item = self.texts_free.pop() if self.texts_free else self.canvas.create_text(0, 0, tags="label")
+            self.cell_texts[cell] = item
+            x0, y0, x1, y1 = self.cell_box(*cell)
+            self.canvas.coords(item, (x0 + x1) / 2, (y0 + y1) / 2)
+            self.canvas.tag_raise(item)
+        self.canvas.itemconfig(item, text=text, font=font, fill=fill, state="normal")
+
+    ############################################################
+    #### Raster mode: the view as one PPM image. Every pixel column and
+    #### row is mapped to a cell once; map rows are turned into pixels
+    #### with bytes.translate() per colour channel, and the cells with a
+    #### fill of their own (start, goals, routes) are painted on top.
+    ############################################################
+    def draw_raster(self):
+        for item in self.rects[:self.rects_shown]:
+            self.canvas.itemconfig(item, state="hidden")
+        self.rects_shown = 0
+        self.cell_rects = {}
+        for item in self.cell_texts.values():
+            self.canvas.itemconfig(item, state="hidden")
+            self.texts_free.append(item)
+        self.cell_texts = {}
+        self.raster = True
+
+        size, cols = self.cell_size, self.cols
+        width = max(1, min(int(self.width), math.ceil((cols - self.left) * size)))
+        height = max(1, min(int(self.height), math.ceil((self.rows - self.top) * size)))
+        xs = [min(cols - 1, int(self.left + (x + 0.5) / size)) for x in range(width)]
+        pick = itemgetter(*xs) if width > 1 else lambda row: (row[xs[0]],)
+
+        red, green, blue = self.channel_tables()
+        lines = []
+        last_r, line = None, None
+        for y in range(height):
+            r = min(self.rows - 1, int(self.top + (y + 0.5) / size))
+            if r != last_r:
+                values = bytes(pick(self.cells[r * cols:(r + 1) * cols]))
+                pixels = bytearray(3 * width)
+                pixels[0::3] = values.translate(red)
+                pixels[1::3] = values.translate(green)
+                pixels[2::3] = values.translate(blue)
+                last_r, line = r, bytes(pixels)
+            lines.append(line)
+        data = bytearray(b"".join(lines))
+
+        r0, r1, c0, c1 = self.visible_range()
+        for cell, color in self.fills.items():
+            if r0 <= cell[0] < r1 and c0 <= cell[1] < c1:
+                x0, y0, x1, y1 = self.pixel_box(cell, width, height)
+                run = bytes(self.color_rgb(color)) * (x1 - x0)
+                for y in range(y0, y1):
+                    data[(y * width + x0) * 3:(y * width + x1) * 3] = run
+
+        self.image = tk.PhotoImage(master=self.canvas, width=width, height=height,
+                                   data=b"P6 %d %d 255\n" % (width, height) + bytes(data), format="PPM")
+        if self.image_item is None:
+            self.image_item = self.canvas.create_image(0, 0, anchor="nw", image=self.image)
+        else:
+            self.canvas.itemconfig(self.image_item, image=self.image, state="normal")
+        self.canvas.tag_lower(self.image_item)
+
+    #### Pixels covered by a cell in the raster, at least one pixel
+    def pixel_box(self, cell, width, height):
+        x0, y0, x1, y1 = self.cell_box(*cell)
+        x0, y0 = min(max(0, int(x0)), width - 1), min(max(0, int(y0)), height - 1)
+        x1, y1 = max(x0 + 1, min(width, int(x1))), max(y0 + 1, min(height, int(y1)))
+        return x0, y0, x1, y1
+
+    def paint_pixels(self, cell):
+        x0, y0, x1, y1 = self.pixel_box(cell, self.image.width(), self.image.height())
+        self.image.put(self.color_of(cell), to=(x0, y0, x1, y1))
+
+    def color_rgb(self, color):
+        if color not in self.rgb:
+            self.rgb[color] = tuple(value // 257 for value in self.canvas.winfo_rgb(color))
+        return self.rgb[color]
+
+    #### bytes.translate() tables from cell value to red, green and blue
+    def channel_tables(self):
+        channels = [bytearray(256), bytearray(256), bytearray(256)]
+        for value in range(256):
+            rgb = self.color_rgb(self.colors.get(value, self.default_color))
+            for channel, level in zip(channels, rgb):
+                channel[value] = level
+        return [bytes(channel) for channel in channels]
+
+    ############################################################
+    #### The agent is one rectangle, kept on top and at least a few
+    #### pixels big so it can still be seen when zoomed out
+    ############################################################
+    def draw_agent(self):
+        self.agent_moved = False
+        if self.agent is None:
+            return
+        x0, y0, x1, y1 = self.cell_box(*self.agent)
+        grow = max(0.0, (4 - self.cell_size) / 2)
+        box = (x0 - grow, y0 - grow, x1 + grow, y1 + grow)
+        if self.agent_item is None:
+            self.agent_item = self.canvas.create_rectangle(*box, fill=self.agent_color, tags="agent")
+        else:
+            self.canvas.coords(self.agent_item, *box)
+            self.canvas.itemconfig(self.agent_item, fill=self.agent_color)
+        self.canvas.tag_raise(self.agent_item)
+
+    ############################################################
+    #### Pan and zoom
+    ############################################################
+    def pan(self, dx, dy):
+        self.left -= dx / self.cell_size
+        self.top -= dy / self.cell_size
+        self.clamp()
+        self.request_redraw()
+
+    #### Zoom by factor, keeping the map point under (x, y) in place
+    def zoom(self, factor, x=None, y=None):
+        x = self.width / 2 if x is None else x
+        y = self.height / 2 if y is None else y
+        col, row = self.left + x / self.cell_size, self.top + y / self.cell_size
+        self.cell_size = min(MAX_CELL_SIZE, max(self.min_cell_size, self.cell_size * factor))
+        self.left, self.top = col - x / self.cell_size, row - y / self.cell_size
+        self.clamp()
+        self.request_redraw()
+
+    def start_drag(self, event):
+        self.drag = (event.x, event.y)
+
+    def drag_to(self, event):
+        if self.drag is not None:
+            self.pan(event.x - self.drag[0], event.y - self.drag[1])
+        self.drag = (event.x, event.y)
+
+    def wheel(self, event):
+        zoom_in = event.num == 4 or getattr(event, "delta", 0) > 0
+        self.zoom(ZOOM_STEP if zoom_in else 1 / ZOOM_STEP, event.x, event.y)
+
+    def resize(self, event):
+        if (event.width, event.height) != (self.width, self.height):
+            self.width, self.height = event.width, event.height
+            self.min_cell_size = min(self.min_cell_size, self.width / self.cols, self.height / self.rows)
+            self.clamp()
+            self.request_redraw()